@@ -0,0 +1,100 @@
+"""
+Punto de entrada ASGI para las rutas que casi solo esperan a APIs externas.
+
+    uvicorn asgi:app --workers 1 --port 5000
+
+Estas rutas se atienden con corrutinas y async_http_client:
+    POST /api/cities                       (Overpass)
+    POST /api/population/worldpop          (WorldPop)
+    POST /api/nasa-noaa/tsunami-analysis   (USGS EPQS)
+    POST /api/impact/flora-fauna           (GBIF)
+
+Mientras esperan al upstream no ocupan un hilo. Un solo proceso mantiene
+cientos de peticiones en vuelo; con WSGI el límite son los hilos del
+worker y los pools de cada ruta. Las respuestas son las mismas que las de
+las rutas Flask, que se siguen usando en wsgi.py.
+
+El resto de rutas, y también las peticiones OPTIONS de CORS, pasan a la
+aplicación Flask a través de un pool de WEB_THREADS hilos (a2wsgi).
+
+Los trabajos de informes PDF y de cribado de NEOs viven en la memoria del
+proceso que los crea. Con --workers > 1, el sondeo de un trabajo puede
+llegar a otro proceso y devolver 404, así que solo es seguro si esas rutas
+se envían a una instancia aparte con un solo proceso (ver DESPLIEGUE.md).
+"""
+
+import json
+import os
+
+from a2wsgi import WSGIMiddleware
+from app import app as flask_app
+import async_http_client
+from blueprints import biology, physics, population
+
+
+WSGI_THREADS = int(os.environ.get('WEB_THREADS', 8))
+
+ASYNC_ROUTES = {
+    '/api/cities': population.get_cities_async,
+    '/api/population/worldpop': population.get_worldpop_population_async,
+    '/api/nasa-noaa/tsunami-analysis': physics.get_nasa_noaa_tsunami_analysis_async,
+    '/api/impact/flora-fauna': biology.analyze_impact_flora_fauna_async
+}
+
+_wsgi_app = WSGIMiddleware(flask_app, workers=WSGI_THREADS)
+
+
+async def _read_json(receive):
+    """Cuerpo JSON de la petición; None si está vacío o no es JSON válido"""
+    body = b''
+    while True:
+        message = await receive()
+        body += message.get('body', b'')
+        if not message.get('more_body'):
+            break
+    try:
+        return json.loads(body)
+    except ValueError:
+        return None
+
+
+async def _send_json(send, payload, status):
+    # Misma serialización que jsonify y la cabecera que añade flask_cors
+    body = flask_app.json.response(payload).get_data()
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(body)).encode()),
+            (b'access-control-allow-origin', b'*')
+        ]
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def _lifespan(receive, send):
+    """Arranque y parada del worker: al parar se cierra el pool de conexiones"""
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await async_http_client.close()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        await _lifespan(receive, send)
+        return
+
+    if scope['type'] == 'http' and scope['method'] == 'POST':
+        handler = ASYNC_ROUTES.get(scope['path'])
+        if handler is not None:
+            payload, status = await handler(await _read_json(receive))
+            await _send_json(send, payload, status)
+            return
+
+    await _wsgi_app(scope, receive, send)
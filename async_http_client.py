@@ -0,0 +1,170 @@
+"""
+Cliente HTTP asíncrono para la ruta ASGI (asgi.py), equivalente a http_client.
+
+- Una única aiohttp.ClientSession por bucle de eventos (una por worker), con
+  un pool de conexiones keep-alive compartido por todas las peticiones en
+  curso.
+- Concurrencia acotada por host con un semáforo asyncio. El límite es
+  mucho mayor que el de http_client, porque una petición en espera no
+  ocupa un hilo.
+- Mismos reintentos con backoff y jitter, y el mismo circuit breaker por
+  host que http_client. Los fallos de una ruta abren el circuito para la
+  otra y /api/upstreams/status muestra ambas.
+
+Las respuestas se leen completas y se devuelven con la interfaz de
+requests.Response que usan las rutas (status_code, ok, headers, json()).
+Los errores de red se convierten en las excepciones de requests, así que los
+bloques except de las rutas síncronas sirven igual.
+
+Se usa aiohttp y no httpx porque el pool de httpcore recorre todas las
+peticiones en espera por cada conexión. Con cientos de peticiones en vuelo
+su coste de CPU limita el rendimiento por debajo del de la ruta con hilos.
+
+Configuración por variables de entorno:
+    ASYNC_MAX_CONNECTIONS         Conexiones totales del pool (512)
+    ASYNC_MAX_CONCURRENT_PER_HOST Peticiones simultáneas por host (256)
+"""
+
+import asyncio
+import json
+import os
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from lazy_imports import lazy_import
+import http_client
+
+aiohttp = lazy_import('aiohttp')
+
+
+MAX_CONNECTIONS = int(os.environ.get('ASYNC_MAX_CONNECTIONS', 512))
+MAX_CONCURRENT_PER_HOST = int(os.environ.get('ASYNC_MAX_CONCURRENT_PER_HOST', 256))
+
+_session = None
+_session_loop = None
+_semaphores = {}
+
+
+class Response:
+    """Respuesta ya leída con la parte de requests.Response que usan las rutas"""
+
+    def __init__(self, status_code, headers, content, url):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.exceptions.HTTPError(f'{self.status_code} para {self.url}', response=self)
+
+
+def _get_session():
+    """Sesión del bucle actual; se recrea si el bucle cambió (p. ej. asyncio.run en scripts)"""
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=MAX_CONNECTIONS, limit_per_host=0),
+            headers={'User-Agent': http_client.USER_AGENT}
+        )
+        _session_loop = loop
+        # Los semáforos quedan ligados al bucle en el que se usan
+        _semaphores.clear()
+    return _session
+
+
+def _get_semaphore(netloc):
+    semaphore = _semaphores.get(netloc)
+    if semaphore is None:
+        semaphore = _semaphores[netloc] = asyncio.Semaphore(MAX_CONCURRENT_PER_HOST)
+    return semaphore
+
+
+async def close():
+    """Cierra el pool de conexiones (al apagar el servidor ASGI)"""
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = _session_loop = None
+    _semaphores.clear()
+
+
+async def _send(session, method, url, timeout, params=None, **kwargs):
+    if isinstance(params, dict):
+        # requests omite los parámetros None; aiohttp los rechaza
+        params = {key: value for key, value in params.items() if value is not None}
+    client_timeout = aiohttp.ClientTimeout(sock_connect=min(http_client.CONNECT_TIMEOUT_S, timeout), sock_read=timeout)
+    async with session.request(method, url, params=params, timeout=client_timeout, **kwargs) as response:
+        content = await response.read()
+        return Response(response.status, CaseInsensitiveDict(response.headers), content, str(response.url))
+
+
+async def request(method, url, timeout=10, max_retries=http_client.MAX_RETRIES, **kwargs):
+    """
+    Envía una petición con reintentos y circuit breaker, como http_client.request.
+
+    Devuelve la última respuesta (aunque sea 5xx tras agotar los reintentos)
+    o lanza la última excepción de red como excepción de requests. Los
+    timeouts de lectura no se reintentan.
+    """
+    netloc, host = http_client._get_host(url)
+    if not host.breaker.allow():
+        raise http_client.CircuitOpenError(f'Circuito abierto para {netloc}: demasiados fallos recientes')
+
+    session = _get_session()
+    semaphore = _get_semaphore(netloc)
+    try:
+        await asyncio.wait_for(semaphore.acquire(), timeout)
+    except asyncio.TimeoutError:
+        raise http_client.HostBusyError(f'Demasiadas peticiones simultáneas a {netloc}') from None
+
+    try:
+        attempt = 0
+        while True:
+            host.requests += 1
+            response = None
+            try:
+                response = await _send(session, method, url, timeout, **kwargs)
+            except aiohttp.SocketTimeoutError as e:
+                host.breaker.record_failure()
+                raise requests.exceptions.ReadTimeout(str(e)) from e
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt >= max_retries:
+                    host.breaker.record_failure()
+                    raise requests.exceptions.ConnectionError(str(e)) from e
+            else:
+                if response.status_code not in http_client.RETRY_STATUS:
+                    host.breaker.record_success()
+                    return response
+                if attempt >= max_retries:
+                    host.breaker.record_failure()
+                    return response
+
+            await asyncio.sleep(http_client._backoff_delay(attempt, response))
+            attempt += 1
+            host.retries += 1
+    finally:
+        semaphore.release()
+
+
+async def get(url, params=None, timeout=10, **kwargs):
+    """Equivalente asíncrono de http_client.get"""
+    return await request('GET', url, params=params, timeout=timeout, **kwargs)
+
+
+async def post(url, data=None, json=None, timeout=10, **kwargs):
+    """Equivalente asíncrono de http_client.post"""
+    return await request('POST', url, data=data, json=json, timeout=timeout, **kwargs)
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Perfil de concurrencia: hilos, procesos y corrutinas.
+
+Arranca la aplicación con distintos servidores y mide rendimiento y latencia
+con N clientes simultáneos:
+
+    dev               Servidor de desarrollo de Werkzeug tal como lo arrancaba
+                      app.py (app.run(debug=True): depurador y un hilo por petición)
+    threads           Werkzeug con un hilo por petición, sin depurador
+    processes         Werkzeug con un proceso por petición (fork, sin hilos)
+    gunicorn-sync     gunicorn, WEB_CONCURRENCY procesos de un hilo
+    gunicorn-gthread  gunicorn, WEB_CONCURRENCY procesos × WEB_THREADS hilos
+    uvicorn           asgi:app con uvicorn, WEB_CONCURRENCY procesos; las
+                      rutas de asgi.ASYNC_ROUTES con corrutinas
+
+Los perfiles de gunicorn y uvicorn se omiten si no están instalados.
+
+Las APIs externas se sustituyen por un upstream falso local que responde un
+fixture fijo tras una latencia configurable. Así las rutas bloquean en E/S
+como en producción, pero sin red. Escenarios:
+
+    io   POST /api/simulate/impact con coordenadas distintas en cada
+         petición para no acertar en la caché. Hace 2-3 consultas USGS.
+    cpu  POST /api/nasa/close-approaches. Propagación orbital con NumPy,
+         sin E/S.
+
+Escenarios de las rutas que asgi.py atiende con corrutinas (Flask en los
+perfiles WSGI), también con coordenadas distintas en cada petición:
+
+    cities   POST /api/cities: una consulta a Overpass
+    worldpop POST /api/population/worldpop: tres consultas a WorldPop
+    tsunami  POST /api/nasa-noaa/tsunami-analysis: 20 puntos de USGS EPQS
+    flora    POST /api/impact/flora-fauna: facetas y ocurrencias GBIF de dos reinos
+
+Uso: python benchmark_concurrency.py [--latency-ms 200] [--concurrency 8,32]
+         [--requests 200] [--profiles dev,threads,processes] [--scenarios io,cpu]
+
+Comparación WSGI/ASGI con un solo proceso:
+    python benchmark_concurrency.py --profiles gunicorn-gthread,uvicorn --workers 1 \
+        --scenarios cities,tsunami --concurrency 8,64,256
+"""
+
+import argparse
+import asyncio
+import contextlib
+import importlib.util
+import io
+import json
+import logging
+import multiprocessing
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+
+UPSTREAM_FIXTURE = {
+    # USGS EPQS y Open-Elevation
+    'value': 650.0,
+    'results': [{'elevation': 650.0}],
+    # USGS Earthquake Catalog
+    'type': 'FeatureCollection',
+    'features': [{
+        'properties': {'mag': 4.8, 'place': 'Fixture', 'time': 1600000000000, 'type': 'earthquake'},
+        'geometry': {'coordinates': [-3.7, 40.4, 10.0]}
+    }],
+    'metadata': {'count': 1},
+    # Overpass
+    'elements': []
+}
+
+SCENARIOS = {
+    'io': '/api/simulate/impact',
+    'cpu': '/api/nasa/close-approaches',
+    'cities': '/api/cities',
+    'worldpop': '/api/population/worldpop',
+    'tsunami': '/api/nasa-noaa/tsunami-analysis',
+    'flora': '/api/impact/flora-fauna'
+}
+PROFILES = ('dev', 'threads', 'processes', 'gunicorn-sync', 'gunicorn-gthread', 'uvicorn')
+OPTIONAL_SERVERS = {'gunicorn-sync': 'gunicorn', 'gunicorn-gthread': 'gunicorn', 'uvicorn': 'uvicorn'}
+WERKZEUG_MAX_PROCESSES = 64
+
+
+async def _serve_upstream(sock, latency_s, body):
+    """Bucle del upstream falso: HTTP/1.1 mínimo con keep-alive"""
+    response = (b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+                b'Content-Length: ' + str(len(body)).encode() + b'\r\n\r\n' + body)
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                length = 0
+                for line in head.split(b'\r\n')[1:]:
+                    name, _, value = line.partition(b':')
+                    if name.strip().lower() == b'content-length':
+                        length = int(value)
+                if length:
+                    await reader.readexactly(length)
+                await asyncio.sleep(latency_s)
+                writer.write(response)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, sock=sock, backlog=2048)
+    await server.serve_forever()
+
+
+def _run_upstream(sock, latency_s, body):
+    asyncio.run(_serve_upstream(sock, latency_s, body))
+
+
+class FakeUpstream:
+    """
+    Servidor HTTP local que responde UPSTREAM_FIXTURE tras latency_s.
+
+    Es asyncio y corre en su propio proceso: como una API real, atiende
+    cientos de conexiones a la vez sin quitar CPU al generador de carga.
+    """
+
+    def __init__(self, latency_s=0.2, fixture=None):
+        body = json.dumps(fixture or UPSTREAM_FIXTURE).encode()
+        self._sock = socket.socket()
+        self._sock.bind(('127.0.0.1', 0))
+        self.url = f'http://127.0.0.1:{self._sock.getsockname()[1]}'
+        self._process = multiprocessing.Process(target=_run_upstream, args=(self._sock, latency_s, body), daemon=True)
+
+    def __enter__(self):
+        self._process.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._process.terminate()
+        self._process.join()
+        self._sock.close()
+
+
+def _upstream_url(upstream_url, url):
+    parts = urlsplit(url)
+    return f'{upstream_url}/{parts.netloc}{parts.path}'
+
+
+def redirect_upstreams(upstream_url):
+    """Envía todas las peticiones de http_client y async_http_client al upstream falso"""
+    import async_http_client
+    import http_client
+
+    # Todas las APIs comparten el mismo host falso; sin esto el límite por
+    # host de cada cliente fijaría la concurrencia y no el servidor
+    http_client.MAX_CONCURRENT_PER_HOST = 1024
+    http_client.POOL_MAXSIZE = 1024
+    async_http_client.MAX_CONCURRENT_PER_HOST = 4096
+    original = http_client.request
+    original_async = async_http_client.request
+
+    def request(method, url, *args, **kwargs):
+        return original(method, _upstream_url(upstream_url, url), *args, **kwargs)
+
+    async def request_async(method, url, *args, **kwargs):
+        return await original_async(method, _upstream_url(upstream_url, url), *args, **kwargs)
+
+    http_client.request = request
+    http_client.get = lambda url, params=None, timeout=10, **kw: request('GET', url, params=params, timeout=timeout, **kw)
+    http_client.post = lambda url, data=None, json=None, timeout=10, **kw: request('POST', url, data=data, json=json, timeout=timeout, **kw)
+    async_http_client.request = request_async
+    async_http_client.get = lambda url, params=None, timeout=10, **kw: request_async('GET', url, params=params, timeout=timeout, **kw)
+    async_http_client.post = lambda url, data=None, json=None, timeout=10, **kw: request_async('POST', url, data=data, json=json, timeout=timeout, **kw)
+
+
+def bench_app():
+    """Fábrica para gunicorn: la aplicación con las APIs externas falsas"""
+    redirect_upstreams(os.environ['BENCH_UPSTREAM'])
+    from app import create_app
+    return create_app()
+
+
+def bench_asgi():
+    """Fábrica para uvicorn (--factory): asgi.app con las APIs externas falsas"""
+    redirect_upstreams(os.environ['BENCH_UPSTREAM'])
+    import asgi
+    return asgi.app
+
+
+def serve(profile, port):
+    """Arranca la aplicación con el servidor de `profile` (proceso hijo)"""
+    from werkzeug.serving import run_simple
+
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    application = bench_app()
+    options = {
+        'dev': {'threaded': True, 'use_debugger': True},
+        'threads': {'threaded': True},
+        'processes': {'threaded': False, 'processes': WERKZEUG_MAX_PROCESSES}
+    }[profile]
+    run_simple('127.0.0.1', port, application, **options)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(profile, upstream_url, workers, threads):
+    """Proceso del servidor y URL base, cuando ya acepta peticiones"""
+    port = _free_port()
+    env = dict(os.environ, BENCH_UPSTREAM=upstream_url)
+    if profile.startswith('gunicorn'):
+        env.update(WEB_CONCURRENCY=str(workers), PORT=str(port),
+                   WEB_THREADS=str(threads if profile == 'gunicorn-gthread' else 1))
+        command = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--access-logfile', '/dev/null',
+                   '--bind', f'127.0.0.1:{port}', 'benchmark_concurrency:bench_app()']
+    elif profile == 'uvicorn':
+        # WEB_THREADS: hilos de a2wsgi para las rutas que siguen en Flask
+        env.update(WEB_THREADS=str(threads))
+        command = [sys.executable, '-m', 'uvicorn', '--factory', 'benchmark_concurrency:bench_asgi',
+                   '--host', '127.0.0.1', '--port', str(port), '--workers', str(workers),
+                   '--log-level', 'warning', '--no-access-log']
+    else:
+        command = [sys.executable, __file__, '--serve', profile, '--port', str(port)]
+    process = subprocess.Popen(command, env=env, cwd=os.path.dirname(os.path.abspath(__file__)),
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    base_url = f'http://127.0.0.1:{port}'
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return process, base_url
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError(f'El servidor {profile} terminó al arrancar')
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError(f'El servidor {profile} no arrancó en 60 s')
+
+
+def _payload(scenario, index):
+    rng = random.Random(index)
+    latitude, longitude = round(rng.uniform(-60, 60), 4), round(rng.uniform(-180, 180), 4)
+    if scenario == 'io':
+        return {
+            'diameter': 100, 'velocity': 20, 'density': 3000, 'angle': 45,
+            'latitude': latitude, 'longitude': longitude
+        }
+    if scenario == 'cities':
+        return {'latitude': latitude, 'longitude': longitude, 'radius': 25000, 'source': 'overpass'}
+    if scenario == 'worldpop':
+        return {'latitude': latitude, 'longitude': longitude}
+    if scenario == 'tsunami':
+        return {'latitude': latitude, 'longitude': longitude, 'energy_megatons': 50, 'radius_km': 100}
+    if scenario == 'flora':
+        return {'latitude': latitude, 'longitude': longitude, 'impact_radius_km': 10, 'impact_energy_megatons': 5}
+    return {
+        'semi_major_axis': 0.9224, 'eccentricity': 0.1914, 'inclination': 3.34,
+        'longitude_ascending_node': 203.96, 'argument_perihelion': 126.6, 'mean_anomaly': 180.37,
+        'epoch_jd': 2459200.5, 'start_date': '2025-01-01', 'years': 2
+    }
+
+
+async def _run_clients(url, scenario, concurrency, total, offset):
+    """`concurrency` clientes asyncio sobre un pool de conexiones keep-alive"""
+    import aiohttp
+
+    indices = iter(range(total))
+    results = []
+
+    async def client(session):
+        for index in indices:
+            start = time.perf_counter()
+            try:
+                async with session.post(url, json=_payload(scenario, offset + index)) as response:
+                    body = await response.json(content_type=None)
+                    ok = response.status == 200 and body.get('success', True) is not False
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                ok = False
+            results.append(((time.perf_counter() - start) * 1000, ok))
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=120)) as session:
+        await asyncio.gather(*(client(session) for _ in range(concurrency)))
+    return results
+
+
+def run_load(base_url, scenario, concurrency, total, offset=0):
+    """
+    total peticiones con `concurrency` clientes; métricas de latencia y rendimiento.
+    Los clientes son corrutinas: cientos de ellos no compiten por la CPU con
+    el servidor como lo harían cientos de hilos.
+    """
+    started = time.perf_counter()
+    results = asyncio.run(_run_clients(base_url + SCENARIOS[scenario], scenario, concurrency, total, offset))
+    elapsed = time.perf_counter() - started
+    latencies = sorted(latency for latency, ok in results if ok)
+    errors = sum(1 for _, ok in results if not ok)
+    return {
+        'requests_per_s': round((total - errors) / elapsed, 1),
+        'p50_ms': round(statistics.median(latencies), 1) if latencies else None,
+        'p95_ms': round(latencies[int(0.95 * (len(latencies) - 1))], 1) if latencies else None,
+        'errors': errors
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--latency-ms', type=float, default=200)
+    parser.add_argument('--concurrency', default='8,32')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--profiles', default=','.join(PROFILES))
+    parser.add_argument('--scenarios', default='io,cpu')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() * 2 + 1)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--json', action='store_true', help='Resultados en JSON')
+    parser.add_argument('--serve', choices=('dev', 'threads', 'processes'), help=argparse.SUPPRESS)
+    parser.add_argument('--port', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.port)
+        return
+
+    profiles = [p for p in args.profiles.split(',')
+                if p not in OPTIONAL_SERVERS or importlib.util.find_spec(OPTIONAL_SERVERS[p]) is not None]
+    skipped = [p for p in args.profiles.split(',') if p not in profiles]
+    levels = [int(level) for level in args.concurrency.split(',')]
+    scenarios = args.scenarios.split(',')
+    rows = []
+
+    with FakeUpstream(args.latency_ms / 1000) as upstream:
+        for profile in profiles:
+            process, base_url = start_server(profile, upstream.url, args.workers, args.threads)
+            try:
+                for scenario in scenarios:
+                    # Calentamiento: importaciones diferidas y pools de conexiones
+                    run_load(base_url, scenario, 2, 4, offset=10 ** 6)
+                    for level in levels:
+                        result = run_load(base_url, scenario, level, args.requests, offset=len(rows) * args.requests)
+                        rows.append(dict(profile=profile, scenario=scenario, concurrency=level, **result))
+                        if not args.json:
+                            print(f"   {profile:17s} {scenario:8s} c={level:<4d} {result['requests_per_s']:8.1f} req/s  "
+                                  f"p50 {result['p50_ms']} ms  p95 {result['p95_ms']} ms  errores {result['errors']}")
+            finally:
+                process.terminate()
+                process.wait(timeout=10)
+
+    if args.json:
+        print(json.dumps({'cpu_count': os.cpu_count(), 'latency_ms': args.latency_ms, 'skipped': skipped,
+                          'results': rows}, indent=2))
+    elif skipped:
+        print(f"INFO: Perfiles omitidos (servidor no instalado): {', '.join(skipped)}")
+
+
+if __name__ == '__main__':
+    with contextlib.suppress(KeyboardInterrupt):
+        main()
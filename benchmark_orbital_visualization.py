@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark de /api/nasa/orbital-visualization con asteroid_id.
+
+Antes, la visualización pedía los elementos orbitales a
+http://localhost:5000/api/nasa/sbdb/<id> por HTTP desde dentro del propio
+servidor. Ahora usa get_sbdb_asteroid() en proceso. Este script mide:
+
+1. La latencia de la visualización tal como está ahora (en proceso).
+2. El coste de la vuelta por loopback que se eliminó: una petición HTTP real
+   a /api/nasa/sbdb/<id> contra un servidor local en un puerto libre.
+
+La respuesta de la SBDB se simula con un fixture fijo, así que no se
+necesita red ni la API de la NASA y solo se mide el código del servidor.
+
+Uso: python benchmark_orbital_visualization.py [iteraciones]
+"""
+
+import contextlib
+import io
+import logging
+import statistics
+import sys
+import threading
+import time
+
+import requests
+from werkzeug.serving import make_server
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import app as simulator
+import http_client
+
+
+ASTEROID_ID = '99942'
+SBDB_FIXTURE = {
+    'code': 200,
+    'object': {
+        'full_name': '99942 Apophis (2004 MN4)',
+        'des': '99942',
+        'class': 'ATE',
+        'orbit': {
+            'a': {'value': 0.9224}, 'e': {'value': 0.1912}, 'i': {'value': 3.339},
+            'om': {'value': 203.96}, 'w': {'value': 126.6}, 'ma': {'value': 142.8},
+            'q': {'value': 0.746}, 'ad': {'value': 1.099}, 'per': {'value': 323.6}
+        },
+        'phys_par': {'diameter': {'value': 0.34}},
+        'H': {'value': 19.7}
+    }
+}
+
+
+class _FixtureResponse:
+    status_code = 200
+    headers = {}
+
+    def json(self):
+        return SBDB_FIXTURE
+
+    def raise_for_status(self):
+        pass
+
+
+def _fake_get(url, params=None, timeout=10, **kwargs):
+    return _FixtureResponse()
+
+
+def _percentiles(samples_ms):
+    samples_ms = sorted(samples_ms)
+    return {
+        'median_ms': statistics.median(samples_ms),
+        'p95_ms': samples_ms[int(0.95 * (len(samples_ms) - 1))]
+    }
+
+
+def bench_visualization(iterations):
+    """Latencia del endpoint de visualización (SBDB en proceso)"""
+    client = simulator.app.test_client()
+    payload = {'asteroid_id': ASTEROID_ID, 'num_points': 100}
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = client.post('/api/nasa/orbital-visualization', json=payload)
+        samples.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, response.get_json()
+    return _percentiles(samples)
+
+
+def bench_loopback(iterations):
+    """Coste de la antigua llamada HTTP a /api/nasa/sbdb sobre loopback"""
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    server = make_server('127.0.0.1', 0, simulator.app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f'http://127.0.0.1:{server.server_port}/api/nasa/sbdb/{ASTEROID_ID}'
+    samples = []
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            response = requests.get(url, timeout=10)
+            samples.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200
+    finally:
+        server.shutdown()
+    return _percentiles(samples)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    http_client.get = _fake_get
+    simulator.GEO_CACHE.clear()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        visualization = bench_visualization(iterations)
+        loopback = bench_loopback(iterations)
+
+    print(f"📊 Benchmark visualización orbital ({iterations} iteraciones)")
+    print(f"   Visualización (SBDB en proceso): mediana {visualization['median_ms']:.2f} ms, "
+          f"p95 {visualization['p95_ms']:.2f} ms")
+    print(f"   Vuelta loopback eliminada:       mediana {loopback['median_ms']:.2f} ms, "
+          f"p95 {loopback['p95_ms']:.2f} ms")
+    print(f"   Latencia anterior estimada:      mediana "
+          f"{visualization['median_ms'] + loopback['median_ms']:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,281 @@
+"""
+Configuración común de la suite de rendimiento (pytest-benchmark).
+
+Las APIs externas no se contactan: http_client.request se sustituye por una
+reproducción de respuestas grabadas en benchmarks/fixtures/. Cada URL se
+asigna a un fichero con fixture_name(); una petición sin fichero hace
+fallar la prueba, para que ninguna medición se haga sobre el camino de
+error de una ruta.
+
+Los ficheros incluidos tienen el formato de respuesta de cada API
+(EPQS, FDSN, Overpass, GBIF) con datos aproximados de Los Ángeles. Con
+BENCH_RECORD=1 las peticiones sí salen a la red y sus respuestas se
+guardan en fixtures/, sustituyendo a las existentes:
+
+    BENCH_RECORD=1 python -m pytest benchmarks --benchmark-disable
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+RECORD = os.environ.get('BENCH_RECORD') == '1'
+
+# Entorno aislado: sin nomenclátor, teselas ni caché de disco del usuario,
+# para que las mediciones no dependan de lo que haya en data/
+_DATA_DIR = tempfile.mkdtemp(prefix='bench-data-')
+os.environ['GAZETTEER_PATH'] = os.path.join(_DATA_DIR, 'sin_nomenclator.csv')
+os.environ['DEM_TILES_DIR'] = _DATA_DIR
+os.environ['POPULATION_TILES_DIR'] = _DATA_DIR
+os.environ['NEO_CATALOG_DB'] = os.path.join(_DATA_DIR, 'neo_catalog.sqlite3')
+os.environ['GEO_CACHE_BACKEND'] = 'memory'
+
+sys.path.insert(0, ROOT_DIR)
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import app as simulator
+import http_client
+from services import GEO_CACHE
+
+
+# Punto de impacto de todas las pruebas: costa de Los Ángeles, dentro de la
+# cobertura de USGS EPQS (fuera de EE. UU. se cae a Open-Elevation)
+IMPACT_LAT = 34.0522
+IMPACT_LON = -118.2437
+
+IMPACT_REQUEST = {
+    'diameter': 150,
+    'velocity': 19000,
+    'angle': 45,
+    'latitude': IMPACT_LAT,
+    'longitude': IMPACT_LON,
+    'composition': 'rocky'
+}
+
+# Elementos orbitales de 99942 Apophis
+ORBITAL_ELEMENTS = {
+    'semi_major_axis_au': 0.9224,
+    'eccentricity': 0.1912,
+    'inclination_deg': 3.339,
+    'longitude_ascending_node_deg': 203.96,
+    'argument_perihelion_deg': 126.6
+}
+
+
+def fixture_name(url, params):
+    """Fichero (sin .json) con la respuesta grabada para una URL, o None"""
+    parts = urlsplit(url)
+    params = params or {}
+    if parts.netloc == 'epqs.nationalmap.gov':
+        return 'usgs_epqs'
+    if parts.netloc == 'earthquake.usgs.gov':
+        return 'usgs_earthquakes'
+    if parts.netloc == 'overpass-api.de':
+        return 'overpass_interpreter'
+    if parts.netloc == 'api.gbif.org':
+        if parts.path == '/v1/occurrence/search':
+            # Todas las páginas de un reino reproducen la misma respuesta
+            kind = 'facets' if 'facet' in params else 'occurrences'
+            return f"gbif_{kind}_{params['kingdom'].lower()}"
+        if parts.path.startswith('/v1/species/'):
+            return f"gbif_species_{parts.path.rsplit('/', 1)[1]}"
+    return None
+
+
+def _fixture_path(name):
+    return os.path.join(FIXTURES_DIR, f'{name}.json')
+
+
+def _replay_response(url, name):
+    with open(_fixture_path(name), 'rb') as f:
+        content = f.read()
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers['Content-Type'] = 'application/json'
+    response._content = content
+    return response
+
+
+class ReplayHTTP:
+    """Sustituto de http_client.request que sirve las respuestas grabadas"""
+
+    def __init__(self, real_request):
+        self.real_request = real_request
+        self.missing = []
+
+    def __call__(self, method, url, timeout=10, **kwargs):
+        name = fixture_name(url, kwargs.get('params'))
+        if RECORD:
+            response = self.real_request(method, url, timeout=timeout, **kwargs)
+            if name is not None and response.ok:
+                with open(_fixture_path(name), 'w', encoding='utf-8') as f:
+                    json.dump(response.json(), f, ensure_ascii=False, indent=1)
+                    f.write('\n')
+            return response
+
+        if name is None or not os.path.exists(_fixture_path(name)):
+            self.missing.append(url if name is None else f'{url} ({name}.json)')
+            raise requests.exceptions.ConnectionError(f'Sin respuesta grabada para {url}')
+        return _replay_response(url, name)
+
+
+@pytest.fixture(scope='session')
+def replay_http():
+    replay = ReplayHTTP(http_client.request)
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(http_client, 'request', replay)
+        yield replay
+
+
+@pytest.fixture(autouse=True)
+def _offline(replay_http):
+    """
+    Cada prueba empieza con la caché de APIs vacía. Los print de las rutas
+    se siguen formateando, pero van a /dev/null en lugar de a la consola.
+    """
+    GEO_CACHE.clear()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+    missing, replay_http.missing[:] = list(replay_http.missing), []
+    assert not missing, f'Peticiones sin respuesta grabada: {missing}'
+
+
+@pytest.fixture(scope='session')
+def client():
+    return simulator.app.test_client()
+
+
+def post_json(client, path, payload):
+    response = client.post(path, json=payload)
+    body = response.get_json()
+    assert response.status_code == 200 and body.get('success'), f'{path}: {body}'
+    return body
+
+
+@pytest.fixture(scope='session')
+def impact_request():
+    return dict(IMPACT_REQUEST)
+
+
+@pytest.fixture(scope='session')
+def orbital_elements():
+    return dict(ORBITAL_ELEMENTS)
+
+
+@pytest.fixture(scope='session')
+def usgs_context(replay_http):
+    """Contexto geográfico del punto de impacto a partir de las respuestas grabadas"""
+    from blueprints.physics import get_usgs_geographic_context
+    with contextlib.redirect_stdout(io.StringIO()):
+        context = get_usgs_geographic_context(IMPACT_LAT, IMPACT_LON)
+    assert context['sources']['elevation']['status'] == 'ok'
+    assert context['sources']['seismic_history']['status'] == 'ok'
+    return context
+
+
+@pytest.fixture(scope='session')
+def impact_result(client, replay_http):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return post_json(client, '/api/simulate/impact', IMPACT_REQUEST)
+
+
+@pytest.fixture(scope='session')
+def cities(client, impact_result):
+    """Lugares de Overpass alrededor del impacto, con distancia y población"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        body = post_json(client, '/api/cities', {
+            'latitude': IMPACT_LAT, 'longitude': IMPACT_LON, 'radius': 25000, 'source': 'overpass'
+        })
+    assert body['cities']
+    return body['cities']
+
+
+@pytest.fixture(scope='session')
+def casualties_request(impact_result, cities):
+    calculations = impact_result['calculations']
+    return {
+        'cities': cities,
+        'destruction_radius_km': calculations['destruction_radius_km'],
+        'damage_radius_km': calculations['damage_radius_km'],
+        'air_pressure_radius_km': calculations['damage_radius_km'] * 1.5,
+        'energy_megatons': calculations['energy_megatons_tnt']
+    }
+
+
+@pytest.fixture(scope='session')
+def report_payload(client, impact_result, casualties_request):
+    """
+    Cuerpo de /api/generate-scientific-report como lo arma
+    static/js/pdf-generator.js, con los resultados de las rutas del simulador.
+    """
+    calculations = impact_result['calculations']
+    with contextlib.redirect_stdout(io.StringIO()):
+        casualties = post_json(client, '/api/population/casualties', casualties_request)
+        flora_fauna = post_json(client, '/api/impact/flora-fauna', {
+            'latitude': IMPACT_LAT,
+            'longitude': IMPACT_LON,
+            'impact_radius_km': calculations['damage_radius_km'],
+            'destruction_radius_km': calculations['destruction_radius_km'],
+            'impact_energy_megatons': calculations['energy_megatons_tnt']
+        })
+        deflection = post_json(client, '/api/simulate/deflection', {
+            'asteroid_diameter': IMPACT_REQUEST['diameter'],
+            'asteroid_velocity': IMPACT_REQUEST['velocity'],
+            'time_before_impact': 3650,
+            'composition': IMPACT_REQUEST['composition']
+        })
+    assert flora_fauna['flora_species'] and flora_fauna['fauna_species']
+
+    strategies = [{
+        'method': strategy['name'],
+        'description': strategy['best_for'],
+        'effectiveness': strategy['effectiveness'],
+        'success_probability': strategy['success_rate'],
+        'cost_billions': strategy['cost_billions'],
+        'time_required_years': strategy['time_required_years']
+    } for strategy in deflection['all_strategies']]
+    perihelion_au = ORBITAL_ELEMENTS['semi_major_axis_au'] * (1 - ORBITAL_ELEMENTS['eccentricity'])
+
+    return {
+        'impact_data': {
+            key: impact_result[key]
+            for key in ('input', 'calculations', 'composition_data', 'usgs_context', 'secondary_effects', 'severity')
+        },
+        'population_data': {
+            'total_population_affected': casualties['totals']['total_population'],
+            'casualties': {
+                zone: {
+                    'population': breakdown['total_population'],
+                    'deaths': breakdown['deaths'],
+                    'severe_injuries': breakdown['injured'],
+                    'minor_injuries': 0
+                }
+                for zone, breakdown in casualties['breakdown'].items()
+            }
+        },
+        'trajectory_data': {
+            'orbital_elements': dict(
+                ORBITAL_ELEMENTS,
+                semi_major_axis_km=ORBITAL_ELEMENTS['semi_major_axis_au'] * 149597870.7,
+                orbital_period_days=365.25 * ORBITAL_ELEMENTS['semi_major_axis_au'] ** 1.5
+            ),
+            'minimum_earth_distance_km': perihelion_au * 149597870.7,
+            'relative_velocity_kms': IMPACT_REQUEST['velocity'] / 1000,
+            'approach_angle_deg': IMPACT_REQUEST['angle']
+        },
+        'flora_fauna_data': flora_fauna,
+        'mitigation_data': {
+            'primary_strategy': strategies[0],
+            'alternative_strategies': strategies[1:]
+        }
+    }
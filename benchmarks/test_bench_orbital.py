@@ -0,0 +1,64 @@
+"""
+Trayectorias orbitales (/api/nasa/orbital-visualization y el informe PDF) y
+cribado de NEOs (/api/neo/screening).
+"""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import neo_screening
+from blueprints.orbital import generate_orbital_trajectory, generate_orbital_trajectory_arrays
+from services import SCREENING_MAX_YEARS
+
+
+J2000_JD = 2451545.0
+
+
+@pytest.mark.benchmark(group='orbital-trajectory')
+@pytest.mark.parametrize('num_points', [100, 1000, 10000])
+def test_generate_orbital_trajectory(benchmark, orbital_elements, num_points):
+    trajectory = benchmark(generate_orbital_trajectory, orbital_elements, num_points)
+    assert len(trajectory) == num_points
+
+
+@pytest.mark.benchmark(group='orbital-trajectory')
+def test_generate_orbital_trajectory_arrays(benchmark, orbital_elements):
+    points = benchmark(generate_orbital_trajectory_arrays, orbital_elements, 1_000_000)
+    assert points['x'].shape == (1_000_000,)
+
+
+@pytest.fixture(scope='module')
+def screening_chunk():
+    """Un bloque de CHUNK_SIZE órbitas parecidas a la terrestre: todas pasan al barrido temporal"""
+    rng = np.random.default_rng(42)
+    n = neo_screening.CHUNK_SIZE
+    return {
+        'a': rng.uniform(0.9, 1.2, n),
+        'e': rng.uniform(0.0, 0.2, n),
+        'i': rng.uniform(0.0, 5.0, n),
+        'om': rng.uniform(0.0, 360.0, n),
+        'w': rng.uniform(0.0, 360.0, n),
+        'ma': rng.uniform(0.0, 360.0, n),
+        'epoch': np.full(n, J2000_JD),
+        'index': np.arange(n)
+    }
+
+
+@pytest.mark.benchmark(group='neo-screening')
+def test_screen_chunk_max_window(benchmark, screening_chunk):
+    """Bloque completo con la ventana máxima de /api/neo/screening; la memoria no escala con n·T"""
+    jd_end = J2000_JD + SCREENING_MAX_YEARS * 365.25
+
+    def screen():
+        tracemalloc.start()
+        try:
+            result = neo_screening.screen_chunk(screening_chunk, J2000_JD, jd_end)
+            return result, tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    result, peak_bytes = benchmark.pedantic(screen, rounds=1)
+    assert np.all(np.isfinite(result['distance_au']))
+    assert peak_bytes < 400 * 2 ** 20, f'{peak_bytes / 2 ** 20:.0f} MB'
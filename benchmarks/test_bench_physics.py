@@ -0,0 +1,159 @@
+"""
+Física del impacto: métodos de AsteroidSimulator, efectos secundarios,
+estrategias de mitigación y el núcleo de /api/simulate/impact.
+"""
+
+import numpy as np
+import pytest
+
+from blueprints.physics import (
+    AsteroidSimulator, analyze_all_mitigation_strategies, calculate_secondary_effects,
+    run_impact_simulation
+)
+from services import ASTEROID_COMPOSITIONS, GEO_CACHE
+
+
+COMPOSITIONS = sorted(ASTEROID_COMPOSITIONS)
+TERRAIN_TYPES = ['continental', 'coastal_lowland', 'mountain_high', 'desert', 'forest', 'vegetation', 'urban']
+BATCH_SIZE = 100_000
+
+# Energía de un rocoso de 150 m a 19 km/s (J)
+ENERGY_J = 4.8e17
+
+SCALAR_CASES = {
+    'calculate_mass': (AsteroidSimulator.calculate_mass, (150, 'metallic')),
+    'calculate_impact_energy': (AsteroidSimulator.calculate_impact_energy, (5.3e9, 19000)),
+    'energy_to_tnt': (AsteroidSimulator.energy_to_tnt, (ENERGY_J,)),
+    'calculate_crater_diameter': (AsteroidSimulator.calculate_crater_diameter, (ENERGY_J, 45, 'coastal_lowland', False, 89.7)),
+    'calculate_seismic_magnitude': (AsteroidSimulator.calculate_seismic_magnitude, (ENERGY_J,)),
+    'calculate_tsunami_risk': (AsteroidSimulator.calculate_tsunami_risk, (ENERGY_J, 50, False)),
+    'calculate_deflection': (AsteroidSimulator.calculate_deflection, (5.3e9, 19000, 1000, 10000, 365)),
+    'orbital_position': (AsteroidSimulator.orbital_position, (1.38e11, 0.1912, 0.37)),
+}
+
+
+@pytest.mark.benchmark(group='asteroid-simulator')
+@pytest.mark.parametrize('method', sorted(SCALAR_CASES))
+def test_asteroid_simulator_scalar(benchmark, method):
+    func, args = SCALAR_CASES[method]
+    benchmark(func, *args)
+
+
+@pytest.fixture(scope='module')
+def scenarios():
+    """Lote de escenarios reproducible (semilla fija)"""
+    rng = np.random.default_rng(2025)
+    return {
+        'diameter_m': rng.uniform(10, 2000, BATCH_SIZE),
+        'velocity': rng.uniform(11000, 40000, BATCH_SIZE),
+        'angle': rng.uniform(15, 90, BATCH_SIZE),
+        'composition': rng.choice(COMPOSITIONS, BATCH_SIZE),
+        'is_oceanic': rng.random(BATCH_SIZE) < 0.7,
+        'distance_to_coast_km': rng.uniform(0, 500, BATCH_SIZE)
+    }
+
+
+@pytest.mark.benchmark(group='asteroid-simulator-batch')
+def test_simulate_batch(benchmark, scenarios):
+    result = benchmark(AsteroidSimulator.simulate_batch, **scenarios)
+    assert result['crater_diameter_m'].shape == (BATCH_SIZE,)
+
+
+def test_simulate_batch_matches_scalar():
+    """La ruta por lotes da los mismos resultados que los métodos escalares"""
+    rng = np.random.default_rng(7)
+    n = 2000
+    cases = {
+        'diameter_m': rng.uniform(1, 3000, n),
+        'velocity': rng.uniform(11000, 72000, n),
+        'angle': rng.uniform(5, 90, n),
+        'composition': rng.choice(COMPOSITIONS, n),
+        'terrain_type': rng.choice(TERRAIN_TYPES, n),
+        'is_oceanic': rng.random(n) < 0.3,
+        'elevation_m': rng.uniform(-6000, 5000, n),
+        'distance_to_coast_km': rng.uniform(0, 400, n)
+    }
+    batch = AsteroidSimulator.simulate_batch(**cases)
+
+    sim = AsteroidSimulator
+    for k in range(n):
+        case = {key: values[k].item() for key, values in cases.items()}
+        mass = sim.calculate_mass(case['diameter_m'], case['composition'])
+        energy = sim.calculate_impact_energy(mass, case['velocity'])
+        crater = sim.calculate_crater_diameter(
+            energy, case['angle'], case['terrain_type'], case['is_oceanic'], case['elevation_m']
+        )
+        tsunami = sim.calculate_tsunami_risk(energy, case['distance_to_coast_km'], case['is_oceanic'])
+        expected = {
+            'mass_kg': mass,
+            'energy_joules': energy,
+            'energy_megatons_tnt': sim.energy_to_tnt(energy),
+            'crater_diameter_m': crater,
+            'seismic_magnitude': sim.calculate_seismic_magnitude(energy),
+            'destruction_radius_km': crater / 2000,
+            'damage_radius_km': crater / 2000 * 5,
+            'tsunami_wave_height_m': tsunami['wave_height'],
+            'tsunami_penetration_km': tsunami['penetration_km']
+        }
+        for key, value in expected.items():
+            assert batch[key][k] == pytest.approx(value, rel=1e-12, abs=1e-12), (key, case)
+        assert batch['tsunami_risk'][k] == tsunami['risk'], case
+
+
+@pytest.mark.benchmark(group='asteroid-simulator-batch')
+def test_orbital_positions_batch(benchmark):
+    positions = benchmark(AsteroidSimulator.orbital_positions_batch, 1.38e11, 0.1912, BATCH_SIZE)
+    assert positions['r'].shape == (BATCH_SIZE,)
+
+
+@pytest.mark.benchmark(group='secondary-effects')
+@pytest.mark.parametrize('composition', COMPOSITIONS)
+def test_calculate_secondary_effects(benchmark, impact_result, usgs_context, composition):
+    calculations = impact_result['calculations']
+    impact = impact_result['input']
+    effects = benchmark(
+        calculate_secondary_effects,
+        calculations['energy_megatons_tnt'],
+        impact['diameter_m'],
+        impact['velocity_m_s'],
+        impact['angle_deg'],
+        impact['impact_location']['lat'],
+        impact['impact_location']['lon'],
+        calculations['crater_diameter_m'],
+        composition,
+        usgs_context
+    )
+    assert any(effect.get('type') == 'seismic_extended' for effect in effects)
+
+
+@pytest.mark.benchmark(group='mitigation')
+@pytest.mark.parametrize('composition', COMPOSITIONS)
+def test_analyze_all_mitigation_strategies(benchmark, impact_result, composition):
+    calculations = impact_result['calculations']
+    impact = impact_result['input']
+    strategies = benchmark(
+        analyze_all_mitigation_strategies,
+        impact['diameter_m'],
+        impact['velocity_m_s'] / 1000,
+        calculations['mass_kg'],
+        10,
+        calculations['energy_megatons_tnt'],
+        composition
+    )
+    assert strategies
+
+
+@pytest.mark.benchmark(group='simulate-impact')
+def test_run_impact_simulation_cold_cache(benchmark, impact_request):
+    """Simulación completa con las consultas USGS reproducidas y la caché vacía"""
+    result = benchmark.pedantic(
+        run_impact_simulation, args=(impact_request,), setup=GEO_CACHE.clear, rounds=30
+    )
+    assert result['usgs_context']['sources']['elevation']['status'] == 'ok'
+
+
+@pytest.mark.benchmark(group='simulate-impact')
+def test_run_impact_simulation_warm_cache(benchmark, impact_request):
+    run_impact_simulation(impact_request)
+    result = benchmark(run_impact_simulation, impact_request)
+    assert result['success']
@@ -0,0 +1,95 @@
+"""
+Población afectada: /api/cities con Overpass reproducido, el desglose de
+víctimas de /api/population/casualties y el modelo de funciones de daño
+sobre un ráster de población sintético.
+"""
+
+import math
+import os
+
+import numpy as np
+import pytest
+
+import damage_model
+from dem_store import tile_name
+from population_raster import KM_PER_DEGREE, PopulationRasterStore
+from services import GEO_CACHE
+
+
+# Para el caso grande se repiten los lugares grabados hasta unas 20.000 ciudades
+LARGE_CITY_COUNT = 20_000
+
+# Ráster sintético de 30" (120 × 120 celdas por tesela) que cubre el radio
+# de efecto del mayor evento medido
+RASTER_CELLS_PER_DEGREE = 120
+RASTER_CENTER = (40.0, 0.0)
+RASTER_MAX_MEGATONS = 10000
+
+
+def _post(client, path, payload):
+    response = client.post(path, json=payload)
+    assert response.status_code == 200
+    return response
+
+
+@pytest.mark.benchmark(group='cities')
+def test_get_cities_overpass(benchmark, client, impact_request):
+    payload = {
+        'latitude': impact_request['latitude'],
+        'longitude': impact_request['longitude'],
+        'radius': 25000,
+        'source': 'overpass'
+    }
+    response = benchmark.pedantic(
+        _post, args=(client, '/api/cities', payload), setup=GEO_CACHE.clear, rounds=50
+    )
+    assert response.get_json()['total_found'] > 0
+
+
+@pytest.fixture(scope='module')
+def large_casualties_request(casualties_request):
+    cities = casualties_request['cities']
+    repeats = LARGE_CITY_COUNT // len(cities) + 1
+    return dict(casualties_request, cities=(cities * repeats)[:LARGE_CITY_COUNT])
+
+
+@pytest.mark.benchmark(group='casualties')
+@pytest.mark.parametrize('model', ['zones', 'damage_function'])
+def test_calculate_casualties_breakdown(benchmark, client, casualties_request, model):
+    payload = dict(casualties_request, model=model)
+    response = benchmark(_post, client, '/api/population/casualties', payload)
+    assert response.get_json()['success']
+
+
+@pytest.mark.benchmark(group='casualties')
+@pytest.mark.parametrize('model', ['zones', 'damage_function'])
+def test_calculate_casualties_breakdown_large(benchmark, client, large_casualties_request, model):
+    payload = dict(large_casualties_request, model=model)
+    response = benchmark(_post, client, '/api/population/casualties', payload)
+    assert response.get_json()['success']
+
+
+@pytest.fixture(scope='module')
+def synthetic_raster(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('population')
+    rng = np.random.default_rng(0)
+    lat, lon = RASTER_CENTER
+    lat_half = damage_model.effect_radius_km(RASTER_MAX_MEGATONS) / KM_PER_DEGREE + 0.5
+    lon_half = lat_half / math.cos(math.radians(lat + lat_half))
+    shape = (RASTER_CELLS_PER_DEGREE, RASTER_CELLS_PER_DEGREE)
+    for lat_index in range(math.floor(lat - lat_half), math.floor(lat + lat_half) + 1):
+        for lon_index in range(math.floor(lon - lon_half), math.floor(lon + lon_half) + 1):
+            np.save(os.path.join(directory, tile_name(lat_index, lon_index) + '.npy'),
+                    rng.uniform(0, 200, shape).astype(np.float32))
+    return PopulationRasterStore(str(directory))
+
+
+@pytest.mark.benchmark(group='damage-function-grid')
+@pytest.mark.parametrize('energy_mt', [1000, 3000, RASTER_MAX_MEGATONS])
+def test_grid_casualties_continental(benchmark, synthetic_raster, energy_mt):
+    """Eventos continentales (630-1360 km de radio, 2-9 millones de celdas)"""
+    lat, lon = RASTER_CENTER
+    damage_model.grid_casualties(synthetic_raster, lat, lon, energy_mt)  # Abrir las teselas
+    result = benchmark(damage_model.grid_casualties, synthetic_raster, lat, lon, energy_mt, [50, 200])
+    assert result['missing_tiles'] == 0
+    assert result['cells_evaluated'] > 0 and result['deaths'] > 0
@@ -0,0 +1,28 @@
+"""
+Informe científico en PDF (/api/generate-scientific-report).
+"""
+
+import pytest
+
+from blueprints.reports import REPORT_JOBS, build_scientific_report_pdf
+
+
+@pytest.mark.benchmark(group='scientific-report')
+def test_build_scientific_report_pdf(benchmark, report_payload):
+    """Renderizado completo con ReportLab, sin la caché por contenido"""
+    pdf = benchmark(build_scientific_report_pdf, report_payload)
+    assert pdf.startswith(b'%PDF')
+
+
+@pytest.mark.benchmark(group='scientific-report')
+def test_generate_scientific_report_cached(benchmark, client, report_payload):
+    """Ruta completa cuando el PDF del mismo contenido ya está en caché"""
+    REPORT_JOBS.render_sync(report_payload)
+
+    def generate():
+        response = client.post('/api/generate-scientific-report', json=report_payload)
+        assert response.status_code == 200
+        return response.get_data()
+
+    pdf = benchmark(generate)
+    assert pdf.startswith(b'%PDF')
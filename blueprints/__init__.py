@@ -0,0 +1,22 @@
+"""
+Blueprints de la API, uno por dominio:
+
+    physics     Simulación del impacto, efectos secundarios, USGS/NOAA y mitigación
+    population  Ciudades, víctimas y población de WorldPop
+    biology     Especies de GBIF, flora/fauna y evaluación de impacto ambiental
+    orbital     Catálogo de NEOs, SBDB, trayectorias y aproximaciones
+    reports     Análisis completo e informe científico en PDF
+
+La configuración y los servicios compartidos están en services.py.
+"""
+
+from blueprints import biology, orbital, physics, population, reports
+
+
+BLUEPRINTS = (physics.bp, population.bp, biology.bp, orbital.bp, reports.bp)
+
+
+def register_blueprints(app):
+    """Registra todos los blueprints de la API en la aplicación"""
+    for blueprint in BLUEPRINTS:
+        app.register_blueprint(blueprint)
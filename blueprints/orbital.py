@@ -0,0 +1,672 @@
+"""
+Blueprint orbital.
+
+Catálogo local de NEOs y su sincronización con NeoWs, datos de la SBDB,
+trayectorias y visualización orbital, cribado de aproximaciones del
+catálogo y búsqueda de aproximaciones de un objeto.
+"""
+
+import math
+import os
+import time
+from datetime import datetime, timedelta
+
+from flask import Blueprint, jsonify, request
+from lazy_imports import lazy_import
+import orbital_mechanics
+import neo_screening
+from services import (
+    ASTEROID_COMPOSITIONS, CLOSE_APPROACH_MAX_YEARS, GEO_CACHE, NASA_API_KEY, NASA_NEO_API,
+    NASA_NEO_FEED, NASA_SBDB_API, NEO_CATALOG, NEO_CATALOG_PATH, NEO_SYNC_INTERVAL_S,
+    NEO_SYNC_MAX_BROWSE_PAGES, ORBITAL_TRAJECTORY_MAX_POINTS, SCREENING_JOBS, SCREENING_MAX_OBJECTS, SCREENING_MAX_YEARS,
+    _NEO_SYNC_EXECUTOR
+)
+from blueprints.physics import AsteroidSimulator
+
+requests = lazy_import('requests')
+http_client = lazy_import('http_client')
+
+
+bp = Blueprint('orbital', __name__)
+
+
+def _fetch_neo_feed(start_date, end_date):
+    response = http_client.get(NASA_NEO_FEED, timeout=15, params={
+        'start_date': start_date, 'end_date': end_date, 'api_key': NASA_API_KEY
+    })
+    response.raise_for_status()
+    return response.json()
+
+
+def _fetch_neo_browse_page(page):
+    response = http_client.get(NASA_NEO_API, timeout=15, params={
+        'page': page, 'size': 20, 'api_key': NASA_API_KEY
+    })
+    response.raise_for_status()
+    return response.json()
+
+
+def sync_neo_catalog(browse_pages=0):
+    """Sincronización incremental del catálogo local con NeoWs (feed + browse)"""
+    result = NEO_CATALOG.sync(_fetch_neo_feed, _fetch_neo_browse_page, browse_pages)
+    if 'feed' in result:
+        print(f"INFO: Catálogo NEO sincronizado: {result['feed']['inserted']} nuevos, "
+              f"{result['feed']['updated']} actualizados ({result['elapsed_s']}s)")
+    return result
+
+
+def _neo_catalog_stale():
+    last_sync = NEO_CATALOG.get_state('last_sync')
+    if last_sync is None:
+        return True
+    return (datetime.now() - datetime.fromisoformat(last_sync)).total_seconds() > NEO_SYNC_INTERVAL_S
+
+
+def schedule_neo_catalog_sync(browse_pages=0):
+    """Lanza la sincronización en segundo plano; los errores solo se registran"""
+    def run():
+        try:
+            return sync_neo_catalog(browse_pages)
+        except Exception as e:
+            print(f"WARNING: Sincronización del catálogo NEO fallida: {e}")
+            return {'status': 'error', 'error': str(e)}
+    
+    return _NEO_SYNC_EXECUTOR.submit(run)
+
+
+def _parse_bool_arg(value):
+    if value is None or value == '':
+        return None
+    return value.lower() in ('1', 'true', 'yes', 'si', 'sí')
+
+
+@bp.route('/api/neo/recent', methods=['GET'])
+def get_recent_neos():
+    """
+    Asteroides con aproximación reciente, servidos desde el catálogo local.
+    
+    Filtros opcionales: days (7) o start_date/end_date, hazardous,
+    min_diameter_m, max_diameter_m y name. Orden: sort (approach_date, name,
+    diameter, miss_distance, velocity, hazardous) y order (asc/desc).
+    Paginación: page (1) y page_size (20, máximo 100).
+    
+    Si el catálogo está vacío se sincroniza antes de responder; si está
+    desactualizado se refresca en segundo plano y se responde con lo que hay.
+    """
+    try:
+        end_date = request.args.get('end_date') or datetime.now().strftime('%Y-%m-%d')
+        start_date = request.args.get('start_date') or (
+            datetime.fromisoformat(end_date) - timedelta(days=int(request.args.get('days', 7)))
+        ).strftime('%Y-%m-%d')
+        page = max(1, int(request.args.get('page', 1)))
+        page_size = min(max(1, int(request.args.get('page_size', 20))), 100)
+        
+        if len(NEO_CATALOG) == 0:
+            sync_neo_catalog()
+        elif _neo_catalog_stale() and not NEO_CATALOG.syncing:
+            schedule_neo_catalog_sync()
+        
+        rows, total = NEO_CATALOG.query(
+            hazardous=_parse_bool_arg(request.args.get('hazardous')),
+            min_diameter_m=request.args.get('min_diameter_m', type=float),
+            max_diameter_m=request.args.get('max_diameter_m', type=float),
+            approach_from=start_date,
+            approach_to=end_date,
+            name=request.args.get('name'),
+            sort=request.args.get('sort', 'approach_date'),
+            order=request.args.get('order', 'desc'),
+            limit=page_size,
+            offset=(page - 1) * page_size
+        )
+        
+        asteroids = [{
+            'id': row['id'],
+            'name': row['name'],
+            'diameter_min_m': row['diameter_min_m'],
+            'diameter_max_m': row['diameter_max_m'],
+            'is_hazardous': bool(row['is_hazardous']),
+            'velocity_km_s': row['velocity_km_s'],
+            'miss_distance_km': row['miss_distance_km'],
+            'approach_date': row['approach_date'],
+            'source': 'NASA NEO API'
+        } for row in rows]
+        
+        return jsonify({
+            'success': True,
+            'count': total,
+            'asteroids': asteroids,
+            'page': page,
+            'page_size': page_size,
+            'total_pages': (total + page_size - 1) // page_size,
+            'data_source': 'NASA NEO API (catálogo local)',
+            'date_range': f"{start_date} to {end_date}",
+            'catalog': {
+                'last_sync': NEO_CATALOG.get_state('last_sync'),
+                'syncing': NEO_CATALOG.syncing
+            }
+        })
+    
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e), 'asteroids': []}), 400
+    except requests.exceptions.RequestException as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error de conexión con la NASA API: {str(e)}',
+            'message': 'No se pudieron obtener datos de asteroides. Verifique su conexión a internet y la validez de la API key.',
+            'asteroids': []
+        }), 503
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error procesando datos de la NASA: {str(e)}',
+            'message': 'Error interno al procesar los datos de la API de la NASA.',
+            'asteroids': []
+        }), 500
+
+
+@bp.route('/api/neo/catalog/sync', methods=['POST'])
+def trigger_neo_catalog_sync():
+    """
+    Sincronización incremental del catálogo local. Por defecto en segundo
+    plano (202); con wait=true espera y devuelve el resumen. browse_pages
+    añade páginas del endpoint browse (elementos orbitales).
+    """
+    try:
+        data = request.json or {}
+        browse_pages = min(int(data.get('browse_pages', 0)), NEO_SYNC_MAX_BROWSE_PAGES)
+        if NEO_CATALOG.syncing:
+            return jsonify({'success': True, 'status': 'already_running', 'catalog': NEO_CATALOG.status()}), 202
+        
+        if data.get('wait'):
+            return jsonify({'success': True, 'status': 'done', 'sync': sync_neo_catalog(browse_pages),
+                            'catalog': NEO_CATALOG.status()})
+        
+        schedule_neo_catalog_sync(browse_pages)
+        return jsonify({'success': True, 'status': 'scheduled', 'status_url': '/api/neo/catalog/status'}), 202
+    
+    except requests.exceptions.RequestException as e:
+        return jsonify({'success': False, 'error': f'Error de conexión con la NASA API: {str(e)}'}), 503
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@bp.route('/api/neo/catalog/status', methods=['GET'])
+def get_neo_catalog_status():
+    """Tamaño, cobertura de fechas y estado de sincronización del catálogo local"""
+    return jsonify({
+        'success': True,
+        'syncing': NEO_CATALOG.syncing,
+        'stale': _neo_catalog_stale(),
+        'catalog': NEO_CATALOG.status()
+    })
+
+
+@bp.route('/api/orbital-trajectory', methods=['POST'])
+def calculate_trajectory():
+    try:
+        data = request.json
+        
+        semi_major_axis = float(data.get('semi_major_axis', 1.5e11))
+        eccentricity = float(data.get('eccentricity', 0.1))
+        num_points = min(max(int(data.get('num_points', 100)), 2), ORBITAL_TRAJECTORY_MAX_POINTS)
+        
+        positions = AsteroidSimulator.orbital_positions_batch(semi_major_axis, eccentricity, num_points)
+        trajectory = [
+            {'x': x, 'y': y, 'z': z, 'r': r}
+            for x, y, z, r in zip(
+                positions['x'].tolist(), positions['y'].tolist(),
+                positions['z'].tolist(), positions['r'].tolist()
+            )
+        ]
+        
+        return jsonify({
+            'success': True,
+            'trajectory': trajectory,
+            'earth_position': {'x': 0, 'y': 0, 'z': 0}
+        })
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+
+def _sbdb_orbit_value(orbital_data, name):
+    """
+    Valor de un elemento orbital de la SBDB. La API devuelve los elementos
+    como lista ('elements': [{'name': 'e', 'value': ...}]); se admite también
+    el formato de diccionario por nombre.
+    
+    La SBDB da los valores como cadenas ('1.458'); se devuelven como float,
+    o None si el elemento no está.
+    """
+    value = None
+    for element in orbital_data.get('elements', []):
+        if element.get('name') == name:
+            value = element.get('value')
+            break
+    else:
+        value = orbital_data.get(name)
+        if isinstance(value, dict):
+            value = value.get('value')
+    return float(value) if value is not None else None
+
+
+def get_sbdb_asteroid(asteroid_id):
+    """
+    Datos de un asteroide según la Small Body Database de la NASA JPL.
+    
+    Servicio en proceso compartido por /api/nasa/sbdb y la visualización
+    orbital; la respuesta de la SBDB se cachea en GEO_CACHE. Devuelve
+    (resultado, mensaje): resultado es None si la SBDB no conoce el objeto.
+    Los errores de red se propagan como requests.exceptions.RequestException.
+    """
+    cached = NEO_CATALOG.get_sbdb(asteroid_id)
+    if cached is not None:
+        return cached, None
+    
+    # Consultar la Small Body Database de la NASA JPL
+    params = {
+        'sstr': asteroid_id,
+        'orb': 1,  # Incluir elementos orbitales
+        'phys-par': 1,  # Incluir parámetros físicos
+        'cov': 1  # Incluir covarianza
+    }
+    
+    def fetch_sbdb():
+        response = http_client.get(NASA_SBDB_API, params=params, timeout=10)
+        response.raise_for_status()
+        return response.json()
+    
+    data = GEO_CACHE.get_or_fetch('sbdb', params, fetch_sbdb)
+    
+    if data.get('code') != 200:
+        return None, data.get('message', 'Error desconocido')
+    
+    sbdb_data = data.get('object', {})
+    
+    # Extraer elementos orbitales
+    orbital_data = sbdb_data.get('orbit', {})
+    physical_data = sbdb_data.get('phys_par', {})
+    
+    result = {
+        'success': True,
+        'asteroid_id': asteroid_id,
+        'name': sbdb_data.get('full_name', asteroid_id),
+        'designation': sbdb_data.get('des', ''),
+        'classification': sbdb_data.get('class', ''),
+        'diameter_km': physical_data.get('diameter', {}).get('value'),
+        'diameter_uncertainty': physical_data.get('diameter', {}).get('uncertainty'),
+        'albedo': physical_data.get('albedo', {}).get('value'),
+        'rotation_period_h': physical_data.get('rot_per', {}).get('value'),
+        'absolute_magnitude': sbdb_data.get('H', {}).get('value'),
+        'orbital_elements': {
+            'semi_major_axis_au': _sbdb_orbit_value(orbital_data, 'a'),
+            'eccentricity': _sbdb_orbit_value(orbital_data, 'e'),
+            'inclination_deg': _sbdb_orbit_value(orbital_data, 'i'),
+            'longitude_ascending_node_deg': _sbdb_orbit_value(orbital_data, 'om'),
+            'argument_perihelion_deg': _sbdb_orbit_value(orbital_data, 'w'),
+            'mean_anomaly_deg': _sbdb_orbit_value(orbital_data, 'ma'),
+            'perihelion_distance_au': _sbdb_orbit_value(orbital_data, 'q'),
+            'aphelion_distance_au': _sbdb_orbit_value(orbital_data, 'ad'),
+            'orbital_period_days': _sbdb_orbit_value(orbital_data, 'per'),
+            'epoch_jd': float(orbital_data['epoch']) if orbital_data.get('epoch') is not None else None
+        },
+        'source': 'NASA JPL Small Body Database'
+    }
+    
+    NEO_CATALOG.put_sbdb(asteroid_id, result)
+    return result, None
+
+
+@bp.route('/api/nasa/sbdb/<asteroid_id>', methods=['GET'])
+def get_asteroid_sbdb_data(asteroid_id):
+    """
+    Obtiene datos detallados de un asteroide específico usando la 
+    Small Body Database API de la NASA JPL
+    """
+    try:
+        result, message = get_sbdb_asteroid(asteroid_id)
+        
+        if result is not None:
+            return jsonify(result)
+        else:
+            return jsonify({
+                'success': False,
+                'error': f'No se encontraron datos para el asteroide {asteroid_id}',
+                'message': message
+            }), 404
+            
+    except requests.exceptions.RequestException as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error al consultar la NASA SBDB: {str(e)}'
+        }), 500
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error interno: {str(e)}'
+        }), 500
+
+
+@bp.route('/api/nasa/orbital-visualization', methods=['POST'])
+def generate_orbital_visualization():
+    """
+    Genera datos para visualización orbital usando elementos keplerianos
+    de la NASA
+    """
+    try:
+        data = request.json
+        asteroid_id = data.get('asteroid_id')
+        
+        if asteroid_id:
+            # Obtener datos orbitales reales del asteroide (en proceso, cacheado)
+            try:
+                sbdb_data, _ = get_sbdb_asteroid(asteroid_id)
+            except requests.exceptions.RequestException as e:
+                print(f"WARNING: SBDB no disponible para {asteroid_id}: {e}")
+                sbdb_data = None
+            
+            if sbdb_data is not None:
+                orbital_elements = sbdb_data['orbital_elements']
+            else:
+                # Usar datos por defecto si no se encuentra el asteroide
+                orbital_elements = {
+                    'semi_major_axis_au': 1.5,
+                    'eccentricity': 0.2,
+                    'inclination_deg': 15,
+                    'longitude_ascending_node_deg': 100,
+                    'argument_perihelion_deg': 50,
+                    'mean_anomaly_deg': 0
+                }
+        else:
+            # Usar parámetros por defecto
+            orbital_elements = {
+                'semi_major_axis_au': float(data.get('semi_major_axis', 1.5)),
+                'eccentricity': float(data.get('eccentricity', 0.2)),
+                'inclination_deg': float(data.get('inclination', 15)),
+                'longitude_ascending_node_deg': float(data.get('longitude_ascending_node', 100)),
+                'argument_perihelion_deg': float(data.get('argument_perihelion', 50)),
+                'mean_anomaly_deg': float(data.get('mean_anomaly', 0))
+            }
+        
+        # Generar trayectoria orbital
+        num_points = min(max(int(data.get('num_points', 100)), 2), ORBITAL_TRAJECTORY_MAX_POINTS)
+        trajectory = generate_orbital_trajectory(orbital_elements, num_points)
+        
+        # Posiciones planetarias (simplificadas)
+        planet_positions = get_planet_positions()
+        
+        return jsonify({
+            'success': True,
+            'orbital_elements': orbital_elements,
+            'trajectory': trajectory,
+            'planet_positions': planet_positions,
+            'earth_position': {'x': 0, 'y': 0, 'z': 0},
+            'source': 'NASA Orbital Mechanics'
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error generando visualización orbital: {str(e)}'
+        }), 500
+
+
+@bp.route('/api/neo/screening', methods=['POST'])
+def submit_neo_screening():
+    """
+    Lanza en segundo plano el cribado de un catálogo completo de NEOs frente a
+    la órbita terrestre (MOID, aproximación más cercana y energía de impacto).
+    
+    Entrada: objects (lista de elementos estilo SBDB) o, si no se envía, el
+    catálogo local NEO_CATALOG_PATH o los objetos con elementos orbitales del
+    catálogo SQLite (NEO_CATALOG); years, top, rank_by (moid, distance,
+    energy) y workers (por defecto y como máximo, todos los núcleos).
+    
+    Los cribados se ejecutan de uno en uno; con demasiados pendientes se
+    responde 429.
+    """
+    try:
+        data = request.json or {}
+        
+        if len(data.get('objects') or []) > SCREENING_MAX_OBJECTS:
+            return jsonify({
+                'success': False,
+                'error': f"Máximo {SCREENING_MAX_OBJECTS} objetos por cribado (recibidos {len(data['objects'])})"
+            }), 400
+        
+        if data.get('objects'):
+            catalog = neo_screening.catalog_from_records(data['objects'])
+        elif os.path.exists(NEO_CATALOG_PATH):
+            catalog = neo_screening.load_catalog_csv(NEO_CATALOG_PATH)
+        elif NEO_CATALOG.status()['with_orbital_elements']:
+            catalog = neo_screening.catalog_from_records(NEO_CATALOG.elements_records())
+        else:
+            return jsonify({
+                'success': False,
+                'error': f'No hay catálogo local de NEOs en {NEO_CATALOG_PATH} ni elementos orbitales '
+                         f'en el catálogo SQLite; envíe objects o sincronice con browse_pages'
+            }), 400
+        
+        start = datetime.fromisoformat(data['start_date']) if data.get('start_date') else datetime.utcnow()
+        options = {
+            'jd_start': datetime_to_jd(start),
+            'years': min(float(data.get('years', neo_screening.DEFAULT_YEARS)), SCREENING_MAX_YEARS),
+            'top': int(data.get('top', 100)),
+            'rank_by': data.get('rank_by', 'moid'),
+            'density': ASTEROID_COMPOSITIONS['rocky']['density']
+        }
+        if data.get('workers') is not None:
+            options['workers'] = max(0, min(int(data['workers']), os.cpu_count() or 1))
+        if options['rank_by'] not in neo_screening.RANK_KEYS:
+            return jsonify({
+                'success': False,
+                'error': f"rank_by debe ser uno de {', '.join(neo_screening.RANK_KEYS)}"
+            }), 400
+        
+        try:
+            job = SCREENING_JOBS.submit(catalog, **options)
+        except neo_screening.ScreeningQueueFull as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 429
+        return jsonify({
+            'success': True,
+            'job_id': job['job_id'],
+            'status': job['status'],
+            'catalog_size': len(catalog['a']),
+            'status_url': f"/api/neo/screening/{job['job_id']}"
+        }), 202
+    
+    except (TypeError, ValueError) as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+
+@bp.route('/api/neo/screening/<job_id>', methods=['GET'])
+def get_neo_screening(job_id):
+    """Estado, progreso y (al terminar) ranking de un cribado"""
+    job = SCREENING_JOBS.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': 'Trabajo no encontrado'
+        }), 404
+    return jsonify({
+        'success': job['status'] != 'error',
+        **job
+    })
+
+
+@bp.route('/api/nasa/close-approaches', methods=['POST'])
+def find_close_approaches():
+    """
+    Propaga la órbita de un asteroide (dos cuerpos, con época) y busca sus
+    aproximaciones a la Tierra en una ventana de tiempo, junto con la MOID.
+    
+    Entrada: asteroid_id (SBDB) o elementos orbitales explícitos
+    (semi_major_axis, eccentricity, inclination, longitude_ascending_node,
+    argument_perihelion, mean_anomaly, epoch_jd), start_date (ISO, por
+    defecto hoy), years (por defecto 100) y threshold_au (0.05 UA).
+    """
+    try:
+        data = request.json or {}
+        asteroid_id = data.get('asteroid_id')
+        
+        if asteroid_id:
+            sbdb_data, message = get_sbdb_asteroid(asteroid_id)
+            if sbdb_data is None:
+                return jsonify({
+                    'success': False,
+                    'error': f'No se encontraron datos para el asteroide {asteroid_id}',
+                    'message': message
+                }), 404
+            orbital_elements = sbdb_data['orbital_elements']
+            name = sbdb_data['name']
+        else:
+            orbital_elements = {
+                'semi_major_axis_au': float(data.get('semi_major_axis', 1.5)),
+                'eccentricity': float(data.get('eccentricity', 0.2)),
+                'inclination_deg': float(data.get('inclination', 15)),
+                'longitude_ascending_node_deg': float(data.get('longitude_ascending_node', 100)),
+                'argument_perihelion_deg': float(data.get('argument_perihelion', 50)),
+                'mean_anomaly_deg': float(data.get('mean_anomaly', 0)),
+                'epoch_jd': float(data.get('epoch_jd', orbital_mechanics.J2000_JD))
+            }
+            name = 'Órbita personalizada'
+        
+        start = datetime.fromisoformat(data['start_date']) if data.get('start_date') else datetime.utcnow()
+        years = min(float(data.get('years', 100)), CLOSE_APPROACH_MAX_YEARS)
+        threshold_au = float(data.get('threshold_au', 0.05))
+        jd_start = datetime_to_jd(start)
+        jd_end = jd_start + years * 365.25
+        
+        scan_start = time.perf_counter()
+        orbit = orbital_mechanics.KeplerOrbit.from_elements(orbital_elements)
+        earth_orbit = orbital_mechanics.planet_orbit('Earth', (jd_start + jd_end) / 2)
+        moid_au = orbital_mechanics.moid(orbit, earth_orbit)
+        approaches = orbital_mechanics.close_approaches(orbit, jd_start, jd_end, threshold_au=threshold_au)
+        elapsed_ms = (time.perf_counter() - scan_start) * 1000
+        
+        return jsonify({
+            'success': True,
+            'name': name,
+            'orbital_elements': orbital_elements,
+            'moid': {
+                'au': round(moid_au, 8),
+                'km': round(moid_au * orbital_mechanics.AU_KM, 1),
+                'lunar_distances': round(moid_au * orbital_mechanics.AU_KM / orbital_mechanics.LUNAR_DISTANCE_KM, 3),
+                'potentially_hazardous': moid_au <= 0.05
+            },
+            'window': {
+                'start': start.isoformat(),
+                'end': jd_to_datetime(jd_end).isoformat(),
+                'years': years,
+                'threshold_au': threshold_au
+            },
+            'approaches': [
+                {
+                    'date': jd_to_datetime(approach['jd']).isoformat(timespec='minutes'),
+                    'jd': round(approach['jd'], 5),
+                    'distance_au': round(approach['distance_au'], 8),
+                    'distance_km': round(approach['distance_au'] * orbital_mechanics.AU_KM, 1),
+                    'distance_lunar': round(
+                        approach['distance_au'] * orbital_mechanics.AU_KM / orbital_mechanics.LUNAR_DISTANCE_KM, 3
+                    ),
+                    'relative_velocity_km_s': round(approach['relative_velocity_km_s'], 3)
+                }
+                for approach in approaches
+            ],
+            'elapsed_ms': round(elapsed_ms, 2),
+            'model': 'Propagación kepleriana de dos cuerpos; Tierra con elementos medios JPL (Standish)'
+        })
+    
+    except requests.exceptions.RequestException as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error al consultar la NASA SBDB: {str(e)}'
+        }), 500
+    except (TypeError, ValueError, KeyError) as e:
+        return jsonify({
+            'success': False,
+            'error': f'Elementos orbitales no válidos: {str(e)}'
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error buscando aproximaciones: {str(e)}'
+        }), 500
+
+
+def generate_orbital_trajectory_arrays(orbital_elements, num_points=100):
+    """
+    Trayectoria orbital como arrays NumPy contiguos (x, y, z, r, time_fraction).
+    
+    Sin bucles Python por punto: admite millones de puntos por llamada.
+    Los elementos ausentes o None toman los valores por defecto.
+    """
+    def element(name, default):
+        value = orbital_elements.get(name)
+        return float(value) if value is not None else default
+    
+    a = element('semi_major_axis_au', 1.5) * 1.496e11  # Convertir AU a metros
+    e = element('eccentricity', 0.2)
+    
+    return orbital_mechanics.trajectory(
+        a, e,
+        inclination=math.radians(element('inclination_deg', 15)),
+        ascending_node=math.radians(element('longitude_ascending_node_deg', 100)),
+        arg_perihelion=math.radians(element('argument_perihelion_deg', 50)),
+        num_points=num_points
+    )
+
+
+def generate_orbital_trajectory(orbital_elements, num_points=100):
+    """Genera trayectoria orbital usando elementos keplerianos (lista de puntos para JSON)"""
+    points = generate_orbital_trajectory_arrays(orbital_elements, num_points)
+    columns = [points[key].tolist() for key in ('x', 'y', 'z', 'r', 'time_fraction')]
+    return [
+        {'x': x, 'y': y, 'z': z, 'r': r, 'time_fraction': t}
+        for x, y, z, r, t in zip(*columns)
+    ]
+
+
+PLANET_COLORS = {
+    'Mercury': '#8C7853',
+    'Venus': '#FFC649',
+    'Earth': '#6B93D6',
+    'Mars': '#C1440E',
+    'Jupiter': '#D8CA9D',
+    'Saturn': '#FAD5A5'
+}
+
+
+def datetime_to_jd(moment):
+    """Fecha juliana de un datetime (UTC, sin zona horaria)"""
+    return orbital_mechanics.J2000_JD + (moment - datetime(2000, 1, 1, 12)).total_seconds() / 86400
+
+
+def jd_to_datetime(jd):
+    """datetime (UTC) de una fecha juliana"""
+    return datetime(2000, 1, 1, 12) + timedelta(days=jd - orbital_mechanics.J2000_JD)
+
+
+def get_planet_positions(jd=None):
+    """
+    Posiciones heliocéntricas de los planetas (UA, eclíptica J2000) en la
+    fecha juliana jd (por defecto, ahora), con elementos keplerianos medios.
+    """
+    if jd is None:
+        jd = datetime_to_jd(datetime.utcnow())
+    
+    planets = {}
+    for name, color in PLANET_COLORS.items():
+        x, y, z = orbital_mechanics.planet_state(name, jd)[0][0]
+        planets[name] = {'x': float(x), 'y': float(y), 'z': float(z), 'color': color}
+    
+    return planets
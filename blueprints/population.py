@@ -0,0 +1,876 @@
+"""
+Blueprint de población.
+
+Ciudades afectadas (nomenclátor local u Overpass), desglose de víctimas
+por zonas o por funciones de daño y población de WorldPop (ráster local o
+API) en los anillos de impacto.
+"""
+
+import asyncio
+import math
+import json
+
+from flask import Blueprint, jsonify, request
+from lazy_imports import lazy_import
+import impact_zones
+import damage_model
+from services import GAZETTEER, GEO_CACHE, POPULATION_RASTER
+
+np = lazy_import('numpy')
+http_client = lazy_import('http_client')
+async_http_client = lazy_import('async_http_client')
+
+
+bp = Blueprint('population', __name__)
+
+
+def _estimate_place_population(place_type, population_str):
+    """Población de un lugar; si falta o no es numérica se estima por tipo"""
+    if population_str:
+        try:
+            # Limpiar el string de población (eliminar espacios, comas, etc)
+            clean_pop = str(population_str).replace(" ", "").replace(",", "").replace(".", "")
+            return int(clean_pop)
+        except (ValueError, TypeError):
+            pass
+    
+    # Si no hay datos de población, estimar por tipo
+    if place_type == "city" or place_type == "8":
+        return 100000
+    elif place_type == "town":
+        return 10000
+    elif place_type == "village":
+        return 1000
+    elif place_type == "6":  # admin_level 6 (provincia/región)
+        return 50000
+    elif place_type == "4":  # admin_level 4 (estado/comunidad autónoma)
+        return 200000
+    return 0
+
+
+OVERPASS_URL = "http://overpass-api.de/api/interpreter"
+
+
+def _overpass_query(lat, lon, radius):
+    # Consulta mejorada que busca nodos Y áreas administrativas
+    return f"""
+    [out:json][timeout:25];
+    (
+      node["place"~"city|town|village"](around:{radius}, {lat}, {lon});
+      way["place"~"city|town|village"](around:{radius}, {lat}, {lon});
+      relation["place"~"city|town|village"](around:{radius}, {lat}, {lon});
+      relation["admin_level"~"4|6|8"]["name"](around:{radius}, {lat}, {lon});
+    );
+    out center tags;
+    """
+
+
+def _overpass_places(ovrpress_data):
+    """Lugares de una respuesta de Overpass (dicts name, type, population, lat, lon)"""
+    places = []
+    for element in ovrpress_data.get("elements", []):
+        tags = element.get("tags", {})
+        name = tags.get("name")
+        
+        if not name:
+            continue
+        
+        place_type = tags.get("place", tags.get("admin_level", "unknown"))
+        
+        # Obtener coordenadas (center para ways/relations, lat/lon para nodes)
+        if element.get("type") == "node":
+            city_lat = element.get("lat")
+            city_lon = element.get("lon")
+        elif "center" in element:
+            city_lat = element["center"].get("lat")
+            city_lon = element["center"].get("lon")
+        else:
+            continue
+        
+        if not city_lat or not city_lon:
+            continue
+        
+        places.append({
+            'name': name,
+            'type': place_type,
+            'population': _estimate_place_population(place_type, tags.get("population")),
+            'lat': city_lat,
+            'lon': city_lon
+        })
+    
+    return places
+
+
+def fetch_overpass_places(lat, lon, radius):
+    """
+    Lugares poblados de OpenStreetMap (Overpass) en un radio en metros.
+    Devuelve dicts name, type, population, lat, lon (sin distancia).
+    """
+    query = _overpass_query(lat, lon, radius)
+    
+    def fetch_overpass():
+        response = http_client.get(OVERPASS_URL, params={'data': query}, timeout=30)
+        return response.json()
+    
+    ovrpress_data = GEO_CACHE.get_or_fetch(
+        'overpass', {'lat': lat, 'lon': lon, 'radius': radius}, fetch_overpass
+    )
+    return _overpass_places(ovrpress_data)
+
+
+async def fetch_overpass_places_async(lat, lon, radius):
+    """fetch_overpass_places para la ruta asíncrona (comparte la caché 'overpass')"""
+    query = _overpass_query(lat, lon, radius)
+    
+    async def fetch_overpass():
+        response = await async_http_client.get(OVERPASS_URL, params={'data': query}, timeout=30)
+        return response.json()
+    
+    ovrpress_data = await GEO_CACHE.get_or_fetch_async(
+        'overpass', {'lat': lat, 'lon': lon, 'radius': radius}, fetch_overpass
+    )
+    return _overpass_places(ovrpress_data)
+
+
+def _cities_request(data):
+    """
+    Valida la petición de /api/cities. Devuelve (plan, error): plan con
+    lat, lon, radius, gazetteer y enrich, o el mensaje de error (400).
+    """
+    lat = data.get('latitude')
+    lon = data.get('longitude')
+    radius = data.get('radius', 25000)
+    
+    if not lat or not lon:
+        return None, 'Latitud y longitud son requeridos'
+        
+    # Fuente de lugares: nomenclátor local (KD-tree) y, opcionalmente,
+    # Overpass como enriquecimiento. source: auto, local u overpass
+    source = data.get('source', 'auto')
+    if source not in ('auto', 'local', 'overpass'):
+        return None, "source debe ser 'auto', 'local' u 'overpass'"
+    
+    gazetteer = GAZETTEER.get() if source != 'overpass' else None
+    if source == 'local' and gazetteer is None:
+        return None, 'No hay nomenclátor local configurado (GAZETTEER_PATH)'
+    
+    return {
+        'lat': lat, 'lon': lon, 'radius': radius,
+        'gazetteer': gazetteer, 'enrich': bool(data.get('enrich'))
+    }, None
+
+
+def _gazetteer_candidates(plan):
+    """Lugares del nomenclátor local dentro del radio (con distance_km)"""
+    candidates = []
+    gazetteer = plan['gazetteer']
+    indices, distances = gazetteer.within_radius(plan['lat'], plan['lon'], float(plan['radius']) / 1000)
+    for place in gazetteer.records(indices, distances):
+        # GeoNames usa 0 cuando no conoce la población
+        place['population'] = place['population'] or _estimate_place_population(place['type'], None)
+        candidates.append(place)
+    return candidates
+
+
+def _cities_result(lat, lon, candidates, data_sources):
+    """Clasifica los lugares por zona de impacto y construye la respuesta de /api/cities"""
+    # Evitar duplicados por nombre y coordenadas cercanas
+    seen_places = set()
+    unique = []
+    for candidate in candidates:
+        if not (candidate['name'] and candidate['lat'] and candidate['lon']):
+            continue
+        place_key = f"{candidate['name']}_{round(candidate['lat'], 2)}_{round(candidate['lon'], 2)}"
+        if place_key not in seen_places:
+            seen_places.add(place_key)
+            unique.append(candidate)
+    
+    # Definir radios de impacto (en km)
+    destruction_radius_km = 5.0   # Zona de destrucción total
+    damage_radius_km = 10.0       # Zona de daños severos
+    affected_radius_km = 20.0     # Zona afectada
+    
+    # Clasificación columnar: 0 destrucción, 1 daño, 2 afectada (sin límite exterior)
+    zone_keys = ('destruction', 'damage', 'affected')
+    zone_names = ('Destrucción Total', 'Daño Severo', 'Área Afectada')
+    zone_percentages = np.array([0.95, 0.15, 0.05])
+    
+    place_lats = np.array([place['lat'] for place in unique], dtype=float)
+    place_lons = np.array([place['lon'] for place in unique], dtype=float)
+    populations = np.array([place['population'] for place in unique], dtype=np.int64)
+    # El nomenclátor ya devuelve la distancia; Overpass no
+    distances = np.array([place.get('distance_km', np.nan) for place in unique], dtype=float)
+    missing = np.isnan(distances)
+    if np.any(missing):
+        distances[missing] = impact_zones.haversine_km(lat, lon, place_lats[missing], place_lons[missing])
+    
+    zones = np.minimum(impact_zones.classify(distances, [destruction_radius_km, damage_radius_km]), 2)
+    victims = (populations * zone_percentages[zones]).astype(np.int64)
+    zone_population = impact_zones.zone_sums(zones, populations, 3).astype(np.int64)
+    zone_victims = impact_zones.zone_sums(zones, victims, 3).astype(np.int64)
+    
+    places = [
+        {
+            "nombre": place['name'],
+            "tipo": place['type'],
+            "poblacion": population,
+            "victimas_estimadas": estimated_victims,
+            "lat": place['lat'],
+            "lon": place['lon'],
+            "distancia_km": round(distance_km, 2),
+            "impact_zone": zone_keys[zone],
+            "zone_name": zone_names[zone],
+            "victims_percentage": float(zone_percentages[zone])
+        }
+        for place, population, estimated_victims, distance_km, zone in zip(
+            unique, populations.tolist(), victims.tolist(), distances.tolist(), zones.tolist()
+        )
+    ]
+    destruction_zone = [place for place, zone in zip(places, zones.tolist()) if zone == 0]
+    damage_zone = [place for place, zone in zip(places, zones.tolist()) if zone == 1]
+    affected_zone = [place for place, zone in zip(places, zones.tolist()) if zone == 2]
+    
+    # Ordenar lugares por población (mayor a menor) para priorizar ciudades importantes
+    places = [places[i] for i in np.argsort(-populations, kind='stable')]
+    
+    total_population = int(populations.sum())
+    destruction_population, damage_population, affected_population = zone_population.tolist()
+    destruction_victims, damage_victims, affected_victims = zone_victims.tolist()
+    total_victims = destruction_victims + damage_victims + affected_victims
+    
+    print(f"🔍 API /api/cities: Encontradas {len(places)} lugares")
+    print(f"👥 Población total calculada: {total_population:,} personas")
+    print(f"💀 Víctimas totales estimadas: {total_victims:,}")
+    print(f"🔥 Zona Destrucción: {len(destruction_zone)} lugares, {destruction_victims:,} víctimas")
+    print(f"⚠️ Zona Daño: {len(damage_zone)} lugares, {damage_victims:,} víctimas")
+    print(f"🌪️ Zona Afectada: {len(affected_zone)} lugares, {affected_victims:,} víctimas")
+    
+    # Mostrar las 5 ciudades más grandes encontradas
+    if places:
+        print(f"🏙️ Principales ciudades encontradas:")
+        for i, place in enumerate(places[:5], 1):
+            print(f"   {i}. {place['nombre']}: {place['poblacion']:,} hab. (distancia: {place['distancia_km']:.1f} km)")
+    
+    return {
+        'success': True,
+        'cities': places,
+        'total_found': len(places),
+        'totalPopulation': total_population,
+        'totalVictims': total_victims,
+        'data_sources': data_sources,
+        'zones': {
+            'destruction': {
+                'name': 'Destrucción Total',
+                'radius_km': destruction_radius_km,
+                'places': destruction_zone,
+                'places_count': len(destruction_zone),
+                'total_population': destruction_population,
+                'total_victims': destruction_victims,
+                'victims_percentage': 0.95
+            },
+            'damage': {
+                'name': 'Daño Severo',
+                'radius_km': damage_radius_km,
+                'places': damage_zone,
+                'places_count': len(damage_zone),
+                'total_population': damage_population,
+                'total_victims': damage_victims,
+                'victims_percentage': 0.15
+            },
+            'affected': {
+                'name': 'Área Afectada',
+                'radius_km': affected_radius_km,
+                'places': affected_zone,
+                'places_count': len(affected_zone),
+                'total_population': affected_population,
+                'total_victims': affected_victims,
+                'victims_percentage': 0.05
+            }
+        }
+    }
+
+
+def _cities_error(e):
+    print(f"❌ Error en API /api/cities: {str(e)}")
+    return {
+        'success': False,
+        'cities': [],
+        'total_found': 0,
+        'totalPopulation': 0,
+        'totalVictims': 0,
+        'zones': {
+            'destruction': {'places_count': 0, 'total_population': 0, 'total_victims': 0},
+            'damage': {'places_count': 0, 'total_population': 0, 'total_victims': 0},
+            'affected': {'places_count': 0, 'total_population': 0, 'total_victims': 0}
+        },
+        'error': str(e)
+    }
+
+
+@bp.route('/api/cities', methods=['POST'])
+def get_cities():
+    try:
+        data = request.get_json()
+        plan, error = _cities_request(data)
+        if error:
+            return jsonify({
+                'success': False,
+                'error': error
+            }), 400
+        
+        candidates = []
+        data_sources = []
+        if plan['gazetteer'] is not None:
+            candidates.extend(_gazetteer_candidates(plan))
+            data_sources.append('Nomenclátor local (GeoNames)')
+        
+        if plan['gazetteer'] is None:
+            candidates.extend(fetch_overpass_places(plan['lat'], plan['lon'], plan['radius']))
+            data_sources.append('OpenStreetMap (Overpass)')
+        elif plan['enrich']:
+            try:
+                candidates.extend(fetch_overpass_places(plan['lat'], plan['lon'], plan['radius']))
+                data_sources.append('OpenStreetMap (Overpass)')
+            except Exception as e:
+                print(f"WARNING: Enriquecimiento con Overpass no disponible: {e}")
+        
+        return jsonify(_cities_result(plan['lat'], plan['lon'], candidates, data_sources))
+        
+    except Exception as e:
+        return jsonify(_cities_error(e))
+
+
+async def get_cities_async(data):
+    """
+    /api/cities en la ruta ASGI (asgi.py): misma respuesta que get_cities,
+    esperando a Overpass sin ocupar un hilo. Devuelve (payload, status).
+    """
+    try:
+        plan, error = _cities_request(data)
+        if error:
+            return {'success': False, 'error': error}, 400
+        
+        candidates = []
+        data_sources = []
+        if plan['gazetteer'] is not None:
+            candidates.extend(_gazetteer_candidates(plan))
+            data_sources.append('Nomenclátor local (GeoNames)')
+        
+        if plan['gazetteer'] is None:
+            candidates.extend(await fetch_overpass_places_async(plan['lat'], plan['lon'], plan['radius']))
+            data_sources.append('OpenStreetMap (Overpass)')
+        elif plan['enrich']:
+            try:
+                candidates.extend(await fetch_overpass_places_async(plan['lat'], plan['lon'], plan['radius']))
+                data_sources.append('OpenStreetMap (Overpass)')
+            except Exception as e:
+                print(f"WARNING: Enriquecimiento con Overpass no disponible: {e}")
+        
+        return _cities_result(plan['lat'], plan['lon'], candidates, data_sources), 200
+        
+    except Exception as e:
+        return _cities_error(e), 200
+
+
+def calculate_damage_function_casualties(data, zone_radii_km):
+    """
+    Víctimas con el modelo continuo de funciones de daño. Integra sobre el
+    ráster de población si hay teselas y se envían latitude/longitude; si no,
+    evalúa las curvas en las ciudades recibidas. Devuelve el mismo esquema
+    que el modelo por zonas más 'outside_zones' (más allá del radio de presión).
+    """
+    energy_megatons = float(data.get('energy_megatons', 1))
+    exposed_fraction = float(data.get('exposed_fraction', damage_model.DEFAULT_EXPOSED_FRACTION))
+    lat = data.get('latitude')
+    lon = data.get('longitude')
+    
+    if POPULATION_RASTER.available and lat is not None and lon is not None:
+        result = damage_model.grid_casualties(
+            POPULATION_RASTER, float(lat), float(lon), energy_megatons, zone_radii_km, exposed_fraction
+        )
+        source = 'Ráster de población local'
+        band_counts = [None] * len(result['bands'])
+        print(f"   🧮 Modelo continuo: {result['cells_evaluated']:,} celdas evaluadas en {result['elapsed_ms']} ms")
+    else:
+        cities = data.get('cities', [])
+        result = damage_model.point_casualties(
+            [city.get('distancia_km', float('inf')) for city in cities],
+            [city.get('poblacion', 0) for city in cities],
+            energy_megatons, zone_radii_km, exposed_fraction
+        )
+        source = 'Ciudades'
+        band_counts = result['band_counts']
+    
+    def zone_summary(band, count):
+        total_pop = round(band['population'])
+        deaths = round(band['deaths'])
+        injured = round(band['injured'])
+        return {
+            'total_population': total_pop,
+            'deaths': deaths,
+            'injured': injured,
+            'survivors': total_pop - deaths - injured,
+            'cities_count': count,
+            'fatality_rate': round(band['deaths'] / band['population'] * 100, 2) if band['population'] > 0 else 0,
+            'injury_rate': round(band['injured'] / band['population'] * 100, 2) if band['population'] > 0 else 0
+        }
+    
+    zones = [zone_summary(band, count) for band, count in zip(result['bands'], band_counts)]
+    total_population = round(result['population'])
+    total_deaths = round(result['deaths'])
+    total_injured = round(result['injured'])
+    
+    print(f"   💀 Fallecidos: {total_deaths:,} | 🏥 Heridos: {total_injured:,} "
+          f"(radio de efecto {result['effect_radius_km']} km)")
+    
+    return {
+        'success': True,
+        'model': 'damage_function',
+        'source': source,
+        'breakdown': {
+            'destruction_zone': zones[0],
+            'damage_zone': zones[1],
+            'air_pressure_zone': zones[2],
+            'outside_zones': zones[3]
+        },
+        'totals': {
+            'total_population': total_population,
+            'total_deaths': total_deaths,
+            'total_injured': total_injured,
+            'total_affected': total_deaths + total_injured,
+            'overall_fatality_rate': round(result['deaths'] / result['population'] * 100, 2) if result['population'] > 0 else 0,
+            'overall_injury_rate': round(result['injured'] / result['population'] * 100, 2) if result['population'] > 0 else 0
+        },
+        'effect_radius_km': result['effect_radius_km'],
+        'grid': {key: result[key] for key in ('cells', 'cells_evaluated', 'missing_tiles', 'elapsed_ms') if key in result},
+        'parameters': damage_model.model_parameters(exposed_fraction)
+    }
+
+
+@bp.route('/api/population/casualties', methods=['POST'])
+def calculate_casualties_breakdown():
+    """
+    Calcula el desglose preciso de víctimas: fallecidos y heridos por zona de impacto.
+    
+    Con model='damage_function' usa el modelo continuo de damage_model.py
+    (sobrepresión y fluencia térmica) en lugar de las tasas fijas por zona.
+    """
+    try:
+        data = request.get_json()
+        cities = data.get('cities', [])
+        destruction_radius_km = data.get('destruction_radius_km', 5)
+        damage_radius_km = data.get('damage_radius_km', 15)
+        air_pressure_radius_km = data.get('air_pressure_radius_km', 22.5)
+        energy_megatons = data.get('energy_megatons', 1)
+        
+        if data.get('model') == 'damage_function':
+            return jsonify(calculate_damage_function_casualties(
+                data, [destruction_radius_km, damage_radius_km, air_pressure_radius_km]
+            ))
+        
+        print(f"\n💀 Calculando desglose de víctimas...")
+        print(f"   🔴 Radio destrucción: {destruction_radius_km} km")
+        print(f"   🟠 Radio daño: {damage_radius_km} km")
+        print(f"   🔵 Radio presión: {air_pressure_radius_km} km")
+        print(f"   💥 Energía: {energy_megatons} MT")
+        
+        # Clasificar ciudades por zona: 0 destrucción, 1 daño, 2 presión, 3 fuera de rango
+        distances = np.array([city.get('distancia_km', float('inf')) for city in cities], dtype=float)
+        populations = np.array([city.get('poblacion', 0) for city in cities], dtype=float)
+        zones = impact_zones.classify(distances, [destruction_radius_km, damage_radius_km, air_pressure_radius_km])
+        zone_population = impact_zones.zone_sums(zones, populations, 3)
+        zone_cities = impact_zones.zone_counts(zones, 3)
+        
+        print(f"\n🔍 Clasificando {len(cities)} ciudades por zonas:")
+        print(f"   🔴 Destrucción: {zone_cities[0]:,} ciudades")
+        print(f"   🟠 Daño: {zone_cities[1]:,} ciudades")
+        print(f"   🔵 Presión: {zone_cities[2]:,} ciudades")
+        print(f"   ⚪ Fuera de rango: {len(cities) - int(zone_cities.sum()):,} ciudades")
+        
+        # Tasas de mortalidad y lesiones basadas en estudios de impactos y explosiones nucleares
+        # Ajustadas por energía del impacto (más conservadoras y realistas)
+        energy_factor = min(1.3, 1 + (energy_megatons / 200))  # Factor más moderado
+        
+        # ZONA ROJA - Destrucción Total (cráter y área inmediata)
+        # Basado en estudios de Hiroshima/Nagasaki y modelos de impacto
+        destruction_fatality_rate = min(0.85, 0.70 * energy_factor)  # 70-85% fallecidos
+        destruction_injury_rate = 0.12  # 12% heridos graves
+        # Resto: 3-18% sobrevivientes sin lesiones graves
+        
+        # ZONA NARANJA - Daño Severo (ondas de choque, incendios)
+        damage_fatality_rate = min(0.50, 0.35 * energy_factor)  # 35-50% fallecidos
+        damage_injury_rate = 0.40  # 40% heridos
+        # Resto: 10-25% sobrevivientes o lesiones menores
+        
+        # ZONA AZUL - Presión de aire (ventanas rotas, estructuras dañadas)
+        pressure_fatality_rate = min(0.15, 0.08 * energy_factor)  # 8-15% fallecidos
+        pressure_injury_rate = 0.45  # 45% heridos
+        # Resto: 40-47% sin lesiones o lesiones muy menores
+        
+        # Calcular víctimas por zona
+        def calculate_zone_casualties(zone, fatality_rate, injury_rate, zone_name):
+            total_pop = float(zone_population[zone])
+            if total_pop.is_integer():
+                total_pop = int(total_pop)
+            deaths = round(total_pop * fatality_rate)
+            injured = round(total_pop * injury_rate)
+            survivors = total_pop - deaths - injured
+            
+            print(f"   {zone_name}:")
+            print(f"      Población: {total_pop:,}")
+            print(f"      Fallecidos: {deaths:,} ({fatality_rate*100:.1f}%)")
+            print(f"      Heridos: {injured:,} ({injury_rate*100:.1f}%)")
+            print(f"      Sobrevivientes: {survivors:,}")
+            
+            return {
+                'total_population': total_pop,
+                'deaths': deaths,
+                'injured': injured,
+                'survivors': survivors,
+                'cities_count': int(zone_cities[zone]),
+                'fatality_rate': round(fatality_rate * 100, 2),
+                'injury_rate': round(injury_rate * 100, 2)
+            }
+        
+        destruction_casualties = calculate_zone_casualties(
+            0, destruction_fatality_rate, destruction_injury_rate, "🔴 ZONA ROJA"
+        )
+        damage_casualties = calculate_zone_casualties(
+            1, damage_fatality_rate, damage_injury_rate, "🟠 ZONA NARANJA"
+        )
+        pressure_casualties = calculate_zone_casualties(
+            2, pressure_fatality_rate, pressure_injury_rate, "🔵 ZONA AZUL"
+        )
+        
+        # Totales
+        total_deaths = (destruction_casualties['deaths'] + 
+                       damage_casualties['deaths'] + 
+                       pressure_casualties['deaths'])
+        
+        total_injured = (destruction_casualties['injured'] + 
+                        damage_casualties['injured'] + 
+                        pressure_casualties['injured'])
+        
+        total_affected = total_deaths + total_injured
+        total_population = (destruction_casualties['total_population'] + 
+                          damage_casualties['total_population'] + 
+                          pressure_casualties['total_population'])
+        
+        print(f"\n📊 RESUMEN TOTAL:")
+        print(f"   👥 Población total: {total_population:,}")
+        print(f"   💀 Fallecidos: {total_deaths:,} ({(total_deaths/total_population*100 if total_population > 0 else 0):.1f}%)")
+        print(f"   🏥 Heridos: {total_injured:,} ({(total_injured/total_population*100 if total_population > 0 else 0):.1f}%)")
+        print(f"   📊 Total afectado: {total_affected:,}\n")
+        
+        return jsonify({
+            'success': True,
+            'breakdown': {
+                'destruction_zone': destruction_casualties,
+                'damage_zone': damage_casualties,
+                'air_pressure_zone': pressure_casualties
+            },
+            'totals': {
+                'total_population': total_population,
+                'total_deaths': total_deaths,
+                'total_injured': total_injured,
+                'total_affected': total_affected,
+                'overall_fatality_rate': round((total_deaths / total_population * 100) if total_population > 0 else 0, 2),
+                'overall_injury_rate': round((total_injured / total_population * 100) if total_population > 0 else 0, 2)
+            }
+        })
+        
+    except Exception as e:
+        print(f"❌ Error calculando desglose de víctimas: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+WORLDPOP_STATS_URL = "https://api.worldpop.org/v1/services/stats"
+WORLDPOP_DATASET = 'ppp_2020_1km_Aggregated'
+
+
+def _worldpop_request(data):
+    """Valida la petición de /api/population/worldpop: (lat, lon, zone_radii) o error"""
+    lat = data.get('latitude')
+    lon = data.get('longitude')
+    destruction_radius_km = data.get('destruction_radius_km', 5)
+    damage_radius_km = data.get('damage_radius_km', 15)
+    air_pressure_radius_km = data.get('air_pressure_radius_km', 22.5)
+    
+    if not lat or not lon:
+        return None, 'Latitud y longitud son requeridos'
+    
+    print(f"\n🌍 WorldPop API - Consultando población real...")
+    print(f"   📍 Coordenadas: ({lat}, {lon})")
+    print(f"   🔴 Radio destrucción: {destruction_radius_km} km")
+    print(f"   🟠 Radio daño: {damage_radius_km} km")
+    print(f"   🔵 Radio presión: {air_pressure_radius_km} km")
+    
+    zone_radii = [('destruction', destruction_radius_km), ('damage', damage_radius_km),
+                  ('air_pressure', air_pressure_radius_km)]
+    return (lat, lon, zone_radii), None
+
+
+def _worldpop_raster_result(data, lat, lon, zone_radii):
+    """Ráster local: todos los anillos en una pasada, sin restar círculos"""
+    radius_by_zone = dict(zone_radii)
+    destruction_radius_km = radius_by_zone['destruction']
+    damage_radius_km = radius_by_zone['damage']
+    air_pressure_radius_km = radius_by_zone['air_pressure']
+    extra_radii = [float(r) for r in data.get('radii_km', [])]
+    radii = sorted({radius for _, radius in zone_radii} | set(extra_radii))
+    exposure = POPULATION_RASTER.ring_exposure(lat, lon, radii)
+    within = dict(zip(radii, exposure['cumulative']))
+    
+    results = {
+        zone_name: {
+            'population': round(within[radius]),
+            'radius_km': radius,
+            'source': 'WorldPop (ráster local)'
+        }
+        for zone_name, radius in zone_radii
+    }
+    # Netos directamente de las sumas por anillo (sin redondear antes de restar)
+    total_destruction = round(within[destruction_radius_km])
+    net_damage = round(max(0, within[damage_radius_km] - within[destruction_radius_km]))
+    net_air_pressure = round(max(0, within[air_pressure_radius_km] - within[damage_radius_km]))
+    total_affected = round(within[max(destruction_radius_km, damage_radius_km, air_pressure_radius_km)])
+    
+    print(f"   ✅ Ráster local: {len(radii)} anillos, {exposure['cells']:,} celdas en {exposure['elapsed_ms']} ms")
+    print(f"   📊 TOTAL AFECTADO: {total_affected:,} personas\n")
+    
+    return {
+        'success': True,
+        'source': 'WorldPop (ráster local)',
+        'zones': results,
+        'totals': {
+            'destruction_zone': total_destruction,
+            'damage_zone_net': net_damage,
+            'air_pressure_zone_net': net_air_pressure,
+            'total_affected': round(total_affected)
+        },
+        'rings': [dict(ring, population=round(ring['population'])) for ring in exposure['rings']],
+        'raster': {
+            'cells': exposure['cells'],
+            'missing_tiles': exposure['missing_tiles'],
+            'elapsed_ms': exposure['elapsed_ms']
+        },
+        'coordinates': {'lat': lat, 'lon': lon}
+    }
+
+
+def _circle_geojson(center_lat, center_lon, radius_km, num_points=64):
+    """Crea un polígono circular aproximado en GeoJSON"""
+    points = []
+    
+    # Radio de la Tierra en km
+    earth_radius = 6371.0
+    
+    for i in range(num_points + 1):
+        angle = (2 * math.pi * i) / num_points
+        
+        # Calcular desplazamiento en grados
+        dx = radius_km / earth_radius
+        dy = radius_km / (earth_radius * math.cos(math.radians(center_lat)))
+        
+        point_lat = center_lat + (dx * math.sin(angle) * 180 / math.pi)
+        point_lon = center_lon + (dy * math.cos(angle) * 180 / math.pi)
+        
+        points.append([point_lon, point_lat])
+    
+    return {
+        "type": "Feature",
+        "properties": {},
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [points]
+        }
+    }
+
+
+def _worldpop_zone_query(lat, lon, zone_name, radius):
+    """Parámetros de la API de WorldPop y clave de caché de una zona"""
+    # Usar dataset de 2020 con resolución de 1km
+    params = {
+        'dataset': WORLDPOP_DATASET,
+        'geojson': json.dumps(_circle_geojson(lat, lon, radius))
+    }
+    print(f"   🔄 Consultando zona {zone_name} ({radius} km)...")
+    cache_params = {'lat': lat, 'lon': lon, 'radius_km': radius, 'dataset': params['dataset']}
+    return params, cache_params
+
+
+def _worldpop_zone_result(zone_name, radius, worldpop_response):
+    if worldpop_response['status_code'] == 200:
+        worldpop_data = worldpop_response['data']
+        
+        # Extraer población total del response
+        if 'data' in worldpop_data and worldpop_data['data']:
+            population = worldpop_data['data'].get('total_population', 0)
+            print(f"   ✅ {zone_name}: {round(population):,} personas")
+            return {
+                'population': round(population),
+                'radius_km': radius,
+                'source': 'WorldPop 2020'
+            }
+        print(f"   ⚠️ {zone_name}: Sin datos disponibles")
+        return {
+            'population': 0,
+            'radius_km': radius,
+            'source': 'WorldPop 2020',
+            'error': 'No data available'
+        }
+    print(f"   ❌ {zone_name}: Error HTTP {worldpop_response['status_code']}")
+    return {
+        'population': 0,
+        'radius_km': radius,
+        'error': f"HTTP {worldpop_response['status_code']}"
+    }
+
+
+def _worldpop_zone_error(zone_name, radius, zone_error):
+    print(f"   ❌ {zone_name}: {str(zone_error)}")
+    return {
+        'population': 0,
+        'radius_km': radius,
+        'error': str(zone_error)
+    }
+
+
+def _worldpop_api_result(lat, lon, results):
+    # Calcular totales
+    total_destruction = results.get('destruction', {}).get('population', 0)
+    total_damage = results.get('damage', {}).get('population', 0)
+    total_air_pressure = results.get('air_pressure', {}).get('population', 0)
+    
+    # Restar las zonas internas de las externas para evitar doble conteo
+    net_damage = max(0, total_damage - total_destruction)
+    net_air_pressure = max(0, total_air_pressure - total_damage)
+    
+    total_affected = total_destruction + net_damage + net_air_pressure
+    
+    print(f"\n📊 RESULTADOS WORLDPOP:")
+    print(f"   🔴 Zona destrucción: {total_destruction:,} personas")
+    print(f"   🟠 Zona daño (neto): {net_damage:,} personas")
+    print(f"   🔵 Zona presión (neto): {net_air_pressure:,} personas")
+    print(f"   📊 TOTAL AFECTADO: {total_affected:,} personas\n")
+    
+    return {
+        'success': True,
+        'source': 'WorldPop API 2020',
+        'zones': results,
+        'totals': {
+            'destruction_zone': total_destruction,
+            'damage_zone_net': net_damage,
+            'air_pressure_zone_net': net_air_pressure,
+            'total_affected': round(total_affected)
+        },
+        'coordinates': {'lat': lat, 'lon': lon}
+    }
+
+
+def _worldpop_failed(worldpop_response):
+    return worldpop_response['status_code'] != 200
+
+
+@bp.route('/api/population/worldpop', methods=['POST'])
+def get_worldpop_population():
+    """
+    Obtiene población real usando WorldPop API con datos de densidad poblacional.
+    
+    Si hay teselas de población locales (POPULATION_RASTER) se calculan todas
+    las zonas, y los anillos extra de radii_km, en una sola pasada; si no,
+    se consulta la API de WorldPop por zona.
+    """
+    try:
+        data = request.get_json()
+        query, error = _worldpop_request(data)
+        if error:
+            return jsonify({
+                'success': False,
+                'error': error
+            }), 400
+        lat, lon, zone_radii = query
+        
+        if POPULATION_RASTER.available:
+            return jsonify(_worldpop_raster_result(data, lat, lon, zone_radii))
+        
+        # Consultar WorldPop API para cada zona
+        results = {}
+        
+        for zone_name, radius in zone_radii:
+            try:
+                params, cache_params = _worldpop_zone_query(lat, lon, zone_name, radius)
+                
+                def fetch_worldpop():
+                    response = http_client.get(WORLDPOP_STATS_URL, params=params, timeout=30)
+                    return {
+                        'status_code': response.status_code,
+                        'data': response.json() if response.status_code == 200 else None
+                    }
+                
+                worldpop_response = GEO_CACHE.get_or_fetch(
+                    'worldpop', cache_params, fetch_worldpop, skip=_worldpop_failed
+                )
+                results[zone_name] = _worldpop_zone_result(zone_name, radius, worldpop_response)
+                    
+            except Exception as zone_error:
+                results[zone_name] = _worldpop_zone_error(zone_name, radius, zone_error)
+        
+        return jsonify(_worldpop_api_result(lat, lon, results))
+        
+    except Exception as e:
+        print(f"❌ Error en WorldPop API: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+async def get_worldpop_population_async(data):
+    """
+    /api/population/worldpop en la ruta ASGI: las tres zonas se consultan a
+    la vez en lugar de una tras otra. Devuelve (payload, status).
+    """
+    async def fetch_zone(zone_name, radius):
+        try:
+            params, cache_params = _worldpop_zone_query(lat, lon, zone_name, radius)
+            
+            async def fetch_worldpop():
+                response = await async_http_client.get(WORLDPOP_STATS_URL, params=params, timeout=30)
+                return {
+                    'status_code': response.status_code,
+                    'data': response.json() if response.status_code == 200 else None
+                }
+            
+            worldpop_response = await GEO_CACHE.get_or_fetch_async(
+                'worldpop', cache_params, fetch_worldpop, skip=_worldpop_failed
+            )
+            return _worldpop_zone_result(zone_name, radius, worldpop_response)
+        except Exception as zone_error:
+            return _worldpop_zone_error(zone_name, radius, zone_error)
+    
+    try:
+        query, error = _worldpop_request(data)
+        if error:
+            return {'success': False, 'error': error}, 400
+        lat, lon, zone_radii = query
+        
+        if POPULATION_RASTER.available:
+            return _worldpop_raster_result(data, lat, lon, zone_radii), 200
+        
+        zone_results = await asyncio.gather(*(fetch_zone(zone_name, radius) for zone_name, radius in zone_radii))
+        results = {zone_name: result for (zone_name, _), result in zip(zone_radii, zone_results)}
+        return _worldpop_api_result(lat, lon, results), 200
+        
+    except Exception as e:
+        print(f"❌ Error en WorldPop API: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return {'success': False, 'error': str(e)}, 500
@@ -0,0 +1,1048 @@
+"""
+Blueprint de informes.
+
+Análisis completo en paralelo (/api/analysis/full) y el informe científico
+en PDF, síncrono o como trabajo en segundo plano con caché de resultados.
+"""
+
+import math
+import time
+from datetime import datetime
+from io import BytesIO
+
+from flask import Blueprint, current_app, jsonify, request, send_file, Response, stream_with_context
+from report_jobs import create_manager_from_env as create_report_manager
+from stage_graph import Stage, StageSkipped, run_stages
+from services import ANALYSIS_DEADLINE_S, _ANALYSIS_EXECUTOR
+from blueprints.physics import (
+    correlate_impact_with_earthquakes, get_nasa_noaa_tsunami_analysis,
+    get_usgs_geographic_context, run_impact_simulation
+)
+from blueprints.population import get_cities
+from blueprints.biology import analyze_impact_flora_fauna
+
+
+bp = Blueprint('reports', __name__)
+
+
+def _call_view(app, view, path, payload):
+    """
+    Ejecuta un endpoint existente fuera de una petición HTTP y devuelve su JSON.
+    
+    Así cada etapa del análisis completo produce exactamente la misma
+    respuesta que el endpoint individual que llamaba el navegador.
+    """
+    with app.test_request_context(path, method='POST', json=payload):
+        response = app.make_response(view())
+    body = response.get_json()
+    if response.status_code >= 400 or not body or not body.get('success'):
+        raise RuntimeError((body or {}).get('error') or f'HTTP {response.status_code}')
+    return body
+
+
+def build_full_analysis_stages(params, app):
+    """
+    Grafo de etapas equivalente a la cadena de llamadas de static/js/main.js:
+    
+        context -> impact -> cities
+                          -> seismic
+                          -> tsunami (solo si el radio de destrucción < 200 km)
+                          -> flora_fauna
+    
+    El contexto geográfico se obtiene una sola vez y se comparte con la
+    simulación; las etapas posteriores solo necesitan sus radios y energía.
+    """
+    lat = float(params.get('latitude', 0))
+    lon = float(params.get('longitude', 0))
+    
+    def context_stage(results):
+        return get_usgs_geographic_context(lat, lon)
+    
+    def impact_stage(results):
+        return run_impact_simulation(params, usgs_context=results['context'])
+    
+    def cities_stage(results):
+        calc = results['impact']['calculations']
+        max_radius_km = max(calc['destruction_radius_km'], calc['damage_radius_km'] * 1.5)
+        return _call_view(app, get_cities, '/api/cities', {
+            'latitude': lat,
+            'longitude': lon,
+            'radius': max_radius_km * 1000
+        })
+    
+    def seismic_stage(results):
+        return _call_view(app, correlate_impact_with_earthquakes, '/api/usgs/earthquake-correlation', {
+            'impact_energy_megatons': results['impact']['calculations']['energy_megatons_tnt']
+        })
+    
+    def tsunami_stage(results):
+        calc = results['impact']['calculations']
+        if calc['destruction_radius_km'] >= 200:
+            raise StageSkipped('Radio de destrucción demasiado grande para el análisis costero')
+        return _call_view(app, get_nasa_noaa_tsunami_analysis, '/api/nasa-noaa/tsunami-analysis', {
+            'latitude': lat,
+            'longitude': lon,
+            'energy_megatons': calc['energy_megatons_tnt'],
+            'radius_km': min(200, calc['damage_radius_km'])
+        })
+    
+    def flora_fauna_stage(results):
+        calc = results['impact']['calculations']
+        return _call_view(app, analyze_impact_flora_fauna, '/api/impact/flora-fauna', {
+            'latitude': lat,
+            'longitude': lon,
+            'impact_radius_km': calc['damage_radius_km'],
+            'impact_energy_megatons': calc['energy_megatons_tnt'],
+            'destruction_radius_km': calc['destruction_radius_km']
+        })
+    
+    return [
+        Stage('context', context_stage),
+        Stage('impact', impact_stage, depends_on=['context']),
+        Stage('cities', cities_stage, depends_on=['impact']),
+        Stage('seismic', seismic_stage, depends_on=['impact']),
+        Stage('tsunami', tsunami_stage, depends_on=['impact']),
+        Stage('flora_fauna', flora_fauna_stage, depends_on=['impact'])
+    ]
+
+
+@bp.route('/api/analysis/full', methods=['POST'])
+def full_analysis():
+    """
+    Análisis completo del impacto en una sola petición.
+    
+    Sustituye la cadena secuencial del navegador (simulate/impact, cities,
+    earthquake-correlation, tsunami-analysis, flora-fauna) por un grafo de
+    etapas que se ejecutan en paralelo en cuanto sus dependencias terminan.
+    Cada etapa se transmite al completarse:
+    
+        format=ndjson (por defecto)  una línea JSON por evento
+        format=sse                   Server-Sent Events (event: <etapa>)
+    
+    El último evento es 'complete', con el estado y la duración de cada etapa.
+    """
+    data = request.get_json(silent=True) or {}
+    # Las etapas corren en hilos del pool, fuera del contexto de la aplicación
+    app = current_app._get_current_object()
+    
+    try:
+        float(data.get('latitude', 0))
+        float(data.get('longitude', 0))
+        stages = build_full_analysis_stages(data, app)
+    except (TypeError, ValueError) as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    stream_format = data.get('format')
+    if stream_format is None:
+        accepts_sse = 'text/event-stream' in request.headers.get('Accept', '')
+        stream_format = 'sse' if accepts_sse else 'ndjson'
+    if stream_format not in ('ndjson', 'sse'):
+        return jsonify({
+            'success': False,
+            'error': f'Formato desconocido: {stream_format}'
+        }), 400
+    
+    def encode(event):
+        payload = app.json.dumps(event)
+        if stream_format == 'sse':
+            return f"event: {event['stage']}\ndata: {payload}\n\n"
+        return payload + '\n'
+    
+    def generate():
+        start = time.perf_counter()
+        summary = {}
+        for event in run_stages(stages, _ANALYSIS_EXECUTOR, deadline_s=ANALYSIS_DEADLINE_S):
+            summary[event['stage']] = {
+                'status': event['status'],
+                'elapsed_ms': event['elapsed_ms']
+            }
+            yield encode(event)
+        
+        yield encode({
+            'stage': 'complete',
+            'status': 'ok' if summary.get('impact', {}).get('status') == 'ok' else 'error',
+            'elapsed_ms': round((time.perf_counter() - start) * 1000, 1),
+            'stages': summary
+        })
+    
+    mimetype = 'text/event-stream' if stream_format == 'sse' else 'application/x-ndjson'
+    return Response(
+        stream_with_context(generate()),
+        mimetype=mimetype,
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+def build_scientific_report_pdf(data):
+    """
+    Construye el reporte científico completo en PDF con todos los datos
+    del impacto asteroidal, análisis geológico, poblacional y ambiental.
+    
+    Devuelve los bytes del PDF. No depende del contexto de Flask, por lo que
+    se usa tanto en el endpoint síncrono como en los trabajos en segundo plano.
+    """
+    # ReportLab solo se importa al generar el primer informe
+    from reportlab.lib.pagesizes import letter, A4
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
+    from reportlab.lib import colors
+
+    # Extraer datos de entrada
+    impact_data = data.get('impact_data', {})
+    population_data = data.get('population_data', {})
+    trajectory_data = data.get('trajectory_data', {})
+    flora_fauna_data = data.get('flora_fauna_data', {})
+    mitigation_data = data.get('mitigation_data', {})
+    
+    # Crear buffer de memoria para el PDF
+    buffer = BytesIO()
+    
+    # Configurar documento con formato científico
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=0.75*inch,
+        leftMargin=0.75*inch,
+        topMargin=1*inch,
+        bottomMargin=0.75*inch
+    )
+    
+    # Estilos
+    styles = getSampleStyleSheet()
+    
+    # Estilo para título principal (sin colores)
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=18,
+        textColor=colors.black,
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    )
+    
+    # Estilo para encabezados de sección
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=14,
+        textColor=colors.black,
+        spaceAfter=12,
+        spaceBefore=12,
+        fontName='Helvetica-Bold'
+    )
+    
+    # Estilo para subencabezados
+    subheading_style = ParagraphStyle(
+        'CustomSubHeading',
+        parent=styles['Heading3'],
+        fontSize=11,
+        textColor=colors.black,
+        spaceAfter=6,
+        spaceBefore=6,
+        fontName='Helvetica-Bold'
+    )
+    
+    # Estilo para texto normal
+    normal_style = ParagraphStyle(
+        'CustomNormal',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=colors.black,
+        alignment=TA_JUSTIFY,
+        fontName='Helvetica'
+    )
+    
+    # Estilo para texto pequeño (metadatos)
+    small_style = ParagraphStyle(
+        'CustomSmall',
+        parent=styles['Normal'],
+        fontSize=8,
+        textColor=colors.black,
+        fontName='Helvetica'
+    )
+    
+    # Construir el contenido del PDF
+    story = []
+    
+    # ========== PORTADA ==========
+    story.append(Spacer(1, 0.5*inch))
+    story.append(Paragraph("INFORME CIENTÍFICO DE IMPACTO ASTEROIDAL", title_style))
+    story.append(Spacer(1, 0.3*inch))
+    
+    # Información del reporte
+    report_date = datetime.now().strftime("%d de %B de %Y, %H:%M UTC")
+    story.append(Paragraph(f"<b>Fecha del Informe:</b> {report_date}", normal_style))
+    story.append(Paragraph("<b>Institución:</b> NASA Near-Earth Object Research Program", normal_style))
+    story.append(Paragraph("<b>Clasificación:</b> Científico - Uso Académico", normal_style))
+    story.append(Spacer(1, 0.5*inch))
+    
+    # Resumen ejecutivo
+    story.append(Paragraph("RESUMEN EJECUTIVO", heading_style))
+    
+    if impact_data:
+        input_data = impact_data.get('input', {})
+        calc_data = impact_data.get('calculations', {})
+        
+        diameter = input_data.get('diameter_m', 0)
+        velocity = input_data.get('velocity_m_s', 0)
+        energy_mt = calc_data.get('energy_megatons_tnt', 0)
+        
+        summary_text = f"""
+        Este informe presenta un análisis exhaustivo del impacto de un asteroide de {diameter:.1f} metros 
+        de diámetro, viajando a una velocidad de {velocity:,.0f} m/s. El evento generaría una energía 
+        equivalente a {energy_mt:,.2f} megatones de TNT, con consecuencias significativas para la 
+        zona de impacto y regiones adyacentes. El análisis incluye modelado físico del impacto, 
+        evaluación geológica, estimación de víctimas, efectos ambientales y estrategias de mitigación.
+        """
+        story.append(Paragraph(summary_text, normal_style))
+    
+    story.append(PageBreak())
+    
+    # ========== ÍNDICE DE CONTENIDOS ==========
+    story.append(Paragraph("ÍNDICE DE CONTENIDOS", heading_style))
+    toc_items = [
+        "1. Parámetros del Asteroide",
+        "2. Modelado Físico del Impacto",
+        "3. Análisis Geográfico y Geológico",
+        "4. Efectos Sísmicos y Tsunamis",
+        "5. Evaluación de Víctimas y Población Afectada",
+        "6. Impacto Ambiental: Flora y Fauna",
+        "7. Trayectoria Orbital",
+        "8. Estrategias de Mitigación",
+        "9. Conclusiones y Recomendaciones",
+        "10. Metodología y Referencias"
+    ]
+    for item in toc_items:
+        story.append(Paragraph(item, normal_style))
+        story.append(Spacer(1, 6))
+    
+    story.append(PageBreak())
+    
+    # ========== SECCIÓN 1: PARÁMETROS DEL ASTEROIDE ==========
+    story.append(Paragraph("1. PARÁMETROS DEL ASTEROIDE", heading_style))
+    
+    if impact_data:
+        input_data = impact_data.get('input', {})
+        calc_data = impact_data.get('calculations', {})
+        comp_data = impact_data.get('composition_data', {})
+        
+        # Tabla de parámetros físicos
+        story.append(Paragraph("1.1 Características Físicas", subheading_style))
+        
+        asteroid_table_data = [
+            ['Parámetro', 'Valor', 'Unidad'],
+            ['Diámetro', f"{input_data.get('diameter_m', 0):,.2f}", 'm'],
+            ['Masa', f"{calc_data.get('mass_kg', 0):,.2e}", 'kg'],
+            ['Velocidad de Impacto', f"{input_data.get('velocity_m_s', 0):,.2f}", 'm/s'],
+            ['Ángulo de Entrada', f"{input_data.get('angle_deg', 0):.1f}", 'grados'],
+            ['Composición', input_data.get('composition', 'N/A'), ''],
+            ['Densidad del Material', f"{comp_data.get('density', 0):,.0f}", 'kg/m³'],
+        ]
+        
+        asteroid_table = Table(asteroid_table_data, colWidths=[3*inch, 2*inch, 1.5*inch])
+        asteroid_table.setStyle(TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
+        ]))
+        story.append(asteroid_table)
+        story.append(Spacer(1, 12))
+        
+        # Energía del impacto
+        story.append(Paragraph("1.2 Energía del Impacto", subheading_style))
+        
+        energy_joules = calc_data.get('energy_joules', 0)
+        energy_mt = calc_data.get('energy_megatons_tnt', 0)
+        
+        energy_table_data = [
+            ['Forma de Energía', 'Valor'],
+            ['Energía Cinética', f"{energy_joules:.2e} J"],
+            ['Equivalencia en TNT', f"{energy_mt:,.2f} Megatones"],
+            ['Equivalencia en Bombas Hiroshima', f"{energy_mt / 0.015:,.0f} bombas"],
+        ]
+        
+        energy_table = Table(energy_table_data, colWidths=[3.5*inch, 3*inch])
+        energy_table.setStyle(TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
+        ]))
+        story.append(energy_table)
+        story.append(Spacer(1, 12))
+        
+        # Características de la composición
+        if comp_data:
+            story.append(Paragraph("1.3 Composición y Propiedades del Material", subheading_style))
+            
+            comp_text = f"""
+            El asteroide presenta una composición de tipo {comp_data.get('name', 'N/A')}, 
+            caracterizada por {comp_data.get('description', 'N/A')}. Esta composición influye 
+            significativamente en la resistencia a la fragmentación atmosférica 
+            (factor: {comp_data.get('fragmentation_resistance', 0):.2f}) y en la probabilidad 
+            de penetración atmosférica intacta ({comp_data.get('atmospheric_penetration', 0)*100:.0f}%).
+            """
+            story.append(Paragraph(comp_text, normal_style))
+            story.append(Spacer(1, 12))
+    
+    story.append(PageBreak())
+    
+    # ========== SECCIÓN 2: MODELADO FÍSICO DEL IMPACTO ==========
+    story.append(Paragraph("2. MODELADO FÍSICO DEL IMPACTO", heading_style))
+    
+    if impact_data:
+        calc_data = impact_data.get('calculations', {})
+        
+        story.append(Paragraph("2.1 Formación del Cráter", subheading_style))
+        
+        crater_diameter = calc_data.get('crater_diameter_m', 0)
+        crater_text = f"""
+        El impacto generará un cráter con un diámetro de {crater_diameter:,.2f} metros. 
+        Este cálculo se basa en la ecuación de escalamiento de cráteres de impacto, que 
+        considera la energía cinética, el ángulo de impacto, y las propiedades del material 
+        del proyectil y del terreno objetivo.
+        """
+        story.append(Paragraph(crater_text, normal_style))
+        story.append(Spacer(1, 12))
+        
+        crater_table_data = [
+            ['Parámetro del Cráter', 'Valor'],
+            ['Diámetro del Cráter', f"{crater_diameter:,.2f} m"],
+            ['Profundidad Estimada (1/3 diámetro)', f"{crater_diameter/3:,.2f} m"],
+            ['Volumen de Eyecta', f"{(math.pi * (crater_diameter/2)**2 * (crater_diameter/3)):,.2e} m³"],
+            ['Radio de Destrucción Total', f"{calc_data.get('destruction_radius_km', 0):,.2f} km"],
+            ['Radio de Daño Severo', f"{calc_data.get('damage_radius_km', 0):,.2f} km"],
+        ]
+        
+        crater_table = Table(crater_table_data, colWidths=[3.5*inch, 3*inch])
+        crater_table.setStyle(TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
+        ]))
+        story.append(crater_table)
+        story.append(Spacer(1, 12))
+        
+        # Efectos de onda de choque
+        story.append(Paragraph("2.2 Onda de Choque y Sobrepresión", subheading_style))
+        
+        secondary_effects = impact_data.get('secondary_effects', [])
+        blast_wave = next((e for e in secondary_effects if e.get('type') == 'blast_wave'), None)
+        
+        if blast_wave:
+            blast_text = f"""
+            La onda de choque atmosférica se propagará con una sobrepresión máxima de 
+            {blast_wave.get('overpressure_psi', 0):,.0f} PSI en el punto cero. Esta sobrepresión 
+            es suficiente para causar {blast_wave.get('description', 'daños significativos')}.
+            """
+            story.append(Paragraph(blast_text, normal_style))
+            story.append(Spacer(1, 12))
+    
+    story.append(PageBreak())
+    
+    # ========== SECCIÓN 3: ANÁLISIS GEOGRÁFICO Y GEOLÓGICO ==========
+    story.append(Paragraph("3. ANÁLISIS GEOGRÁFICO Y GEOLÓGICO", heading_style))
+    
+    if impact_data:
+        input_data = impact_data.get('input', {})
+        usgs_context = impact_data.get('usgs_context', {})
+        
+        story.append(Paragraph("3.1 Localización del Impacto", subheading_style))
+        
+        impact_loc = input_data.get('impact_location', {})
+        lat = impact_loc.get('lat', 0)
+        lon = impact_loc.get('lon', 0)
+        
+        location_table_data = [
+            ['Coordenada', 'Valor'],
+            ['Latitud', f"{lat:.6f}°"],
+            ['Longitud', f"{lon:.6f}°"],
+            ['Región', usgs_context.get('location_name', 'N/A')],
+            ['País', usgs_context.get('country', 'N/A')],
+        ]
+        
+        location_table = Table(location_table_data, colWidths=[2.5*inch, 4*inch])
+        location_table.setStyle(TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
+        ]))
+        story.append(location_table)
+        story.append(Spacer(1, 12))
+        
+        # Características geológicas
+        story.append(Paragraph("3.2 Características Geológicas del Sitio", subheading_style))
+        
+        elevation_data = usgs_context.get('elevation', {})
+        tectonic_data = usgs_context.get('tectonic_context', {})
+        
+        geological_table_data = [
+            ['Parámetro Geológico', 'Valor'],
+            ['Elevación', f"{elevation_data.get('elevation_m', 0):,.1f} m"],
+            ['Tipo de Terreno', elevation_data.get('terrain_type', 'N/A')],
+            ['Entorno', 'Oceánico' if elevation_data.get('is_oceanic', False) else 'Continental'],
+            ['Distancia a la Costa', f"{usgs_context.get('coastal_distance_km', 0):,.1f} km"],
+            ['Zona Tectónica', tectonic_data.get('zone_type', 'N/A')],
+            ['Placa Tectónica', tectonic_data.get('plate', 'N/A')],
+            ['Actividad Sísmica Regional', tectonic_data.get('seismic_activity', 'N/A')],
+        ]
+        
+        geological_table = Table(geological_table_data, colWidths=[3*inch, 3.5*inch])
+        geological_table.setStyle(TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
+        ]))
+        story.append(geological_table)
+        story.append(Spacer(1, 12))
+    
+    story.append(PageBreak())
+    
+    # ========== SECCIÓN 4: EFECTOS SÍSMICOS Y TSUNAMIS ==========
+    story.append(Paragraph("4. EFECTOS SÍSMICOS Y TSUNAMIS", heading_style))
+    
+    if impact_data:
+        calc_data = impact_data.get('calculations', {})
+        secondary_effects = impact_data.get('secondary_effects', [])
+        
+        story.append(Paragraph("4.1 Actividad Sísmica Inducida", subheading_style))
+        
+        magnitude = calc_data.get('seismic_magnitude', 0)
+        seismic_text = f"""
+        El impacto generará ondas sísmicas equivalentes a un terremoto de magnitud {magnitude:.1f} 
+        en la escala de Richter. Esta energía sísmica se propagará a través de la corteza terrestre, 
+        pudiendo ser detectada por estaciones sismográficas a nivel global.
+        """
+        story.append(Paragraph(seismic_text, normal_style))
+        story.append(Spacer(1, 12))
+        
+        # Tabla de efectos sísmicos
+        seismic_extended = next((e for e in secondary_effects if e.get('type') == 'seismic_extended'), None)
+        if seismic_extended:
+            seismic_table_data = [
+                ['Parámetro Sísmico', 'Valor'],
+                ['Magnitud', f"M{magnitude:.1f}"],
+                ['Escala Mercalli', seismic_extended.get('mercalli_intensity', 'N/A')],
+                ['Radio de Percepción', f"{seismic_extended.get('perception_radius_km', 0):,.0f} km"],
+                ['Duración Estimada', f"{seismic_extended.get('duration_seconds', 0):.0f} segundos"],
+            ]
+            
+            seismic_table = Table(seismic_table_data, colWidths=[3*inch, 3.5*inch])
+            seismic_table.setStyle(TableStyle([
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
+            ]))
+            story.append(seismic_table)
+            story.append(Spacer(1, 12))
+        
+        # Análisis de tsunami
+        story.append(Paragraph("4.2 Riesgo de Tsunami", subheading_style))
+        
+        tsunami_data = calc_data.get('tsunami', {})
+        tsunami_risk = tsunami_data.get('risk_level', 'none')
+        
+        if tsunami_risk != 'none':
+            tsunami_text = f"""
+            Dado que el impacto ocurre en un entorno {elevation_data.get('terrain_type', 'N/A')}, 
+            existe un riesgo {tsunami_risk} de generación de tsunami. La altura estimada de las olas 
+            es de {tsunami_data.get('wave_height_m', 0):,.1f} metros, con un potencial de alcance 
+            de hasta {tsunami_data.get('affected_coastline_km', 0):,.0f} km de costa.
+            """
+            story.append(Paragraph(tsunami_text, normal_style))
+            story.append(Spacer(1, 12))
+            
+            tsunami_table_data = [
+                ['Parámetro de Tsunami', 'Valor'],
+                ['Nivel de Riesgo', tsunami_risk.upper()],
+                ['Altura de Ola Estimada', f"{tsunami_data.get('wave_height_m', 0):,.1f} m"],
+                ['Velocidad de Propagación', f"{tsunami_data.get('propagation_speed_kmh', 0):,.0f} km/h"],
+                ['Tiempo de Llegada a Costa', f"{tsunami_data.get('time_to_coast_hours', 0):.1f} horas"],
+                ['Distancia de Inundación', f"{tsunami_data.get('inundation_distance_km', 0):,.1f} km"],
+            ]
+            
+            tsunami_table = Table(tsunami_table_data, colWidths=[3*inch, 3.5*inch])
+            tsunami_table.setStyle(TableStyle([
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
+            ]))
+            story.append(tsunami_table)
+        else:
+            story.append(Paragraph("El riesgo de tsunami es nulo o insignificante para este escenario.", normal_style))
+        story.append(Spacer(1, 12))
+    
+    story.append(PageBreak())
+    
+    # ========== SECCIÓN 5: EVALUACIÓN DE VÍCTIMAS ==========
+    story.append(Paragraph("5. EVALUACIÓN DE VÍCTIMAS Y POBLACIÓN AFECTADA", heading_style))
+    
+    if population_data:
+        story.append(Paragraph("5.1 Análisis Demográfico", subheading_style))
+        
+        total_affected = population_data.get('total_population_affected', 0)
+        casualties = population_data.get('casualties', {})
+        
+        pop_text = f"""
+        Según los modelos de densidad poblacional basados en datos de WorldPop y censos locales, 
+        se estima que {total_affected:,} personas se encuentran dentro del radio de impacto directo.
+        """
+        story.append(Paragraph(pop_text, normal_style))
+        story.append(Spacer(1, 12))
+        
+        # Tabla de víctimas por zona
+        casualties_table_data = [['Zona de Impacto', 'Población', 'Fallecidos', 'Heridos Graves', 'Heridos Leves']]
+        
+        if casualties:
+            for zone, data in casualties.items():
+                casualties_table_data.append([
+                    zone.replace('_', ' ').title(),
+                    f"{data.get('population', 0):,}",
+                    f"{data.get('deaths', 0):,}",
+                    f"{data.get('severe_injuries', 0):,}",
+                    f"{data.get('minor_injuries', 0):,}"
+                ])
+        
+        if len(casualties_table_data) > 1:
+            casualties_table = Table(casualties_table_data, colWidths=[1.5*inch, 1.2*inch, 1.2*inch, 1.3*inch, 1.3*inch])
+            casualties_table.setStyle(TableStyle([
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, -1), 8),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
+            ]))
+            story.append(casualties_table)
+            story.append(Spacer(1, 12))
+        
+        # Resumen de víctimas
+        story.append(Paragraph("5.2 Resumen de Víctimas", subheading_style))
+        
+        total_deaths = sum(data.get('deaths', 0) for data in casualties.values())
+        total_severe = sum(data.get('severe_injuries', 0) for data in casualties.values())
+        total_minor = sum(data.get('minor_injuries', 0) for data in casualties.values())
+        
+        summary_table_data = [
+            ['Categoría', 'Número de Personas', 'Porcentaje'],
+            ['Fallecidos', f"{total_deaths:,}", f"{(total_deaths/max(total_affected, 1)*100):.2f}%"],
+            ['Heridos Graves', f"{total_severe:,}", f"{(total_severe/max(total_affected, 1)*100):.2f}%"],
+            ['Heridos Leves', f"{total_minor:,}", f"{(total_minor/max(total_affected, 1)*100):.2f}%"],
+            ['Total Afectados', f"{total_affected:,}", "100.00%"],
+        ]
+        
+        summary_table = Table(summary_table_data, colWidths=[2.5*inch, 2.5*inch, 1.5*inch])
+        summary_table.setStyle(TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
+        ]))
+        story.append(summary_table)
+        story.append(Spacer(1, 12))
+    
+    story.append(PageBreak())
+    
+    # ========== SECCIÓN 6: IMPACTO AMBIENTAL ==========
+    story.append(Paragraph("6. IMPACTO AMBIENTAL: FLORA Y FAUNA", heading_style))
+    
+    if flora_fauna_data and flora_fauna_data.get('success'):
+        story.append(Paragraph("6.1 Biodiversidad Afectada", subheading_style))
+        
+        biodiversity = flora_fauna_data.get('biodiversity_summary', {})
+        
+        bio_text = f"""
+        El análisis de biodiversidad basado en datos de GBIF (Global Biodiversity Information Facility) 
+        indica que {biodiversity.get('total_species', 0)} especies han sido registradas en el área de impacto.
+        """
+        story.append(Paragraph(bio_text, normal_style))
+        story.append(Spacer(1, 12))
+        
+        # Tabla de especies por categoría
+        species_table_data = [
+            ['Categoría', 'Número de Especies', 'Especies en Peligro'],
+            ['Plantas', f"{biodiversity.get('plant_species', 0)}", f"{biodiversity.get('endangered_plants', 0)}"],
+            ['Animales', f"{biodiversity.get('animal_species', 0)}", f"{biodiversity.get('endangered_animals', 0)}"],
+            ['Aves', f"{biodiversity.get('bird_species', 0)}", f"{biodiversity.get('endangered_birds', 0)}"],
+            ['Total', f"{biodiversity.get('total_species', 0)}", f"{biodiversity.get('total_endangered', 0)}"],
+        ]
+        
+        species_table = Table(species_table_data, colWidths=[2.5*inch, 2*inch, 2*inch])
+        species_table.setStyle(TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
+        ]))
+        story.append(species_table)
+        story.append(Spacer(1, 12))
+        
+        # Efectos ambientales
+        story.append(Paragraph("6.2 Efectos Ambientales Proyectados", subheading_style))
+        
+        environmental_effects = flora_fauna_data.get('environmental_impact', {})
+        
+        env_effects_data = [
+            ['Efecto', 'Magnitud', 'Duración'],
+            ['Pérdida de Hábitat', f"{environmental_effects.get('habitat_loss_percent', 0):.1f}%", 
+             environmental_effects.get('recovery_time', 'N/A')],
+            ['Extinción Local', f"{environmental_effects.get('local_extinctions', 0)} especies", 'Permanente'],
+            ['Contaminación del Suelo', environmental_effects.get('soil_contamination', 'N/A'), 
+             environmental_effects.get('soil_recovery', 'N/A')],
+            ['Alteración del Clima Local', environmental_effects.get('climate_impact', 'N/A'), 
+             environmental_effects.get('climate_duration', 'N/A')],
+        ]
+        
+        env_table = Table(env_effects_data, colWidths=[2.5*inch, 2*inch, 2*inch])
+        env_table.setStyle(TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
+        ]))
+        story.append(env_table)
+        story.append(Spacer(1, 12))
+    
+    story.append(PageBreak())
+    
+    # ========== SECCIÓN 7: TRAYECTORIA ORBITAL ==========
+    story.append(Paragraph("7. TRAYECTORIA ORBITAL", heading_style))
+    
+    if trajectory_data:
+        story.append(Paragraph("7.1 Elementos Orbitales", subheading_style))
+        
+        orbit = trajectory_data.get('orbital_elements', {})
+        
+        orbital_text = f"""
+        La trayectoria del asteroide se caracteriza por los siguientes elementos orbitales keplerianos, 
+        que permiten predecir con precisión su posición y velocidad en cualquier momento.
+        """
+        story.append(Paragraph(orbital_text, normal_style))
+        story.append(Spacer(1, 12))
+        
+        orbital_table_data = [
+            ['Elemento Orbital', 'Valor', 'Descripción'],
+            ['Semieje Mayor (a)', f"{orbit.get('semi_major_axis_km', 0):,.0f} km", 'Tamaño de la órbita'],
+            ['Excentricidad (e)', f"{orbit.get('eccentricity', 0):.4f}", 'Forma de la órbita'],
+            ['Inclinación (i)', f"{orbit.get('inclination_deg', 0):.2f}°", 'Ángulo con la eclíptica'],
+            ['Periodo Orbital', f"{orbit.get('orbital_period_days', 0):.1f} días", 'Tiempo de una órbita completa'],
+            ['Velocidad Orbital', f"{orbit.get('orbital_velocity_kms', 0):.2f} km/s", 'Velocidad media'],
+        ]
+        
+        orbital_table = Table(orbital_table_data, colWidths=[2*inch, 2*inch, 2.5*inch])
+        orbital_table.setStyle(TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
+        ]))
+        story.append(orbital_table)
+        story.append(Spacer(1, 12))
+        
+        # Distancias y aproximación
+        story.append(Paragraph("7.2 Parámetros de Aproximación", subheading_style))
+        
+        approach_table_data = [
+            ['Parámetro', 'Valor'],
+            ['Distancia Mínima a la Tierra', f"{trajectory_data.get('minimum_earth_distance_km', 0):,.0f} km"],
+            ['Velocidad Relativa', f"{trajectory_data.get('relative_velocity_kms', 0):.2f} km/s"],
+            ['Ángulo de Aproximación', f"{trajectory_data.get('approach_angle_deg', 0):.1f}°"],
+        ]
+        
+        approach_table = Table(approach_table_data, colWidths=[3.5*inch, 3*inch])
+        approach_table.setStyle(TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
+        ]))
+        story.append(approach_table)
+        story.append(Spacer(1, 12))
+    
+    story.append(PageBreak())
+    
+    # ========== SECCIÓN 8: ESTRATEGIAS DE MITIGACIÓN ==========
+    story.append(Paragraph("8. ESTRATEGIAS DE MITIGACIÓN", heading_style))
+    
+    if mitigation_data:
+        story.append(Paragraph("8.1 Estrategia Primaria Recomendada", subheading_style))
+        
+        primary = mitigation_data.get('primary_strategy', {})
+        
+        if primary:
+            primary_text = f"""
+            <b>Método:</b> {primary.get('method', 'N/A')}<br/>
+            <b>Descripción:</b> {primary.get('description', 'N/A')}<br/>
+            <b>Efectividad:</b> {primary.get('effectiveness', 0):.1f}%<br/>
+            <b>Probabilidad de Éxito:</b> {primary.get('success_probability', 0):.1f}%<br/>
+            <b>Costo Estimado:</b> ${primary.get('cost_billions', 0):.1f} mil millones USD<br/>
+            <b>Tiempo Requerido:</b> {primary.get('time_required_years', 0):.1f} años<br/>
+            """
+            story.append(Paragraph(primary_text, normal_style))
+            story.append(Spacer(1, 12))
+        
+        # Estrategias alternativas
+        story.append(Paragraph("8.2 Estrategias Alternativas", subheading_style))
+        
+        alternatives = mitigation_data.get('alternative_strategies', [])
+        
+        if alternatives:
+            alt_table_data = [['Método', 'Efectividad', 'Costo ($ mil millones)', 'Tiempo (años)']]
+            
+            for alt in alternatives[:5]:  # Máximo 5 alternativas
+                alt_table_data.append([
+                    alt.get('method', 'N/A'),
+                    f"{alt.get('effectiveness', 0):.1f}%",
+                    f"${alt.get('cost_billions', 0):.1f}",
+                    f"{alt.get('time_required_years', 0):.1f}"
+                ])
+            
+            alt_table = Table(alt_table_data, colWidths=[2.5*inch, 1.5*inch, 1.5*inch, 1*inch])
+            alt_table.setStyle(TableStyle([
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, -1), 8),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
+            ]))
+            story.append(alt_table)
+            story.append(Spacer(1, 12))
+    
+    story.append(PageBreak())
+    
+    # ========== SECCIÓN 9: CONCLUSIONES ==========
+    story.append(Paragraph("9. CONCLUSIONES Y RECOMENDACIONES", heading_style))
+    
+    conclusions_text = """
+    Este análisis exhaustivo del impacto asteroidal proporciona una evaluación científica rigurosa 
+    de las consecuencias potenciales. Los resultados destacan la importancia crítica de:
+    <br/><br/>
+    1. <b>Detección Temprana:</b> La identificación anticipada de objetos potencialmente peligrosos 
+    permite mayor tiempo de preparación y mitigación.<br/><br/>
+    2. <b>Sistemas de Alerta:</b> Es esencial mantener redes de monitoreo continuo y sistemas de 
+    comunicación internacional para coordinar respuestas.<br/><br/>
+    3. <b>Preparación Civil:</b> Las autoridades locales deben desarrollar planes de evacuación y 
+    respuesta de emergencia basados en estos análisis.<br/><br/>
+    4. <b>Cooperación Internacional:</b> La mitigación de amenazas asteroidales requiere 
+    colaboración global entre agencias espaciales y gobiernos.<br/><br/>
+    5. <b>Investigación Continua:</b> Se recomienda continuar con estudios de caracterización 
+    de asteroides y desarrollo de tecnologías de deflexión.
+    """
+    story.append(Paragraph(conclusions_text, normal_style))
+    story.append(Spacer(1, 12))
+    
+    story.append(PageBreak())
+    
+    # ========== SECCIÓN 10: METODOLOGÍA ==========
+    story.append(Paragraph("10. METODOLOGÍA Y REFERENCIAS", heading_style))
+    
+    story.append(Paragraph("10.1 Modelos Utilizados", subheading_style))
+    
+    methodology_text = """
+    Este informe se basa en modelos físicos y matemáticos validados por la comunidad científica:<br/><br/>
+    <b>• Energía de Impacto:</b> Calculada mediante E = 1/2 × m × v², donde m es la masa del asteroide 
+    y v su velocidad relativa.<br/><br/>
+    <b>• Formación de Cráter:</b> Ecuación de escalamiento de Collins et al. (2005), ajustada por 
+    ángulo de impacto y propiedades del terreno.<br/><br/>
+    <b>• Magnitud Sísmica:</b> Relación de Krinov (1960) entre energía de impacto y magnitud de 
+    momento sísmico.<br/><br/>
+    <b>• Modelado de Tsunami:</b> Ecuaciones hidrodinámicas de aguas someras (Shallow Water Equations) 
+    para impactos oceánicos.<br/><br/>
+    <b>• Datos Poblacionales:</b> WorldPop dataset (www.worldpop.org) y censos nacionales.<br/><br/>
+    <b>• Biodiversidad:</b> GBIF (Global Biodiversity Information Facility) - www.gbif.org
+    """
+    story.append(Paragraph(methodology_text, normal_style))
+    story.append(Spacer(1, 12))
+    
+    story.append(Paragraph("10.2 Referencias Científicas", subheading_style))
+    
+    references = [
+        "Collins, G. S., Melosh, H. J., & Marcus, R. A. (2005). Earth Impact Effects Program. Meteoritics & Planetary Science, 40(6), 817-840.",
+        "Chapman, C. R., & Morrison, D. (1994). Impacts on the Earth by asteroids and comets: assessing the hazard. Nature, 367(6458), 33-40.",
+        "Holsapple, K. A. (1993). The scaling of impact processes in planetary sciences. Annual Review of Earth and Planetary Sciences, 21(1), 333-373.",
+        "Krinov, E. L. (1960). Principles of Meteoritics. Pergamon Press, Oxford.",
+        "NASA NEO Program (2024). Near-Earth Object Observations Program. JPL/NASA.",
+        "USGS Earthquake Hazards Program (2024). https://earthquake.usgs.gov/",
+        "WorldPop Project (2024). Global High Resolution Population Denominators. University of Southampton.",
+        "GBIF Secretariat (2024). Global Biodiversity Information Facility. https://www.gbif.org/"
+    ]
+    
+    for i, ref in enumerate(references, 1):
+        story.append(Paragraph(f"[{i}] {ref}", small_style))
+        story.append(Spacer(1, 6))
+    
+    story.append(Spacer(1, 24))
+    
+    # Pie de página final
+    story.append(Paragraph("_______________________________________________", normal_style))
+    story.append(Spacer(1, 12))
+    footer_text = f"""
+    <b>Generado:</b> {datetime.now().strftime("%d/%m/%Y %H:%M:%S UTC")}<br/>
+    <b>Versión del Modelo:</b> 2.5.1<br/>
+    <b>Software:</b> Asteroid Impact Simulator - NASA Hackathon 2025<br/>
+    <b>Contacto:</b> neo.program@nasa.gov<br/>
+    <b>Clasificación:</b> Documento Científico - Uso Académico y de Investigación
+    """
+    story.append(Paragraph(footer_text, small_style))
+    
+    # Construir PDF
+    doc.build(story)
+    
+    return buffer.getvalue()
+
+
+# Renderizado de reportes en segundo plano con caché por hash del contenido
+REPORT_JOBS = create_report_manager(build_scientific_report_pdf)
+
+
+def _report_filename():
+    return f"Informe_Impacto_Asteroidal_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+
+
+def _report_job_response(job, cached=False):
+    job_id = job['job_id']
+    return {
+        'success': True,
+        'job_id': job_id,
+        'status': job['status'],
+        'content_hash': job['content_hash'],
+        'cached': cached,
+        'error': job['error'],
+        'status_url': f'/api/generate-scientific-report/jobs/{job_id}',
+        'download_url': f'/api/generate-scientific-report/jobs/{job_id}/download'
+    }
+
+
+@bp.route('/api/generate-scientific-report', methods=['POST'])
+def generate_scientific_report():
+    """
+    Genera el reporte científico en PDF de forma síncrona.
+    Si ya se generó un PDF para el mismo contenido se sirve desde caché.
+    """
+    try:
+        pdf_bytes = REPORT_JOBS.render_sync(request.json or {})
+        
+        return send_file(
+            BytesIO(pdf_bytes),
+            mimetype='application/pdf',
+            as_attachment=True,
+            download_name=_report_filename()
+        )
+    
+    except Exception as e:
+        print(f"Error generando reporte científico: {e}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@bp.route('/api/generate-scientific-report/jobs', methods=['POST'])
+def submit_scientific_report_job():
+    """
+    Encola la generación del reporte científico y responde al instante (202)
+    con el identificador del trabajo. El PDF se descarga desde download_url
+    cuando el estado es 'done'.
+    """
+    try:
+        job, cached = REPORT_JOBS.submit(request.json or {})
+        return jsonify(_report_job_response(job, cached)), 202
+    
+    except Exception as e:
+        print(f"Error encolando reporte científico: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@bp.route('/api/generate-scientific-report/jobs/<job_id>', methods=['GET'])
+def get_scientific_report_job(job_id):
+    """Estado de un trabajo de reporte: queued, running, done o error"""
+    job = REPORT_JOBS.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': 'Trabajo no encontrado'
+        }), 404
+    return jsonify(_report_job_response(job))
+
+
+@bp.route('/api/generate-scientific-report/jobs/<job_id>/download', methods=['GET'])
+def download_scientific_report_job(job_id):
+    """Descarga el PDF de un trabajo terminado"""
+    job = REPORT_JOBS.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': 'Trabajo no encontrado'
+        }), 404
+    if job['status'] != 'done':
+        return jsonify({
+            'success': False,
+            'status': job['status'],
+            'error': job['error'] or 'El reporte aún no está listo'
+        }), 409
+    
+    pdf_bytes = REPORT_JOBS.result(job_id)
+    if pdf_bytes is None:
+        return jsonify({
+            'success': False,
+            'error': 'El PDF ya no está en caché; vuelva a enviar el trabajo'
+        }), 410
+    
+    return send_file(
+        BytesIO(pdf_bytes),
+        mimetype='application/pdf',
+        as_attachment=True,
+        download_name=_report_filename()
+    )
+
+
+@bp.route('/api/generate-scientific-report/jobs/stats', methods=['GET'])
+def scientific_report_job_stats():
+    """Contadores de trabajos y de la caché de PDF"""
+    return jsonify({
+        'success': True,
+        'reports': REPORT_JOBS.stats()
+    })
@@ -0,0 +1,242 @@
+"""
+Modelo continuo de víctimas por funciones de daño.
+
+Sustituye las tres zonas escalonadas de /api/population/casualties (tasas
+fijas por zona) por curvas de probabilidad evaluadas en cada celda del
+ráster de población (population_raster.py) o, sin ráster, en cada ciudad.
+
+Física (impacto en superficie, Collins et al. 2005, "Earth Impact Effects
+Program"):
+    Sobrepresión pico   p(r) = p_x·r_x / (4·r1) · (1 + 3·(r_x / r1)^1.3)
+                        con r1 = r / E_kt^(1/3), p_x = 75 kPa, r_x = 290 m
+    Fluencia térmica    Φ(r) = η·E / (2π·r²), η = 3·10⁻³, r >= radio de la
+                        bola de fuego R_f = 0.002·E_J^(1/3) m
+
+Vulnerabilidad: curvas lognormales P = Φ_N(ln(x / x50) / σ) ajustadas a
+las reglas de la OTA (1979) para sobrepresión (>12 psi ≈ 98 % fallecidos,
+5-12 psi ≈ 50 %, 2-5 psi ≈ 5 % fallecidos y 45 % heridos) y a los umbrales
+de quemaduras de 2º/3er grado para la fluencia. Solo la fracción expuesta
+de la población (exterior o tras ventanas) sufre el efecto térmico.
+Fallecidos y víctimas (fallecidos + heridos) se combinan como sucesos
+independientes: P = 1 − (1 − P_onda)·(1 − P_térmica).
+"""
+
+import math
+import time
+
+from lazy_imports import lazy_import
+from population_raster import distance_from_term, haversine_term
+
+np = lazy_import('numpy')
+
+
+MT_TNT_J = 4.184e15
+OVERPRESSURE_PX_PA = 75000.0
+OVERPRESSURE_RX_M = 290.0
+LUMINOUS_EFFICIENCY = 3e-3
+
+# (mediana, σ logarítmica) de cada curva
+BLAST_FATALITY = (48.0, 0.45)        # kPa (≈7 psi)
+BLAST_CASUALTY = (20.0, 1.0)         # kPa (≈3 psi)
+THERMAL_FATALITY = (840.0, 0.5)      # kJ/m² (≈20 cal/cm²)
+THERMAL_CASUALTY = (250.0, 0.5)      # kJ/m² (≈6 cal/cm², quemaduras de 2º grado)
+DEFAULT_EXPOSED_FRACTION = 0.25
+
+MIN_PROBABILITY = 1e-3               # Define el radio de efecto
+MAX_EFFECT_RADIUS_KM = 2500.0
+# Puntos de la tabla de probabilidades por distancia de grid_casualties:
+# error < 1e-4 por celda y < 1e-7 relativo en los totales
+PROBABILITY_TABLE_SIZE = 16384
+
+
+def _normal_cdf(z):
+    """Φ_N(z) con la aproximación 7.1.26 de Abramowitz y Stegun (error < 1.5·10⁻⁷)"""
+    z = np.asarray(z, dtype=float)
+    x = np.abs(z) / math.sqrt(2)
+    t = 1 / (1 + 0.3275911 * x)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1 - poly * np.exp(-x * x)
+    return 0.5 * (1 + np.sign(z) * erf)
+
+
+def lognormal_probability(value, curve):
+    median, sigma = curve
+    with np.errstate(divide='ignore'):
+        return _normal_cdf(np.log(np.maximum(value, 1e-30) / median) / sigma)
+
+
+def peak_overpressure_kpa(distance_km, energy_mt):
+    """Sobrepresión pico (kPa) a distance_km de un impacto de energy_mt megatones"""
+    scaled_m = np.maximum(np.asarray(distance_km, dtype=float) * 1000, 1.0) / (energy_mt * 1000) ** (1 / 3)
+    ratio = OVERPRESSURE_RX_M / scaled_m
+    return OVERPRESSURE_PX_PA * ratio / 4 * (1 + 3 * ratio ** 1.3) / 1000
+
+
+def thermal_fluence_kj_m2(distance_km, energy_mt):
+    """Fluencia térmica (kJ/m²); dentro de la bola de fuego se satura"""
+    energy_j = energy_mt * MT_TNT_J
+    fireball_m = 0.002 * energy_j ** (1 / 3)
+    distance_m = np.maximum(np.asarray(distance_km, dtype=float) * 1000, fireball_m)
+    return LUMINOUS_EFFICIENCY * energy_j / (2 * math.pi * distance_m ** 2) / 1000
+
+
+def casualty_probabilities(distance_km, energy_mt, exposed_fraction=DEFAULT_EXPOSED_FRACTION):
+    """Probabilidades (fallecimiento, herida) en cada distancia"""
+    overpressure = peak_overpressure_kpa(distance_km, energy_mt)
+    fluence = thermal_fluence_kj_m2(distance_km, energy_mt)
+    death = 1 - (1 - lognormal_probability(overpressure, BLAST_FATALITY)) * \
+        (1 - exposed_fraction * lognormal_probability(fluence, THERMAL_FATALITY))
+    casualty = 1 - (1 - lognormal_probability(overpressure, BLAST_CASUALTY)) * \
+        (1 - exposed_fraction * lognormal_probability(fluence, THERMAL_CASUALTY))
+    return death, np.maximum(casualty - death, 0.0)
+
+
+def _radius_for_overpressure(target_kpa, energy_mt):
+    """Distancia (km) a la que la sobrepresión cae a target_kpa (bisección)"""
+    low, high = 1e-3, MAX_EFFECT_RADIUS_KM
+    if peak_overpressure_kpa(high, energy_mt) >= target_kpa:
+        return high
+    for _ in range(60):
+        middle = math.sqrt(low * high)
+        if peak_overpressure_kpa(middle, energy_mt) > target_kpa:
+            low = middle
+        else:
+            high = middle
+    return high
+
+
+def effect_radius_km(energy_mt):
+    """Radio más allá del cual la probabilidad de víctimas es < MIN_PROBABILITY"""
+    median, sigma = BLAST_CASUALTY
+    z = -3.090232  # Φ_N⁻¹(10⁻³)
+    blast = _radius_for_overpressure(median * math.exp(z * sigma), energy_mt)
+    median, sigma = THERMAL_CASUALTY
+    energy_j = energy_mt * MT_TNT_J
+    thermal = math.sqrt(LUMINOUS_EFFICIENCY * energy_j / (2 * math.pi * median * 1000 * math.exp(z * sigma))) / 1000
+    return min(max(blast, thermal), MAX_EFFECT_RADIUS_KM)
+
+
+class _ProbabilityTable:
+    """
+    Curvas de casualty_probabilities muestreadas en distancias equiespaciadas
+    de 0 al radio de efecto. La interpolación lineal evita evaluar los
+    logaritmos y potencias de las cuatro curvas en cada una de los millones
+    de celdas de un evento continental.
+    """
+
+    def __init__(self, radius_km, energy_mt, exposed_fraction, size=PROBABILITY_TABLE_SIZE):
+        distances = np.linspace(0.0, radius_km, size)
+        self.step = distances[1]
+        self.death, self.injury = casualty_probabilities(distances, energy_mt, exposed_fraction)
+        self.death_slope = np.diff(self.death)
+        self.injury_slope = np.diff(self.injury)
+
+    def __call__(self, distance_km):
+        position = distance_km / self.step
+        index = np.minimum(position.astype(np.intp), self.death_slope.size - 1)
+        fraction = position - index
+        return (self.death[index] + fraction * self.death_slope[index],
+                self.injury[index] + fraction * self.injury_slope[index])
+
+
+def _summaries(band_population, band_deaths, band_injured, band_radii):
+    inner = [0.0] + list(band_radii)
+    outer = list(band_radii) + [None]
+    return [
+        {
+            'inner_km': float(r0),
+            'outer_km': float(r1) if r1 is not None else None,
+            'population': float(population),
+            'deaths': float(deaths),
+            'injured': float(injured)
+        }
+        for r0, r1, population, deaths, injured in zip(inner, outer, band_population, band_deaths, band_injured)
+    ]
+
+
+def grid_casualties(raster, lat, lon, energy_mt, band_radii_km=(), exposed_fraction=DEFAULT_EXPOSED_FRACTION):
+    """
+    Fallecidos y heridos integrando las curvas sobre todas las celdas del
+    ráster dentro del radio de efecto. band_radii_km (opcional) desglosa los
+    totales por anillos; el último anillo llega hasta el radio de efecto.
+    """
+    started = time.perf_counter()
+    radius = effect_radius_km(energy_mt)
+    band_radii = np.sort(np.asarray(band_radii_km, dtype=float))
+    band_terms = haversine_term(band_radii)
+    max_term = float(haversine_term(radius))
+    # Escala mínima a resolver: radio de fallecimiento del 50 % por sobrepresión
+    min_feature = max(_radius_for_overpressure(BLAST_FATALITY[0], energy_mt) / 2, 0.05)
+
+    probabilities = _ProbabilityTable(radius, energy_mt, exposed_fraction)
+
+    n_bands = band_radii.size + 1
+    population = np.zeros(n_bands)
+    deaths = np.zeros(n_bands)
+    injured = np.zeros(n_bands)
+    stats = {'cells': 0, 'missing_tiles': 0}
+    evaluated = 0
+
+    for values, a in raster.iter_cells(lat, lon, radius, min_feature, stats):
+        # Solo celdas habitadas dentro del radio de efecto
+        mask = (values > 0) & (a <= max_term)
+        if not mask.any():
+            continue
+        cell_population = values[mask]
+        cell_terms = a[mask]
+        p_death, p_injury = probabilities(distance_from_term(cell_terms))
+        bands = np.searchsorted(band_terms, cell_terms, side='left')
+        population += np.bincount(bands, weights=cell_population, minlength=n_bands)
+        deaths += np.bincount(bands, weights=cell_population * p_death, minlength=n_bands)
+        injured += np.bincount(bands, weights=cell_population * p_injury, minlength=n_bands)
+        evaluated += cell_population.size
+
+    return {
+        'population': float(population.sum()),
+        'deaths': float(deaths.sum()),
+        'injured': float(injured.sum()),
+        'bands': _summaries(population, deaths, injured, band_radii),
+        'effect_radius_km': round(radius, 2),
+        'cells': stats['cells'],
+        'cells_evaluated': evaluated,
+        'missing_tiles': stats['missing_tiles'],
+        'elapsed_ms': round((time.perf_counter() - started) * 1000, 2)
+    }
+
+
+def point_casualties(distances_km, populations, energy_mt, band_radii_km=(),
+                     exposed_fraction=DEFAULT_EXPOSED_FRACTION):
+    """Mismo modelo sobre puntos (ciudades con distancia y población)"""
+    distances = np.asarray(distances_km, dtype=float)
+    populations = np.asarray(populations, dtype=float)
+    radius = effect_radius_km(energy_mt)
+    inside = np.isfinite(distances) & (distances <= radius)
+    distances, populations = distances[inside], populations[inside]
+
+    band_radii = np.sort(np.asarray(band_radii_km, dtype=float))
+    n_bands = band_radii.size + 1
+    p_death, p_injury = casualty_probabilities(distances, energy_mt, exposed_fraction)
+    bands = np.searchsorted(band_radii, distances, side='left')
+    population = np.bincount(bands, weights=populations, minlength=n_bands)
+    deaths = np.bincount(bands, weights=populations * p_death, minlength=n_bands)
+    injured = np.bincount(bands, weights=populations * p_injury, minlength=n_bands)
+    return {
+        'population': float(population.sum()),
+        'deaths': float(deaths.sum()),
+        'injured': float(injured.sum()),
+        'bands': _summaries(population, deaths, injured, band_radii),
+        'band_counts': np.bincount(bands, minlength=n_bands).tolist(),
+        'effect_radius_km': round(radius, 2)
+    }
+
+
+def model_parameters(exposed_fraction=DEFAULT_EXPOSED_FRACTION):
+    """Parámetros del modelo para incluir en la respuesta"""
+    return {
+        'blast_fatality_kpa': {'median': BLAST_FATALITY[0], 'sigma': BLAST_FATALITY[1]},
+        'blast_casualty_kpa': {'median': BLAST_CASUALTY[0], 'sigma': BLAST_CASUALTY[1]},
+        'thermal_fatality_kj_m2': {'median': THERMAL_FATALITY[0], 'sigma': THERMAL_FATALITY[1]},
+        'thermal_casualty_kj_m2': {'median': THERMAL_CASUALTY[0], 'sigma': THERMAL_CASUALTY[1]},
+        'exposed_fraction': exposed_fraction,
+        'luminous_efficiency': LUMINOUS_EFFICIENCY
+    }
@@ -0,0 +1,139 @@
+"""
+Almacén local de modelos digitales de elevación (DEM) en teselas de 1°×1°.
+
+Sustituye las consultas HTTP punto a punto (USGS EPQS, Open-Elevation) por
+lecturas de teselas mapeadas en memoria con interpolación bilineal. Las
+consultas multipunto son vectorizadas: los puntos se agrupan por tesela y
+cada tesela se muestrea con una sola operación NumPy.
+
+Formatos admitidos (nombre estilo SRTM, esquina suroeste: N40W004, S34E018):
+    <nombre>.npy   Array 2D (float o int16) en metros, fila 0 = borde norte
+    <nombre>.hgt   SRTM crudo (int16 big-endian, 1201² o 3601² muestras)
+
+Las teselas son "pixel-is-point": la primera y la última fila/columna caen
+exactamente sobre los bordes de la tesela, como en SRTM. Sirven igual
+teselas de batimetría (GEBCO) con valores negativos. El valor -32768
+(vacío SRTM) se trata como dato ausente.
+
+Directorio configurable con la variable de entorno DEM_TILES_DIR
+(por defecto data/dem junto a este fichero).
+"""
+
+import math
+import os
+import threading
+from collections import OrderedDict
+
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+
+
+DEFAULT_TILES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'dem')
+SRTM_VOID = -32768
+MAX_OPEN_TILES = 64
+
+
+def tile_name(lat_index, lon_index):
+    """Nombre SRTM de la tesela cuya esquina suroeste es (lat_index, lon_index)"""
+    ns = 'N' if lat_index >= 0 else 'S'
+    ew = 'E' if lon_index >= 0 else 'W'
+    return f"{ns}{abs(lat_index):02d}{ew}{abs(lon_index):03d}"
+
+
+class DemTileStore:
+    """Teselas DEM mapeadas en memoria con muestreo bilineal vectorizado"""
+
+    def __init__(self, directory=None, max_open_tiles=MAX_OPEN_TILES):
+        self.directory = directory or os.environ.get('DEM_TILES_DIR', DEFAULT_TILES_DIR)
+        self.max_open_tiles = max_open_tiles
+        self._tiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def available(self):
+        """True si el directorio existe y contiene alguna tesela"""
+        if not os.path.isdir(self.directory):
+            return False
+        return any(name.endswith(('.npy', '.hgt')) for name in os.listdir(self.directory))
+
+    def _open_tile(self, lat_index, lon_index):
+        base = os.path.join(self.directory, tile_name(lat_index, lon_index))
+        if os.path.exists(base + '.npy'):
+            return np.load(base + '.npy', mmap_mode='r')
+        if os.path.exists(base + '.hgt'):
+            side = int(math.isqrt(os.path.getsize(base + '.hgt') // 2))
+            return np.memmap(base + '.hgt', dtype='>i2', mode='r', shape=(side, side))
+        return None
+
+    def _get_tile(self, lat_index, lon_index):
+        key = (lat_index, lon_index)
+        with self._lock:
+            if key in self._tiles:
+                self._tiles.move_to_end(key)
+                return self._tiles[key]
+        tile = self._open_tile(lat_index, lon_index)
+        with self._lock:
+            self._tiles[key] = tile
+            while len(self._tiles) > self.max_open_tiles:
+                self._tiles.popitem(last=False)
+        return tile
+
+    def sample(self, lats, lons):
+        """
+        Elevación (m) interpolada bilinealmente en cada punto.
+
+        Acepta escalares o arrays; devuelve un array float con NaN donde no
+        hay tesela o el dato está vacío.
+        """
+        lats = np.atleast_1d(np.asarray(lats, dtype=float))
+        lons = np.atleast_1d(np.asarray(lons, dtype=float))
+        lats, lons = np.broadcast_arrays(lats, lons)
+        lats = np.clip(lats.ravel(), -90.0, 90.0 - 1e-9)
+        lons = (lons.ravel() + 180.0) % 360.0 - 180.0
+
+        result = np.full(lats.shape, np.nan)
+        lat_index = np.floor(lats).astype(int)
+        lon_index = np.floor(lons).astype(int)
+        tile_keys, point_tile = np.unique(
+            (lat_index + 90) * 360 + (lon_index + 180), return_inverse=True
+        )
+        point_tile = point_tile.reshape(-1)
+
+        for t, key in enumerate(tile_keys):
+            tile_lat, tile_lon = int(key // 360) - 90, int(key % 360) - 180
+            tile = self._get_tile(tile_lat, tile_lon)
+            if tile is None:
+                continue
+
+            mask = point_tile == t
+            rows, cols = tile.shape
+            r = (tile_lat + 1 - lats[mask]) * (rows - 1)
+            c = (lons[mask] - tile_lon) * (cols - 1)
+            r0 = np.clip(np.floor(r).astype(int), 0, rows - 2)
+            c0 = np.clip(np.floor(c).astype(int), 0, cols - 2)
+            fr = r - r0
+            fc = c - c0
+
+            corners = [
+                np.asarray(tile[r0, c0], dtype=float),
+                np.asarray(tile[r0, c0 + 1], dtype=float),
+                np.asarray(tile[r0 + 1, c0], dtype=float),
+                np.asarray(tile[r0 + 1, c0 + 1], dtype=float)
+            ]
+            for values in corners:
+                values[values == SRTM_VOID] = np.nan
+
+            result[mask] = (
+                corners[0] * (1 - fr) * (1 - fc)
+                + corners[1] * (1 - fr) * fc
+                + corners[2] * fr * (1 - fc)
+                + corners[3] * fr * fc
+            )
+
+        return result
+
+    def elevation(self, lat, lon):
+        """Elevación de un punto, o None si no hay dato local"""
+        value = self.sample(lat, lon)[0]
+        return None if np.isnan(value) else float(value)
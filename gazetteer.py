@@ -0,0 +1,209 @@
+"""
+Nomenclátor local de poblaciones con índice espacial.
+
+Sustituye la consulta a Overpass de /api/cities por un nomenclátor cargado
+en memoria como arrays columnares (nombre, lat, lon, tipo, población) y un
+KD-tree sobre vectores unitarios de la esfera. La distancia euclídea entre
+vectores unitarios (cuerda) es monótona con la distancia de círculo
+máximo, así que las búsquedas por radio y de k vecinos son exactas.
+
+Formatos admitidos en GAZETTEER_PATH (por defecto data/gazetteer.*):
+    .txt   Volcado de GeoNames (cities500.txt, cities1000.txt...), separado
+           por tabuladores
+    .csv   Columnas name, lat, lon, type, population
+    .npz   Arrays compactos; se generan automáticamente junto al fichero
+           fuente la primera vez que se carga (carga posterior en ms)
+
+Si no hay nomenclátor, available es False y /api/cities usa Overpass.
+"""
+
+import csv
+import os
+import threading
+
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+
+
+EARTH_RADIUS_KM = 6371.0
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+DEFAULT_CANDIDATES = ('gazetteer.npz', 'gazetteer.csv', 'cities500.txt', 'cities1000.txt',
+                      'cities5000.txt', 'cities15000.txt')
+
+# Columnas del volcado de GeoNames que se usan
+GEONAMES_NAME, GEONAMES_LAT, GEONAMES_LON = 1, 4, 5
+GEONAMES_FEATURE_CODE, GEONAMES_POPULATION = 7, 14
+
+
+def place_type_from_population(population, feature_code=''):
+    """Tipo de lugar estilo OSM (city/town/village) a partir de GeoNames"""
+    if feature_code == 'PPLC' or population >= 100000:
+        return 'city'
+    if population >= 10000:
+        return 'town'
+    return 'village'
+
+
+def unit_vectors(lats, lons):
+    lat_rad = np.radians(np.asarray(lats, dtype=float))
+    lon_rad = np.radians(np.asarray(lons, dtype=float))
+    cos_lat = np.cos(lat_rad)
+    return np.column_stack((cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad)))
+
+
+def chord_to_km(chord):
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(np.asarray(chord) / 2, 0.0, 1.0))
+
+
+def km_to_chord(distance_km):
+    return 2 * np.sin(min(distance_km / EARTH_RADIUS_KM, np.pi) / 2)
+
+
+def _read_geonames(path):
+    names, lats, lons, types, populations = [], [], [], [], []
+    with open(path, encoding='utf-8') as handle:
+        for line in handle:
+            fields = line.rstrip('\n').split('\t')
+            if len(fields) <= GEONAMES_POPULATION:
+                continue
+            population = int(fields[GEONAMES_POPULATION] or 0)
+            names.append(fields[GEONAMES_NAME])
+            lats.append(float(fields[GEONAMES_LAT]))
+            lons.append(float(fields[GEONAMES_LON]))
+            types.append(place_type_from_population(population, fields[GEONAMES_FEATURE_CODE]))
+            populations.append(population)
+    return names, lats, lons, types, populations
+
+
+def _read_csv(path):
+    names, lats, lons, types, populations = [], [], [], [], []
+    with open(path, newline='', encoding='utf-8') as handle:
+        for row in csv.DictReader(handle):
+            population = int(float(row.get('population') or 0))
+            names.append(row['name'])
+            lats.append(float(row['lat']))
+            lons.append(float(row['lon']))
+            types.append(row.get('type') or place_type_from_population(population))
+            populations.append(population)
+    return names, lats, lons, types, populations
+
+
+def _build_tree(vectors):
+    """cKDTree sobre los vectores; SciPy se importa al cargar el primer nomenclátor"""
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:  # Sin SciPy se recorre el array completo (vectorizado)
+        return None
+    return cKDTree(vectors)
+
+
+class Gazetteer:
+    """Arrays columnares de lugares con índice espacial en la esfera"""
+
+    def __init__(self, names, lats, lons, types, populations):
+        self.names = np.asarray(names, dtype=object)
+        self.lats = np.asarray(lats, dtype=float)
+        self.lons = np.asarray(lons, dtype=float)
+        self.types = np.asarray(types, dtype=object)
+        self.populations = np.asarray(populations, dtype=np.int64)
+        self._vectors = unit_vectors(self.lats, self.lons)
+        self._tree = _build_tree(self._vectors)
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def load(cls, path):
+        """Carga un nomenclátor; para .txt/.csv guarda una copia .npz al lado"""
+        compact = os.path.splitext(path)[0] + '.npz'
+        if not path.endswith('.npz') and os.path.exists(compact) \
+                and os.path.getmtime(compact) >= os.path.getmtime(path):
+            path = compact
+        if path.endswith('.npz'):
+            arrays = np.load(path, allow_pickle=False)
+            return cls(arrays['names'].astype(object), arrays['lats'], arrays['lons'],
+                       arrays['types'].astype(object), arrays['populations'])
+
+        columns = _read_csv(path) if path.endswith('.csv') else _read_geonames(path)
+        gazetteer = cls(*columns)
+        try:
+            gazetteer.save(compact)
+        except OSError as e:
+            print(f"WARNING: No se pudo guardar la copia compacta del nomenclátor: {e}")
+        return gazetteer
+
+    def save(self, path):
+        np.savez(path, names=self.names.astype(str), lats=self.lats, lons=self.lons,
+                 types=self.types.astype(str), populations=self.populations)
+
+    def within_radius(self, lat, lon, radius_km):
+        """Índices y distancias (km) de los lugares a menos de radius_km, por distancia"""
+        center = unit_vectors([lat], [lon])[0]
+        chord = km_to_chord(radius_km)
+        if self._tree is not None:
+            indices = np.asarray(self._tree.query_ball_point(center, chord), dtype=np.int64)
+            chords = np.linalg.norm(self._vectors[indices] - center, axis=1)
+        else:
+            all_chords = np.linalg.norm(self._vectors - center, axis=1)
+            indices = np.nonzero(all_chords <= chord)[0]
+            chords = all_chords[indices]
+        order = np.argsort(chords, kind='stable')
+        return indices[order], chord_to_km(chords[order])
+
+    def nearest(self, lat, lon, k=10):
+        """Índices y distancias (km) de los k lugares más cercanos"""
+        k = min(int(k), len(self))
+        center = unit_vectors([lat], [lon])[0]
+        if self._tree is not None:
+            chords, indices = self._tree.query(center, k=k)
+            return np.atleast_1d(indices), chord_to_km(np.atleast_1d(chords))
+        all_chords = np.linalg.norm(self._vectors - center, axis=1)
+        indices = np.argsort(all_chords, kind='stable')[:k]
+        return indices, chord_to_km(all_chords[indices])
+
+    def records(self, indices, distances_km=None):
+        """Lugares como dicts (name, type, population, lat, lon[, distance_km])"""
+        places = []
+        for position, index in enumerate(indices):
+            place = {
+                'name': self.names[index],
+                'type': self.types[index],
+                'population': int(self.populations[index]),
+                'lat': float(self.lats[index]),
+                'lon': float(self.lons[index])
+            }
+            if distances_km is not None:
+                place['distance_km'] = float(distances_km[position])
+            places.append(place)
+        return places
+
+
+class GazetteerStore:
+    """Carga perezosa y compartida del nomenclátor configurado"""
+
+    def __init__(self, path=None):
+        self.path = path or os.environ.get('GAZETTEER_PATH') or self._find_default()
+        self._gazetteer = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _find_default():
+        for name in DEFAULT_CANDIDATES:
+            path = os.path.join(DEFAULT_DATA_DIR, name)
+            if os.path.exists(path):
+                return path
+        return None
+
+    @property
+    def available(self):
+        return self.path is not None and os.path.exists(self.path)
+
+    def get(self):
+        """Nomenclátor cargado, o None si no hay fichero"""
+        if self._gazetteer is None and self.available:
+            with self._lock:
+                if self._gazetteer is None:
+                    self._gazetteer = Gazetteer.load(self.path)
+                    print(f"INFO: Nomenclátor local cargado: {len(self._gazetteer):,} lugares ({self.path})")
+        return self._gazetteer
@@ -0,0 +1,314 @@
+"""
+Caché compartida para las consultas a APIs geográficas y astronómicas externas
+(USGS, Open-Elevation, Overpass, WorldPop, GBIF, NASA SBDB, NASA NeoWs).
+
+Cada fuente tiene su propio TTL; las claves se normalizan redondeando
+coordenadas y radios para que simulaciones repetidas sobre la misma ciudad
+reutilicen la respuesta. Hay dos backends intercambiables:
+
+- MemoryBackend: LRU en proceso, acotado por número de entradas.
+- SQLiteBackend: LRU en disco que sobrevive a reinicios del servidor.
+
+Configuración por variables de entorno:
+    GEO_CACHE_BACKEND       'memory' (por defecto) o 'sqlite'
+    GEO_CACHE_PATH          Ruta del fichero SQLite (geo_cache.sqlite3)
+    GEO_CACHE_MAX_ENTRIES   Tamaño máximo de la caché (5000)
+"""
+
+import copy
+import functools
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+# TTL por fuente (segundos)
+DEFAULT_TTLS = {
+    'usgs_elevation': 30 * 86400,   # La topografía no cambia
+    'open_elevation': 30 * 86400,
+    'usgs_elevation_point': 30 * 86400,
+    'usgs_seismic': 3600,           # El catálogo sísmico se actualiza a diario
+    'overpass': 7 * 86400,
+    'worldpop': 30 * 86400,         # Dataset estático (2020)
+    'gbif': 86400,
+    'sbdb': 86400,
+    'neo_feed': 3600,
+}
+DEFAULT_TTL = 3600
+
+# Decimales usados al normalizar coordenadas (3 decimales ≈ 110 m)
+COORD_PRECISION = 3
+COORD_NAMES = ('lat', 'lon', 'latitude', 'longitude', 'x', 'y')
+
+# Parámetros que no forman parte de la clave (credenciales)
+IGNORED_PARAMS = ('api_key',)
+
+
+def normalize_params(params, coord_precision=COORD_PRECISION):
+    """Normaliza parámetros para usarlos como clave de caché"""
+    normalized = {}
+    for name, value in params.items():
+        if name in IGNORED_PARAMS:
+            continue
+        if isinstance(value, dict):
+            value = normalize_params(value, coord_precision)
+        elif isinstance(value, bool) or value is None:
+            pass
+        elif isinstance(value, (int, float)):
+            if name in COORD_NAMES:
+                value = round(float(value), coord_precision)
+            else:
+                value = round(float(value), 3)
+        normalized[name] = value
+    return normalized
+
+
+def make_key(source, params, coord_precision=COORD_PRECISION):
+    """Construye la clave de caché para una fuente y sus parámetros"""
+    normalized = normalize_params(params, coord_precision)
+    return f"{source}:{json.dumps(normalized, sort_keys=True, default=str)}"
+
+
+class MemoryBackend:
+    """LRU en memoria con expiración por entrada"""
+
+    name = 'memory'
+
+    def __init__(self, max_entries=5000):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Devuelve (encontrado, valor, expirado)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False, None, False
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._data[key]
+                return False, None, True
+            self._data.move_to_end(key)
+            return True, copy.deepcopy(value), False
+
+    def set(self, key, value, ttl):
+        """Guarda un valor y devuelve el número de entradas desalojadas"""
+        with self._lock:
+            self._data[key] = (time.time() + ttl, copy.deepcopy(value))
+            self._data.move_to_end(key)
+            evicted = 0
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                evicted += 1
+            return evicted
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class SQLiteBackend:
+    """LRU persistente en SQLite; los valores se guardan como JSON"""
+
+    name = 'sqlite'
+
+    def __init__(self, path='geo_cache.sqlite3', max_entries=5000):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            ' key TEXT PRIMARY KEY,'
+            ' value TEXT NOT NULL,'
+            ' expires_at REAL NOT NULL,'
+            ' last_access REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_cache_last_access ON cache(last_access)')
+        self._conn.commit()
+
+    def get(self, key):
+        """Devuelve (encontrado, valor, expirado)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value, expires_at FROM cache WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return False, None, False
+            value, expires_at = row
+            if expires_at < now:
+                self._conn.execute('DELETE FROM cache WHERE key = ?', (key,))
+                self._conn.commit()
+                return False, None, True
+            self._conn.execute('UPDATE cache SET last_access = ? WHERE key = ?', (now, key))
+            self._conn.commit()
+        return True, json.loads(value), False
+
+    def set(self, key, value, ttl):
+        """Guarda un valor y devuelve el número de entradas desalojadas"""
+        now = time.time()
+        payload = json.dumps(value)
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO cache (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)',
+                (key, payload, now + ttl, now)
+            )
+            count = self._conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+            evicted = max(0, count - self.max_entries)
+            if evicted:
+                self._conn.execute(
+                    'DELETE FROM cache WHERE key IN ('
+                    ' SELECT key FROM cache ORDER BY last_access ASC LIMIT ?)',
+                    (evicted,)
+                )
+            self._conn.commit()
+        return evicted
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute('DELETE FROM cache')
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+
+
+class GeoCache:
+    """Caché TTL+LRU con contadores de aciertos/fallos por fuente"""
+
+    def __init__(self, backend=None, ttls=None, coord_precision=COORD_PRECISION):
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.coord_precision = coord_precision
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, source, counter, amount=1):
+        with self._stats_lock:
+            stats = self._stats.setdefault(
+                source, {'hits': 0, 'misses': 0, 'stores': 0, 'expired': 0, 'evictions': 0}
+            )
+            stats[counter] += amount
+
+    def _lookup(self, source, params):
+        key = make_key(source, params, self.coord_precision)
+        found, value, expired = self.backend.get(key)
+        if expired:
+            self._count(source, 'expired')
+        self._count(source, 'hits' if found else 'misses')
+        return key, found, value
+
+    def _store(self, source, key, value, skip):
+        if skip is not None and skip(value):
+            return
+        evicted = self.backend.set(key, value, self.ttls.get(source, DEFAULT_TTL))
+        self._count(source, 'stores')
+        if evicted:
+            self._count(source, 'evictions', evicted)
+
+    def get_or_fetch(self, source, params, fetch, skip=None):
+        """
+        Devuelve el valor cacheado para (source, params) o lo obtiene con fetch().
+
+        Las excepciones de fetch se propagan sin cachear nada. Si skip(valor)
+        es verdadero el valor se devuelve pero no se guarda (p. ej. respuestas
+        de error o estimaciones de respaldo).
+        """
+        key, found, value = self._lookup(source, params)
+        if found:
+            return value
+        value = fetch()
+        self._store(source, key, value, skip)
+        return value
+
+    async def get_or_fetch_async(self, source, params, fetch, skip=None):
+        """get_or_fetch para la ruta asíncrona: fetch es una corrutina sin argumentos"""
+        key, found, value = self._lookup(source, params)
+        if found:
+            return value
+        value = await fetch()
+        self._store(source, key, value, skip)
+        return value
+
+    def cached(self, source, skip=None):
+        """
+        Decorador: cachea una función usando sus argumentos como clave.
+        Con funciones async usa get_or_fetch_async; la versión síncrona y la
+        asíncrona de una consulta comparten entradas si usan el mismo source
+        y los mismos nombres de argumentos.
+        """
+        def decorator(func):
+            signature = inspect.signature(func)
+
+            def arguments(args, kwargs):
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                return dict(bound.arguments)
+
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    return await self.get_or_fetch_async(
+                        source, arguments(args, kwargs), lambda: func(*args, **kwargs), skip=skip
+                    )
+
+                async_wrapper.uncached = func
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return self.get_or_fetch(
+                    source, arguments(args, kwargs), lambda: func(*args, **kwargs), skip=skip
+                )
+
+            wrapper.uncached = func
+            return wrapper
+        return decorator
+
+    def stats(self):
+        """Contadores por fuente y totales"""
+        with self._stats_lock:
+            sources = {name: dict(values) for name, values in self._stats.items()}
+        for values in sources.values():
+            lookups = values['hits'] + values['misses']
+            values['hit_rate'] = round(values['hits'] / lookups, 4) if lookups else 0.0
+        hits = sum(v['hits'] for v in sources.values())
+        misses = sum(v['misses'] for v in sources.values())
+        return {
+            'backend': self.backend.name,
+            'entries': len(self.backend),
+            'max_entries': self.backend.max_entries,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            'sources': sources,
+            'ttls': dict(self.ttls)
+        }
+
+    def clear(self):
+        self.backend.clear()
+        with self._stats_lock:
+            self._stats.clear()
+
+
+def create_cache_from_env():
+    """Crea la caché según GEO_CACHE_BACKEND / GEO_CACHE_PATH / GEO_CACHE_MAX_ENTRIES"""
+    max_entries = int(os.environ.get('GEO_CACHE_MAX_ENTRIES', 5000))
+    if os.environ.get('GEO_CACHE_BACKEND', 'memory') == 'sqlite':
+        backend = SQLiteBackend(os.environ.get('GEO_CACHE_PATH', 'geo_cache.sqlite3'), max_entries)
+    else:
+        backend = MemoryBackend(max_entries)
+    return GeoCache(backend)
@@ -0,0 +1,41 @@
+"""
+Configuración de gunicorn para wsgi:app.
+
+Variables de entorno:
+    PORT               Puerto (por defecto 5000)
+    WEB_CONCURRENCY    Procesos worker (por defecto 1; ver más abajo)
+    WEB_THREADS        Hilos por proceso (por defecto 8; 1 = worker sync)
+    WEB_TIMEOUT        Segundos antes de reiniciar un worker bloqueado (120;
+                       el informe PDF y el análisis completo tardan decenas
+                       de segundos cuando las APIs externas responden lento)
+
+Las rutas pasan casi todo el tiempo esperando a APIs externas, así que el
+perfil por defecto es gthread (hilos) en un solo proceso; ver el perfil de
+concurrencia en DESPLIEGUE.md.
+
+Los trabajos de informes PDF y de cribado de NEOs viven en la memoria del
+proceso que los crea. Con varios procesos, el sondeo de un trabajo puede
+llegar a otro worker y devolver 404, así que WEB_CONCURRENCY > 1 solo es
+seguro si esas rutas se envían a una instancia aparte con un solo proceso.
+"""
+
+import os
+
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+threads = int(os.environ.get('WEB_THREADS', 8))
+worker_class = 'gthread' if threads > 1 else 'sync'
+timeout = int(os.environ.get('WEB_TIMEOUT', 120))
+graceful_timeout = 30
+keepalive = 5
+# Cada worker importa la aplicación por separado: los pools de hilos, el
+# catálogo SQLite y los trabajos de informes no se comparten entre procesos
+preload_app = False
+accesslog = '-'
+
+
+def on_starting(server):
+    if workers > 1:
+        print(f"WARNING: WEB_CONCURRENCY={workers}: los trabajos de informes y de cribado "
+              "solo existen en el proceso que los creó; enviar esas rutas a un solo proceso")
@@ -0,0 +1,204 @@
+"""
+Cliente HTTP compartido para todas las APIs externas (USGS, NASA, Overpass,
+WorldPop, GBIF, Open-Elevation...).
+
+- Una requests.Session por host con pool de conexiones keep-alive.
+- Concurrencia acotada por host (semáforo), para que un upstream lento no
+  acapare todos los hilos del servidor.
+- Reintentos con backoff exponencial y jitter ante 429/5xx y errores de
+  conexión, respetando la cabecera Retry-After.
+- Circuit breaker por host: tras varios fallos seguidos las peticiones
+  fallan al instante durante un tiempo en lugar de esperar al timeout.
+
+Uso: http_client.get(url, params=..., timeout=10) en lugar de requests.get.
+Los errores propios heredan de requests.exceptions.RequestException, así que
+los bloques except existentes siguen funcionando.
+"""
+
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+POOL_MAXSIZE = 10             # Conexiones keep-alive por host
+MAX_CONCURRENT_PER_HOST = 8   # Peticiones simultáneas por host
+MAX_RETRIES = 2               # Reintentos además del primer intento
+BACKOFF_BASE_S = 0.25
+BACKOFF_MAX_S = 4.0
+CONNECT_TIMEOUT_S = 3.05      # Los timeouts escalares se aplican solo a la lectura
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+BREAKER_FAILURE_THRESHOLD = 5   # Fallos consecutivos para abrir el circuito
+BREAKER_RESET_S = 30            # Tiempo abierto antes de probar de nuevo
+
+USER_AGENT = 'AsteroidImpactSimulator/1.0 (NASA Hackathon 2025)'
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """El circuito del host está abierto: se falla sin contactar al upstream"""
+
+
+class HostBusyError(requests.exceptions.ConnectionError):
+    """Se alcanzó el máximo de peticiones simultáneas para el host"""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker clásico: closed -> open -> half_open -> closed.
+
+    En half_open solo hay una petición de prueba en vuelo; el resto falla al
+    instante hasta que la prueba informa con record_success/record_failure.
+    Si quien la lanzó no informa (p. ej. se canceló), pasados reset_s se
+    admite otra prueba.
+    """
+
+    def __init__(self, failure_threshold=BREAKER_FAILURE_THRESHOLD, reset_s=BREAKER_RESET_S):
+        self.failure_threshold = failure_threshold
+        self.reset_s = reset_s
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_started_at = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            now = time.monotonic()
+            if self.state == 'open':
+                if now - self.opened_at < self.reset_s:
+                    return False
+                self.state = 'half_open'
+            elif self.probe_started_at is not None and now - self.probe_started_at < self.reset_s:
+                # Ya hay una petición de prueba en vuelo
+                return False
+            self.probe_started_at = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = 'closed'
+            self.failures = 0
+            self.probe_started_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.probe_started_at = None
+            if self.state == 'half_open' or self.failures >= self.failure_threshold:
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+
+
+class _Host:
+    """Sesión, semáforo y circuit breaker de un host"""
+
+    def __init__(self):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['User-Agent'] = USER_AGENT
+        self.semaphore = threading.BoundedSemaphore(MAX_CONCURRENT_PER_HOST)
+        self.breaker = CircuitBreaker()
+        self.requests = 0
+        self.retries = 0
+
+
+_hosts = {}
+_hosts_lock = threading.Lock()
+
+
+def _get_host(url):
+    netloc = urlsplit(url).netloc
+    with _hosts_lock:
+        host = _hosts.get(netloc)
+        if host is None:
+            host = _hosts[netloc] = _Host()
+        return netloc, host
+
+
+def _backoff_delay(attempt, response=None):
+    """Backoff exponencial con jitter completo; respeta Retry-After si existe"""
+    if response is not None:
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), BACKOFF_MAX_S)
+    return random.uniform(0, min(BACKOFF_MAX_S, BACKOFF_BASE_S * 2 ** attempt))
+
+
+def request(method, url, timeout=10, max_retries=MAX_RETRIES, **kwargs):
+    """
+    Envía una petición a través del pool del host con reintentos y circuit breaker.
+
+    Devuelve la última respuesta obtenida (aunque sea 5xx tras agotar los
+    reintentos) o lanza la última excepción de red. Los timeouts de lectura
+    no se reintentan para no multiplicar la latencia del request original.
+    """
+    netloc, host = _get_host(url)
+    if isinstance(timeout, (int, float)):
+        timeout = (min(CONNECT_TIMEOUT_S, timeout), timeout)
+
+    if not host.breaker.allow():
+        raise CircuitOpenError(f'Circuito abierto para {netloc}: demasiados fallos recientes')
+
+    if not host.semaphore.acquire(timeout=timeout[1]):
+        raise HostBusyError(f'Demasiadas peticiones simultáneas a {netloc}')
+
+    try:
+        attempt = 0
+        while True:
+            host.requests += 1
+            response = None
+            try:
+                response = host.session.request(method, url, timeout=timeout, **kwargs)
+            except requests.exceptions.ReadTimeout:
+                host.breaker.record_failure()
+                raise
+            except requests.exceptions.ConnectionError:
+                if attempt >= max_retries:
+                    host.breaker.record_failure()
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS:
+                    host.breaker.record_success()
+                    return response
+                if attempt >= max_retries:
+                    host.breaker.record_failure()
+                    return response
+
+            time.sleep(_backoff_delay(attempt, response))
+            attempt += 1
+            host.retries += 1
+    finally:
+        host.semaphore.release()
+
+
+def get(url, params=None, timeout=10, **kwargs):
+    """Equivalente a requests.get con pool, reintentos y circuit breaker"""
+    return request('GET', url, params=params, timeout=timeout, **kwargs)
+
+
+def post(url, data=None, json=None, timeout=10, **kwargs):
+    """Equivalente a requests.post con pool, reintentos y circuit breaker"""
+    return request('POST', url, data=data, json=json, timeout=timeout, **kwargs)
+
+
+def status():
+    """Estado de cada host: circuito, fallos consecutivos, peticiones y reintentos"""
+    with _hosts_lock:
+        hosts = dict(_hosts)
+    return {
+        netloc: {
+            'circuit': host.breaker.state,
+            'consecutive_failures': host.breaker.failures,
+            'requests': host.requests,
+            'retries': host.retries
+        }
+        for netloc, host in hosts.items()
+    }
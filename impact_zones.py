@@ -0,0 +1,49 @@
+"""
+Clasificación vectorizada de lugares por zonas de impacto.
+
+Sustituye los bucles por ciudad de /api/cities y /api/population/casualties:
+las distancias se calculan con haversine sobre arrays, la zona de cada lugar
+con np.searchsorted sobre los radios y los totales por zona con np.bincount.
+
+Convención de zonas: cada lugar recibe el primer índice i con d <= radii[i],
+como la cadena if/elif original; los lugares más allá de todos los radios
+(o sin distancia) reciben len(radii). Los radios los envía el cliente y
+pueden llegar desordenados: searchsorted se hace sobre su máximo acumulado,
+que da el mismo primer índice y sí está ordenado.
+"""
+
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def haversine_km(lat, lon, lats, lons):
+    """Distancia (km) desde (lat, lon) a cada punto de los arrays lats/lons"""
+    lat1 = np.radians(lat)
+    lat2 = np.radians(np.asarray(lats, dtype=float))
+    dlat = lat2 - lat1
+    dlon = np.radians(np.asarray(lons, dtype=float)) - np.radians(lon)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def classify(distances_km, radii_km):
+    """Índice de zona de cada distancia (len(radii_km) = fuera de todas)"""
+    distances = np.asarray(distances_km, dtype=float)
+    thresholds = np.maximum.accumulate(np.asarray(radii_km, dtype=float))
+    zones = np.searchsorted(thresholds, distances, side='left')
+    zones[np.isnan(distances)] = len(radii_km)
+    return zones
+
+
+def zone_sums(zones, values, n_zones):
+    """Suma de values por zona (array de longitud n_zones)"""
+    return np.bincount(zones, weights=np.asarray(values, dtype=float), minlength=n_zones + 1)[:n_zones]
+
+
+def zone_counts(zones, n_zones):
+    """Número de lugares por zona (array de longitud n_zones)"""
+    return np.bincount(zones, minlength=n_zones + 1)[:n_zones]
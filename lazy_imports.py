@@ -0,0 +1,140 @@
+"""
+Importación diferida de dependencias pesadas y perfil de arranque.
+
+np = lazy_import('numpy') devuelve un sustituto del módulo que lo importa
+en el primer acceso a un atributo (np.array, ...). Cada módulo del
+proyecto que depende de NumPy o requests lo importa así, de modo que esas
+dependencias solo se cargan en los workers que atienden rutas que las usan.
+
+profile_startup() mide el arranque de la aplicación en un proceso limpio
+(python -X importtime) y muestra el tiempo de importación por módulo:
+    python app.py --profile-startup
+"""
+
+import importlib.util
+import os
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """
+    Sustituto de un módulo que lo importa en el primer acceso a un atributo.
+    importlib.import_module toma el bloqueo de importación del módulo, así
+    que dos hilos que lo usen a la vez no lo ejecutan dos veces.
+    """
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__['_lazy_target'] = None
+
+    def _load(self):
+        module = self.__dict__['_lazy_target']
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__['_lazy_target'] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = 'cargado' if self.__dict__['_lazy_target'] is not None else 'diferido'
+        return f"<módulo diferido {self.__name__!r} ({state})>"
+
+
+_proxies = {}
+
+
+def lazy_import(name):
+    """
+    Módulo `name` o su sustituto diferido. Todos los módulos reciben el mismo
+    sustituto, así que sustituir un atributo (http_client.get en las pruebas)
+    afecta a todos.
+    """
+    if name in _proxies:
+        return _proxies[name]
+    if name in sys.modules:
+        return sys.modules[name]
+    if importlib.util.find_spec(name) is None:
+        raise ImportError(f"No se encontró el módulo {name}")
+    return _proxies.setdefault(name, LazyModule(name))
+
+
+def is_loaded(name):
+    """True si el módulo ya se importó de verdad en este proceso"""
+    return name in sys.modules
+
+
+def _parse_importtime(stderr):
+    """Filas (módulo, propio_us, acumulado_us, profundidad) de -X importtime"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' '))) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def _app_subtree(rows, module):
+    """
+    Módulos importados por `module` (él incluido), sin los del arranque del
+    intérprete. -X importtime escribe cada módulo después de sus dependencias.
+    """
+    for index in range(len(rows) - 1, -1, -1):
+        if rows[index][0] == module and rows[index][3] == 0:
+            start = index
+            while start > 0 and rows[start - 1][3] > 0:
+                start -= 1
+            return rows[start:index + 1]
+    return rows
+
+
+def profile_startup(module='app', factory='create_app', top=25, stream=None):
+    """
+    Importa `module` y llama a `factory` en un proceso limpio con -X importtime.
+    Muestra el tiempo total, los paquetes de primer nivel más costosos y
+    los módulos más lentos por tiempo propio. Devuelve el tiempo total en ms.
+    """
+    import subprocess
+
+    stream = stream or sys.stdout
+    code = (
+        'import time, contextlib, io\n'
+        't = time.perf_counter()\n'
+        'with contextlib.redirect_stdout(io.StringIO()):\n'
+        f'    import {module}\n'
+        f'    getattr({module}, {factory!r}, lambda: None)()\n'
+        'print(round((time.perf_counter() - t) * 1000, 1))\n'
+    )
+    directory = os.path.dirname(os.path.abspath(sys.modules[module].__file__)) if module in sys.modules else None
+
+    def run(*flags):
+        result = subprocess.run([sys.executable, *flags, '-c', code], capture_output=True, text=True, cwd=directory)
+        if result.returncode != 0:
+            print(result.stderr, file=stream)
+            raise RuntimeError('El arranque de la aplicación falló')
+        return result
+
+    # Tiempo real en un proceso sin instrumentar; -X importtime añade sobrecoste
+    ready_ms = float(run().stdout.strip().splitlines()[-1])
+    result = run('-X', 'importtime')
+    rows = _app_subtree(_parse_importtime(result.stderr), module)
+    top_level = sorted((row for row in rows if row[3] == 1), key=lambda row: row[2], reverse=True)
+    slowest = sorted(rows, key=lambda row: row[1], reverse=True)
+
+    print(f"⏱️  Perfil de arranque de {module}.{factory}()", file=stream)
+    print(f"   Importación + fábrica: {ready_ms:.1f} ms", file=stream)
+    print(f"   Módulos importados: {len(rows)}", file=stream)
+    print("\n   Importaciones directas (acumulado):", file=stream)
+    for name, _, cumulative_us, _ in top_level[:top]:
+        print(f"   {cumulative_us / 1000:9.1f} ms  {name}", file=stream)
+    print("\n   Módulos más lentos (tiempo propio):", file=stream)
+    for name, self_us, _, _ in slowest[:top]:
+        print(f"   {self_us / 1000:9.1f} ms  {name}", file=stream)
+    return ready_ms
@@ -0,0 +1,474 @@
+"""
+Catálogo local de NEOs en SQLite con sincronización incremental.
+
+Sustituye las consultas en vivo a NeoWs (feed de los últimos días) y a la
+SBDB (una por clic) por una base local indexada por id, nombre, peligrosidad,
+diámetro y fecha de aproximación. Las rutas filtran, ordenan y paginan sobre
+la base en milisegundos.
+
+- sync_feed(): descarga solo las ventanas de fechas posteriores a la última
+  sincronizada (más un pequeño solape para recoger correcciones).
+- sync_browse(): recorre el endpoint browse de NeoWs por páginas, continuando
+  desde el cursor guardado; aporta los elementos orbitales.
+- Solo se escriben los objetos nuevos o cuyo contenido cambió (hash SHA-1).
+- Sin red, el catálogo se carga desde una instantánea (JSON comprimido)
+  generada con export_snapshot().
+
+Configuración por variables de entorno:
+    NEO_CATALOG_DB        Ruta de la base SQLite (data/neo_catalog.sqlite3)
+    NEO_CATALOG_SNAPSHOT  Instantánea para modo offline (data/neo_snapshot.json.gz)
+
+Uso desde la línea de comandos:
+    python neo_catalog.py sync [--browse-pages N]
+    python neo_catalog.py export data/neo_snapshot.json.gz
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+DEFAULT_DB_PATH = os.path.join(DATA_DIR, 'neo_catalog.sqlite3')
+DEFAULT_SNAPSHOT_PATH = os.path.join(DATA_DIR, 'neo_snapshot.json.gz')
+
+FEED_WINDOW_DAYS = 7        # Máximo que admite el feed de NeoWs por petición
+FEED_OVERLAP_DAYS = 1       # Días ya sincronizados que se vuelven a pedir
+FEED_INITIAL_DAYS = 14      # Primera sincronización: días hacia atrás desde hoy
+FEED_AHEAD_DAYS = 7         # Aproximaciones futuras que se sincronizan
+SBDB_MAX_AGE_S = 30 * 86400
+
+COLUMNS = (
+    'id', 'name', 'is_hazardous', 'absolute_magnitude', 'diameter_min_m', 'diameter_max_m',
+    'approach_date', 'velocity_km_s', 'miss_distance_km',
+    'a', 'e', 'i', 'om', 'w', 'ma', 'epoch'
+)
+SORT_COLUMNS = {
+    'approach_date': 'approach_date',
+    'name': 'name',
+    'diameter': 'diameter_max_m',
+    'miss_distance': 'miss_distance_km',
+    'velocity': 'velocity_km_s',
+    'hazardous': 'is_hazardous'
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS neo (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    is_hazardous INTEGER NOT NULL DEFAULT 0,
+    absolute_magnitude REAL,
+    diameter_min_m REAL,
+    diameter_max_m REAL,
+    approach_date TEXT,
+    velocity_km_s REAL,
+    miss_distance_km REAL,
+    a REAL, e REAL, i REAL, om REAL, w REAL, ma REAL, epoch REAL,
+    content_hash TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    sbdb TEXT,
+    sbdb_updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_neo_name ON neo(name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_neo_hazardous ON neo(is_hazardous, approach_date);
+CREATE INDEX IF NOT EXISTS idx_neo_diameter ON neo(diameter_max_m);
+CREATE INDEX IF NOT EXISTS idx_neo_approach_date ON neo(approach_date);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _content_hash(record):
+    payload = json.dumps([record.get(column) for column in COLUMNS], default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def _pick_approach(approaches, today):
+    """Próxima aproximación a la Tierra (o la última pasada si no hay futuras)"""
+    earth = [a for a in approaches if a.get('orbiting_body', 'Earth') == 'Earth']
+    if not earth:
+        return None
+    upcoming = [a for a in earth if a.get('close_approach_date', '') >= today]
+    if upcoming:
+        return min(upcoming, key=lambda a: a['close_approach_date'])
+    return max(earth, key=lambda a: a.get('close_approach_date', ''))
+
+
+def record_from_neows(neo, today=None):
+    """Convierte un objeto de NeoWs (feed o browse) en una fila del catálogo"""
+    today = today or date.today().isoformat()
+    diameter = neo.get('estimated_diameter', {}).get('meters', {})
+    record = {
+        'id': str(neo['id']),
+        'name': neo.get('name', str(neo['id'])),
+        'is_hazardous': bool(neo.get('is_potentially_hazardous_asteroid')),
+        'absolute_magnitude': _float(neo.get('absolute_magnitude_h')),
+        'diameter_min_m': _float(diameter.get('estimated_diameter_min')),
+        'diameter_max_m': _float(diameter.get('estimated_diameter_max'))
+    }
+
+    approach = _pick_approach(neo.get('close_approach_data') or [], today)
+    if approach is not None:
+        record['approach_date'] = approach.get('close_approach_date')
+        record['velocity_km_s'] = _float(approach.get('relative_velocity', {}).get('kilometers_per_second'))
+        record['miss_distance_km'] = _float(approach.get('miss_distance', {}).get('kilometers'))
+
+    orbit = neo.get('orbital_data')
+    if orbit:
+        record.update({
+            'a': _float(orbit.get('semi_major_axis')),
+            'e': _float(orbit.get('eccentricity')),
+            'i': _float(orbit.get('inclination')),
+            'om': _float(orbit.get('ascending_node_longitude')),
+            'w': _float(orbit.get('perihelion_argument')),
+            'ma': _float(orbit.get('mean_anomaly')),
+            'epoch': _float(orbit.get('epoch_osculation'))
+        })
+    return record
+
+
+class NeoCatalog:
+    """Catálogo SQLite de NEOs con consultas paginadas y estado de sincronización"""
+
+    def __init__(self, path=None, snapshot_path=None):
+        self.path = path or os.environ.get('NEO_CATALOG_DB', DEFAULT_DB_PATH)
+        self.snapshot_path = snapshot_path or os.environ.get('NEO_CATALOG_SNAPSHOT', DEFAULT_SNAPSHOT_PATH)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self.last_sync = None
+
+    # ----------------------------------------
+    # Escritura
+    # ----------------------------------------
+
+    def upsert(self, records):
+        """
+        Inserta o actualiza filas. Los campos ausentes o None conservan el
+        valor guardado (el feed no trae elementos orbitales, browse sí).
+        Devuelve {'inserted', 'updated', 'unchanged'}.
+        """
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        if not records:
+            return counts
+        now = time.time()
+        with self._lock:
+            ids = [record['id'] for record in records]
+            existing = {}
+            for start in range(0, len(ids), 500):
+                batch = ids[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT * FROM neo WHERE id IN ({','.join('?' * len(batch))})", batch
+                ).fetchall()
+                existing.update({row['id']: dict(row) for row in rows})
+
+            writes = []
+            for record in records:
+                current = existing.get(record['id'])
+                merged = dict(current) if current else {column: None for column in COLUMNS}
+                merged.update({key: value for key, value in record.items() if value is not None})
+                merged['is_hazardous'] = int(bool(merged.get('is_hazardous')))
+                content_hash = _content_hash(merged)
+                if current and current['content_hash'] == content_hash:
+                    counts['unchanged'] += 1
+                    continue
+                counts['updated' if current else 'inserted'] += 1
+                existing[record['id']] = dict(merged, content_hash=content_hash)
+                writes.append([merged[column] for column in COLUMNS] + [content_hash, now])
+
+            self._conn.executemany(
+                f"INSERT INTO neo ({', '.join(COLUMNS)}, content_hash, updated_at) "
+                f"VALUES ({', '.join('?' * (len(COLUMNS) + 2))}) "
+                f"ON CONFLICT(id) DO UPDATE SET "
+                + ', '.join(f'{column} = excluded.{column}' for column in COLUMNS[1:] + ('content_hash', 'updated_at')),
+                writes
+            )
+            self._conn.commit()
+        return counts
+
+    def get_state(self, key, default=None):
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM sync_state WHERE key = ?', (key,)).fetchone()
+        return json.loads(row['value']) if row else default
+
+    def set_state(self, key, value):
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)', (key, json.dumps(value))
+            )
+            self._conn.commit()
+
+    # ----------------------------------------
+    # SBDB
+    # ----------------------------------------
+
+    def get_sbdb(self, asteroid_id, max_age_s=SBDB_MAX_AGE_S):
+        """Resultado SBDB guardado para el objeto, o None si no existe o caducó"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT sbdb, sbdb_updated_at FROM neo WHERE id = ? OR name = ?', (str(asteroid_id), str(asteroid_id))
+            ).fetchone()
+        if row is None or row['sbdb'] is None or time.time() - row['sbdb_updated_at'] > max_age_s:
+            return None
+        return json.loads(row['sbdb'])
+
+    def put_sbdb(self, asteroid_id, result):
+        """Guarda el resultado SBDB si el objeto está en el catálogo"""
+        with self._lock:
+            self._conn.execute(
+                'UPDATE neo SET sbdb = ?, sbdb_updated_at = ? WHERE id = ? OR name = ?',
+                (json.dumps(result), time.time(), str(asteroid_id), str(asteroid_id))
+            )
+            self._conn.commit()
+
+    # ----------------------------------------
+    # Consultas
+    # ----------------------------------------
+
+    def query(self, hazardous=None, min_diameter_m=None, max_diameter_m=None, approach_from=None,
+              approach_to=None, name=None, sort='approach_date', order='desc', limit=20, offset=0):
+        """Filtra, ordena y pagina el catálogo. Devuelve (filas, total)"""
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"sort debe ser uno de {', '.join(SORT_COLUMNS)}")
+        if order not in ('asc', 'desc'):
+            raise ValueError("order debe ser 'asc' o 'desc'")
+
+        clauses, params = [], []
+        if hazardous is not None:
+            clauses.append('is_hazardous = ?')
+            params.append(int(bool(hazardous)))
+        if min_diameter_m is not None:
+            clauses.append('diameter_max_m >= ?')
+            params.append(float(min_diameter_m))
+        if max_diameter_m is not None:
+            clauses.append('diameter_min_m <= ?')
+            params.append(float(max_diameter_m))
+        if approach_from is not None:
+            clauses.append('approach_date >= ?')
+            params.append(str(approach_from))
+        if approach_to is not None:
+            clauses.append('approach_date <= ?')
+            params.append(str(approach_to))
+        if name:
+            clauses.append('name LIKE ?')
+            params.append(f'%{name}%')
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+
+        with self._lock:
+            total = self._conn.execute(f'SELECT COUNT(*) FROM neo {where}', params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM neo {where} "
+                f"ORDER BY {SORT_COLUMNS[sort]} {order.upper()}, id LIMIT ? OFFSET ?",
+                params + [int(limit), int(offset)]
+            ).fetchall()
+        return [dict(row) for row in rows], total
+
+    def elements_records(self):
+        """Objetos con elementos orbitales, con las claves del CSV de la SBDB (para el cribado)"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT name, a, e, i, om, w, ma, epoch, absolute_magnitude, diameter_max_m FROM neo '
+                'WHERE a IS NOT NULL AND e IS NOT NULL'
+            ).fetchall()
+        return [
+            {
+                'full_name': row['name'], 'a': row['a'], 'e': row['e'], 'i': row['i'], 'om': row['om'],
+                'w': row['w'], 'ma': row['ma'], 'epoch': row['epoch'], 'H': row['absolute_magnitude'],
+                'diameter': row['diameter_max_m'] / 1000 if row['diameter_max_m'] else None
+            }
+            for row in rows
+        ]
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM neo').fetchone()[0]
+
+    def status(self):
+        with self._lock:
+            counts = self._conn.execute(
+                'SELECT COUNT(*), SUM(is_hazardous), SUM(a IS NOT NULL), SUM(sbdb IS NOT NULL), '
+                'MIN(approach_date), MAX(approach_date) FROM neo'
+            ).fetchone()
+        return {
+            'path': self.path,
+            'objects': counts[0],
+            'hazardous': counts[1] or 0,
+            'with_orbital_elements': counts[2] or 0,
+            'with_sbdb': counts[3] or 0,
+            'approach_date_range': [counts[4], counts[5]],
+            'feed_synced_until': self.get_state('feed_synced_until'),
+            'browse_next_page': self.get_state('browse_next_page', 0),
+            'last_sync': self.get_state('last_sync'),
+            'snapshot_path': self.snapshot_path,
+            'snapshot_available': os.path.exists(self.snapshot_path)
+        }
+
+    # ----------------------------------------
+    # Sincronización incremental
+    # ----------------------------------------
+
+    def sync_feed(self, fetch_feed, today=None):
+        """
+        Sincroniza el feed de NeoWs desde la última fecha guardada hasta hoy
+        + FEED_AHEAD_DAYS, en ventanas de FEED_WINDOW_DAYS.
+
+        fetch_feed(start_date, end_date) devuelve el JSON del feed.
+        """
+        today = today or date.today()
+        synced_until = self.get_state('feed_synced_until')
+        if synced_until:
+            start = date.fromisoformat(synced_until) - timedelta(days=FEED_OVERLAP_DAYS)
+        else:
+            start = today - timedelta(days=FEED_INITIAL_DAYS)
+        end = today + timedelta(days=FEED_AHEAD_DAYS)
+
+        totals = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'windows': 0}
+        while start <= end:
+            window_end = min(start + timedelta(days=FEED_WINDOW_DAYS - 1), end)
+            data = fetch_feed(start.isoformat(), window_end.isoformat())
+            records = [
+                record_from_neows(neo, today.isoformat())
+                for neos in data.get('near_earth_objects', {}).values()
+                for neo in neos
+            ]
+            for key, value in self.upsert(records).items():
+                totals[key] += value
+            totals['windows'] += 1
+            self.set_state('feed_synced_until', window_end.isoformat())
+            start = window_end + timedelta(days=1)
+        return totals
+
+    def sync_browse(self, fetch_page, pages=5):
+        """
+        Descarga `pages` páginas del endpoint browse a partir del cursor
+        guardado; al llegar al final vuelve a empezar (detecta cambios).
+
+        fetch_page(page) devuelve el JSON de la página.
+        """
+        page = self.get_state('browse_next_page', 0)
+        totals = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'pages': 0}
+        today = date.today().isoformat()
+        for _ in range(pages):
+            data = fetch_page(page)
+            records = [record_from_neows(neo, today) for neo in data.get('near_earth_objects', [])]
+            for key, value in self.upsert(records).items():
+                totals[key] += value
+            totals['pages'] += 1
+            total_pages = data.get('page', {}).get('total_pages', 0)
+            page = page + 1 if page + 1 < total_pages else 0
+            self.set_state('browse_next_page', page)
+            if page == 0:
+                break
+        return totals
+
+    def sync(self, fetch_feed, fetch_page=None, browse_pages=0):
+        """Sincronización completa (feed + páginas browse); una a la vez"""
+        if not self._sync_lock.acquire(blocking=False):
+            return {'status': 'already_running'}
+        try:
+            started = time.perf_counter()
+            result = {'feed': self.sync_feed(fetch_feed)}
+            if fetch_page is not None and browse_pages:
+                result['browse'] = self.sync_browse(fetch_page, browse_pages)
+            result['elapsed_s'] = round(time.perf_counter() - started, 3)
+            self.set_state('last_sync', datetime.now().isoformat(timespec='seconds'))
+            self.last_sync = time.time()
+            return result
+        finally:
+            self._sync_lock.release()
+
+    @property
+    def syncing(self):
+        return self._sync_lock.locked()
+
+    # ----------------------------------------
+    # Instantáneas (modo offline)
+    # ----------------------------------------
+
+    def export_snapshot(self, path=None):
+        """Guarda todas las filas (sin las respuestas SBDB) en JSON comprimido"""
+        path = path or self.snapshot_path
+        with self._lock:
+            rows = [dict(row) for row in self._conn.execute(f"SELECT {', '.join(COLUMNS)} FROM neo")]
+        with gzip.open(path, 'wt', encoding='utf-8') as handle:
+            json.dump({
+                'exported_at': datetime.now().isoformat(timespec='seconds'),
+                'feed_synced_until': self.get_state('feed_synced_until'),
+                'objects': rows
+            }, handle)
+        return len(rows)
+
+    def load_snapshot(self, path=None):
+        """Carga una instantánea; devuelve el número de objetos o 0 si no existe"""
+        path = path or self.snapshot_path
+        if not os.path.exists(path):
+            return 0
+        with gzip.open(path, 'rt', encoding='utf-8') as handle:
+            snapshot = json.load(handle)
+        self.upsert(snapshot.get('objects', []))
+        if snapshot.get('feed_synced_until') and not self.get_state('feed_synced_until'):
+            self.set_state('feed_synced_until', snapshot['feed_synced_until'])
+        return len(snapshot.get('objects', []))
+
+    def load_snapshot_if_empty(self):
+        if len(self) == 0:
+            loaded = self.load_snapshot()
+            if loaded:
+                print(f"INFO: Catálogo NEO cargado desde la instantánea ({loaded} objetos)")
+            return loaded
+        return 0
+
+
+if __name__ == '__main__':
+    import argparse
+    import requests
+
+    parser = argparse.ArgumentParser(description='Catálogo local de NEOs')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sync_parser = sub.add_parser('sync', help='Sincronización incremental con NeoWs')
+    sync_parser.add_argument('--browse-pages', type=int, default=0)
+    sync_parser.add_argument('--api-key', default=os.environ.get('NASA_API_KEY', 'DEMO_KEY'))
+    export_parser = sub.add_parser('export', help='Exporta una instantánea para modo offline')
+    export_parser.add_argument('path', nargs='?', default=None)
+    args = parser.parse_args()
+
+    catalog = NeoCatalog()
+    if args.command == 'sync':
+        def fetch_feed(start_date, end_date):
+            response = requests.get('https://api.nasa.gov/neo/rest/v1/feed', timeout=30, params={
+                'start_date': start_date, 'end_date': end_date, 'api_key': args.api_key
+            })
+            response.raise_for_status()
+            return response.json()
+
+        def fetch_page(page):
+            response = requests.get('https://api.nasa.gov/neo/rest/v1/neo/browse', timeout=30, params={
+                'page': page, 'size': 20, 'api_key': args.api_key
+            })
+            response.raise_for_status()
+            return response.json()
+
+        print(json.dumps(catalog.sync(fetch_feed, fetch_page, args.browse_pages), indent=2))
+    else:
+        print(f"SUCCESS: {catalog.export_snapshot(args.path)} objetos exportados")
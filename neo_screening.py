@@ -0,0 +1,314 @@
+"""
+Cribado masivo de aproximaciones a la Tierra para un catálogo de NEOs.
+
+Para cada objeto del catálogo (elementos keplerianos) calcula la MOID con la
+órbita terrestre, la aproximación más cercana en una ventana de tiempo y una
+estimación de la energía de impacto, y devuelve la lista ordenada por riesgo.
+
+El catálogo se divide en bloques de arrays contiguos que se procesan en un
+pool de procesos (todos los núcleos). Las funciones de los workers viven en
+este módulo, que no importa Flask, para que los procesos hijos arranquen
+rápido con el método 'spawn'.
+
+Catálogos admitidos: CSV de la SBDB Query API de JPL (columnas full_name,
+a, e, i, om, w, ma, epoch, H, diameter, albedo) o listas de dicts con las
+mismas claves. También se puede ejecutar desde la línea de comandos:
+
+    python neo_screening.py catalogo.csv [--years 20] [--top 20]
+"""
+
+import csv
+import math
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from lazy_imports import lazy_import
+import orbital_mechanics
+
+np = lazy_import('numpy')
+
+
+CHUNK_SIZE = 512                 # Objetos por tarea del pool
+DEFAULT_YEARS = 20               # Ventana de búsqueda de aproximaciones
+APPROACH_MOID_CUTOFF_AU = 0.2    # Solo se buscan aproximaciones si la MOID es menor
+DEFAULT_ALBEDO = 0.14            # Albedo típico para estimar el diámetro desde H
+DEFAULT_DENSITY = 2600           # kg/m³ (composición rocosa)
+EARTH_ESCAPE_VELOCITY_KM_S = 11.19
+TYPICAL_IMPACT_VELOCITY_KM_S = 20.0   # Si no se calculó la aproximación
+MEGATON_J = 4.184e15
+CATALOG_COLUMNS = ('a', 'e', 'i', 'om', 'w', 'ma', 'epoch', 'H', 'diameter', 'albedo')
+RANK_KEYS = ('moid', 'distance', 'energy')
+MAX_PENDING_JOBS = 4             # Trabajos en cola o en curso antes de rechazar
+
+
+class ScreeningQueueFull(RuntimeError):
+    """Hay demasiados cribados pendientes; el cliente debe reintentar más tarde"""
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def catalog_from_records(records):
+    """Convierte una lista de dicts (claves estilo SBDB) en arrays columnares"""
+    catalog = {'name': np.array([str(r.get('full_name') or r.get('name') or r.get('des') or '').strip()
+                                 for r in records], dtype=object)}
+    for column in CATALOG_COLUMNS:
+        catalog[column] = np.array([_to_float(r.get(column)) for r in records], dtype=float)
+    return catalog
+
+
+def load_catalog_csv(path):
+    """Lee un CSV exportado de la SBDB Query API"""
+    with open(path, newline='', encoding='utf-8') as handle:
+        return catalog_from_records(list(csv.DictReader(handle)))
+
+
+def estimate_diameter_km(absolute_magnitude, albedo=DEFAULT_ALBEDO):
+    """Diámetro (km) a partir de la magnitud absoluta H: D = 1329/√p · 10^(-H/5)"""
+    albedo = np.where(np.isfinite(albedo) & (albedo > 0), albedo, DEFAULT_ALBEDO)
+    return 1329.0 / np.sqrt(albedo) * 10 ** (-np.asarray(absolute_magnitude, dtype=float) / 5)
+
+
+def screen_chunk(chunk, jd_start, jd_end, coarse_step_days=1.0):
+    """
+    Trabajo de un worker: MOID y aproximación más cercana de un bloque.
+
+    `chunk` es un dict de arrays (a, e, i, om, w, ma en grados, epoch en JD).
+    La distancia de aproximación nunca es menor que la MOID, así que el
+    barrido temporal (la parte cara) solo se hace para los objetos con
+    MOID <= APPROACH_MOID_CUTOFF_AU; el resto queda como NaN.
+    """
+    radians = {key: np.radians(chunk[key]) for key in ('i', 'om', 'w', 'ma')}
+    earth = orbital_mechanics.planet_orbit('Earth', (jd_start + jd_end) / 2)
+    moid_au = orbital_mechanics.moid_batch(
+        chunk['a'], chunk['e'], radians['i'], radians['om'], radians['w'], earth
+    )
+
+    distance_au = np.full(len(moid_au), np.nan)
+    approach_jd = np.full(len(moid_au), np.nan)
+    velocity_km_s = np.full(len(moid_au), np.nan)
+    near = moid_au <= APPROACH_MOID_CUTOFF_AU
+    if np.any(near):
+        distance_au[near], approach_jd[near], velocity_km_s[near] = orbital_mechanics.closest_approach_batch(
+            chunk['a'][near], chunk['e'][near], radians['i'][near], radians['om'][near], radians['w'][near],
+            radians['ma'][near], chunk['epoch'][near], jd_start, jd_end, coarse_step_days=coarse_step_days
+        )
+    return {
+        'index': chunk['index'],
+        'moid_au': moid_au,
+        'distance_au': distance_au,
+        'approach_jd': approach_jd,
+        'relative_velocity_km_s': velocity_km_s
+    }
+
+
+def _chunks(catalog, valid_index, chunk_size):
+    for start in range(0, len(valid_index), chunk_size):
+        index = valid_index[start:start + chunk_size]
+        chunk = {key: catalog[key][index] for key in ('a', 'e', 'i', 'om', 'w', 'ma', 'epoch')}
+        chunk['index'] = index
+        yield chunk
+
+
+def screen_catalog(catalog, jd_start, years=DEFAULT_YEARS, top=100, rank_by='moid', density=DEFAULT_DENSITY,
+                   workers=None, chunk_size=CHUNK_SIZE, coarse_step_days=1.0, progress=None):
+    """
+    Criba el catálogo completo y devuelve el ranking y las métricas.
+
+    workers=None usa todos los núcleos; workers=0 ejecuta en el proceso actual.
+    progress(done, total) se llama tras cada bloque terminado.
+    """
+    if rank_by not in RANK_KEYS:
+        raise ValueError(f'rank_by debe ser uno de {RANK_KEYS}')
+    start = time.perf_counter()
+    jd_end = jd_start + years * 365.25
+
+    total = len(catalog['a'])
+    elements_ok = np.ones(total, dtype=bool)
+    for key in ('a', 'e', 'i', 'om', 'w', 'ma', 'epoch'):
+        elements_ok &= np.isfinite(catalog[key])
+    elements_ok &= (catalog['a'] > 0) & (catalog['e'] >= 0) & (catalog['e'] < 1)
+    valid_index = np.nonzero(elements_ok)[0]
+
+    moid_au = np.full(total, np.nan)
+    distance_au = np.full(total, np.nan)
+    approach_jd = np.full(total, np.nan)
+    velocity = np.full(total, np.nan)
+
+    chunks = list(_chunks(catalog, valid_index, chunk_size))
+    # Nunca más procesos que núcleos, los pida quien los pida
+    cpu_count = os.cpu_count() or 1
+    workers = cpu_count if workers is None else max(0, min(workers, cpu_count))
+
+    def store(result):
+        index = result['index']
+        moid_au[index] = result['moid_au']
+        distance_au[index] = result['distance_au']
+        approach_jd[index] = result['approach_jd']
+        velocity[index] = result['relative_velocity_km_s']
+
+    if workers and len(chunks) > 1:
+        # multiprocessing solo se importa cuando hay que repartir el cribado
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=context) as pool:
+            futures = [pool.submit(screen_chunk, chunk, jd_start, jd_end, coarse_step_days) for chunk in chunks]
+            for done, future in enumerate(as_completed(futures), 1):
+                store(future.result())
+                if progress:
+                    progress(done, len(chunks))
+    else:
+        for done, chunk in enumerate(chunks, 1):
+            store(screen_chunk(chunk, jd_start, jd_end, coarse_step_days))
+            if progress:
+                progress(done, len(chunks))
+
+    # Energía de impacto estimada: esfera de densidad dada a la velocidad de
+    # encuentro acelerada por la gravedad terrestre (velocidad típica si el
+    # objeto no llegó al barrido de aproximaciones)
+    diameter_km = np.where(np.isfinite(catalog['diameter']), catalog['diameter'],
+                           estimate_diameter_km(catalog['H'], catalog['albedo']))
+    mass_kg = density * (4 / 3) * np.pi * (diameter_km * 500) ** 3
+    impact_velocity = np.where(
+        np.isfinite(velocity),
+        np.sqrt(velocity ** 2 + EARTH_ESCAPE_VELOCITY_KM_S ** 2),
+        TYPICAL_IMPACT_VELOCITY_KM_S
+    ) * 1000
+    energy_mt = 0.5 * mass_kg * impact_velocity ** 2 / MEGATON_J
+
+    sort_key = {'moid': moid_au, 'distance': distance_au, 'energy': -energy_mt}[rank_by]
+    ranked = valid_index[np.argsort(sort_key[valid_index], kind='stable')][:top]
+    elapsed = time.perf_counter() - start
+
+    objects = []
+    for rank, k in enumerate(ranked, 1):
+        closest_approach = None
+        if np.isfinite(distance_au[k]):
+            closest_approach = {
+                'jd': round(float(approach_jd[k]), 4),
+                'distance_au': round(float(distance_au[k]), 6),
+                'distance_km': round(float(distance_au[k]) * orbital_mechanics.AU_KM, 1),
+                'relative_velocity_km_s': round(float(velocity[k]), 3)
+            }
+        objects.append({
+            'rank': rank,
+            'name': catalog['name'][k],
+            'moid_au': round(float(moid_au[k]), 6),
+            'closest_approach': closest_approach,
+            'diameter_km': round(float(diameter_km[k]), 4) if np.isfinite(diameter_km[k]) else None,
+            'impact_energy_megatons': round(float(energy_mt[k]), 3) if np.isfinite(energy_mt[k]) else None,
+            'potentially_hazardous': bool(moid_au[k] <= 0.05 and np.nan_to_num(diameter_km[k]) >= 0.14)
+        })
+
+    return {
+        'objects': objects,
+        'stats': {
+            'catalog_size': int(total),
+            'screened': int(len(valid_index)),
+            'skipped_invalid_elements': int(total - len(valid_index)),
+            'moid_below_0_05_au': int(np.sum(moid_au[valid_index] <= 0.05)),
+            'approach_scanned': int(np.sum(np.isfinite(distance_au))),
+            'chunks': len(chunks),
+            'workers': int(min(workers, len(chunks))) if workers and len(chunks) > 1 else 1,
+            'elapsed_s': round(elapsed, 3),
+            'objects_per_second': round(len(valid_index) / elapsed, 1) if elapsed > 0 else None
+        },
+        'window': {'jd_start': jd_start, 'jd_end': jd_end, 'years': years},
+        'rank_by': rank_by
+    }
+
+
+class ScreeningJobManager:
+    """
+    Cribados en segundo plano. Un único hilo ejecuta los trabajos de uno en
+    uno, así que como mucho hay un pool de procesos abierto por servidor; los
+    demás esperan en cola. Con max_pending trabajos en cola o en curso,
+    submit lanza ScreeningQueueFull.
+    """
+
+    def __init__(self, max_jobs=20, max_pending=MAX_PENDING_JOBS):
+        self.max_jobs = max_jobs
+        self.max_pending = max_pending
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='screening')
+
+    def submit(self, catalog, **options):
+        job_id = uuid.uuid4().hex
+        job = {
+            'job_id': job_id,
+            'status': 'queued',
+            'progress': {'chunks_done': 0, 'chunks_total': None},
+            'created_at': time.time(),
+            'result': None,
+            'error': None
+        }
+        with self._lock:
+            pending = sum(1 for j in self._jobs.values() if j['status'] in ('queued', 'running'))
+            if pending >= self.max_pending:
+                raise ScreeningQueueFull(f'Hay {pending} cribados pendientes; inténtelo más tarde')
+            # Olvidar los trabajos terminados más antiguos si se supera el límite
+            finished = sorted((j for j in self._jobs.values() if j['status'] in ('done', 'error')),
+                              key=lambda j: j['created_at'])
+            while finished and len(self._jobs) >= self.max_jobs:
+                del self._jobs[finished.pop(0)['job_id']]
+            self._jobs[job_id] = job
+
+        def progress(done, total):
+            with self._lock:
+                job['progress'] = {'chunks_done': done, 'chunks_total': total}
+
+        def run():
+            with self._lock:
+                job['status'] = 'running'
+            try:
+                result = screen_catalog(catalog, progress=progress, **options)
+            except Exception as e:
+                print(f"ERROR: Falló el cribado {job_id}: {e}")
+                with self._lock:
+                    job.update(status='error', error=str(e))
+                return
+            with self._lock:
+                job.update(status='done', result=result)
+
+        self._executor.submit(run)
+        return self.get(job_id)
+
+    def get(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Cribado de aproximaciones a la Tierra de un catálogo de NEOs')
+    parser.add_argument('catalog', help='CSV de la SBDB Query API')
+    parser.add_argument('--years', type=float, default=DEFAULT_YEARS)
+    parser.add_argument('--top', type=int, default=20)
+    parser.add_argument('--rank-by', choices=RANK_KEYS, default='moid')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    from datetime import datetime
+    now_jd = orbital_mechanics.J2000_JD + (datetime.utcnow() - datetime(2000, 1, 1, 12)).total_seconds() / 86400
+    report = screen_catalog(load_catalog_csv(args.catalog), now_jd, years=args.years, top=args.top,
+                            rank_by=args.rank_by, workers=args.workers)
+    stats = report['stats']
+    print(f"SUCCESS: {stats['screened']} objetos cribados en {stats['elapsed_s']} s "
+          f"({stats['objects_per_second']} objetos/s, {stats['workers']} procesos)")
+    for item in report['objects']:
+        approach = item['closest_approach']
+        distance = f"{approach['distance_au']:.5f} UA" if approach else 'no calculada'
+        print(f"{item['rank']:>4}. {item['name']:<35} MOID {item['moid_au']:.5f} UA  "
+              f"mín. {distance}  {item['impact_energy_megatons']} Mt")
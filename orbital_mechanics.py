@@ -0,0 +1,456 @@
+"""
+Mecánica orbital kepleriana vectorizada con NumPy.
+
+Resuelve la ecuación de Kepler (M = E - e·sin E) para arrays completos de
+anomalías medias y genera trayectorias como arrays contiguos, sin bucles
+Python por punto. Pensado para trayectorias de hasta millones de puntos.
+
+Convenciones: ángulos en radianes, distancias en las unidades de `a`
+(metros o UA, según quien llame). Solo órbitas elípticas (0 <= e < 1).
+"""
+
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+
+
+KEPLER_TOLERANCE = 1e-12
+KEPLER_MAX_ITERATIONS = 50
+# Elementos (órbitas × instantes) por bloque del muestreo grueso de
+# closest_approach_batch: unos 100 bytes de intermedios por elemento
+APPROACH_BLOCK_ELEMENTS = 1 << 20
+
+
+def solve_kepler(mean_anomaly, eccentricity, tol=KEPLER_TOLERANCE, max_iterations=KEPLER_MAX_ITERATIONS):
+    """
+    Anomalía excéntrica E para cada anomalía media M (Newton-Raphson vectorizado).
+
+    Usa el arranque de Danby, E0 = M + 0.85·e·sign(sin M), con M reducida a
+    [-π, π]; con él Newton converge para todo 0 <= e < 1, también cerca del
+    perihelio con excentricidades altas. Acepta escalares o arrays (se
+    difunden entre sí) y devuelve E en la misma rama que la M de entrada.
+    """
+    M = np.asarray(mean_anomaly, dtype=float)
+    e = np.asarray(eccentricity, dtype=float)
+    if np.any((e < 0) | (e >= 1)):
+        raise ValueError('La excentricidad debe cumplir 0 <= e < 1')
+
+    # Reducir M a [-π, π] y recordar el número de vueltas para devolverlo
+    turns = np.round(M / (2 * np.pi))
+    M_reduced = M - 2 * np.pi * turns
+    M_reduced, e = np.broadcast_arrays(M_reduced, e)
+
+    E = M_reduced + 0.85 * e * np.sign(np.sin(M_reduced))
+    for _ in range(max_iterations):
+        sin_E = np.sin(E)
+        cos_E = np.cos(E)
+        delta = (E - e * sin_E - M_reduced) / (1 - e * cos_E)
+        E = E - delta
+        if np.max(np.abs(delta), initial=0.0) < tol:
+            break
+
+    return E + 2 * np.pi * turns
+
+
+def true_anomaly(eccentric_anomaly, eccentricity):
+    """Anomalía verdadera ν a partir de la excéntrica E"""
+    E = np.asarray(eccentric_anomaly, dtype=float)
+    e = np.asarray(eccentricity, dtype=float)
+    return 2 * np.arctan2(np.sqrt(1 + e) * np.sin(E / 2), np.sqrt(1 - e) * np.cos(E / 2))
+
+
+def orbital_plane_positions(semi_major_axis, eccentricity, mean_anomaly):
+    """Posición (x, y, r) en el plano orbital, con el perihelio sobre +x"""
+    a = np.asarray(semi_major_axis, dtype=float)
+    e = np.asarray(eccentricity, dtype=float)
+    E = solve_kepler(mean_anomaly, e)
+    cos_E = np.cos(E)
+    r = a * (1 - e * cos_E)
+    x = a * (cos_E - e)
+    y = a * np.sqrt(1 - e ** 2) * np.sin(E)
+    return x, y, r
+
+
+def rotate_to_ecliptic(x_orb, y_orb, inclination, ascending_node, arg_perihelion):
+    """Rota coordenadas del plano orbital al sistema eclíptico (ángulos en rad)"""
+    cos_w, sin_w = np.cos(arg_perihelion), np.sin(arg_perihelion)
+    cos_o, sin_o = np.cos(ascending_node), np.sin(ascending_node)
+    cos_i, sin_i = np.cos(inclination), np.sin(inclination)
+
+    x_w = x_orb * cos_w - y_orb * sin_w
+    y_w = x_orb * sin_w + y_orb * cos_w
+
+    x = x_w * cos_o - y_w * sin_o * cos_i
+    y = x_w * sin_o + y_w * cos_o * cos_i
+    z = y_w * sin_i
+    return x, y, z
+
+
+def trajectory(semi_major_axis, eccentricity, inclination=0.0, ascending_node=0.0,
+               arg_perihelion=0.0, num_points=100, mean_anomaly_start=0.0):
+    """
+    Trayectoria de num_points puntos equiespaciados en anomalía media.
+
+    Devuelve un dict de arrays contiguos: time_fraction, mean_anomaly,
+    eccentric_anomaly, x, y, z, r.
+    """
+    time_fraction = np.arange(num_points, dtype=float) / num_points
+    M = mean_anomaly_start + 2 * np.pi * time_fraction
+    E = solve_kepler(M, eccentricity)
+
+    a = float(semi_major_axis)
+    e = float(eccentricity)
+    cos_E = np.cos(E)
+    r = a * (1 - e * cos_E)
+    # Se conservan las coordenadas del generador original (x = r·cos E,
+    # y = r·√(1-e²)·sin E) para no alterar lo que dibuja el frontend;
+    # orbital_plane_positions da la posición focal exacta.
+    x_orb = r * cos_E
+    y_orb = r * np.sqrt(1 - e ** 2) * np.sin(E)
+    x, y, z = rotate_to_ecliptic(x_orb, y_orb, inclination, ascending_node, arg_perihelion)
+
+    return {
+        'time_fraction': time_fraction,
+        'mean_anomaly': M,
+        'eccentric_anomaly': E,
+        'x': x,
+        'y': y,
+        'z': z,
+        'r': r
+    }
+
+
+# ============================================
+# PROPAGACIÓN DE DOS CUERPOS Y APROXIMACIONES
+# ============================================
+# Unidades: UA, días, radianes. Marco eclíptico J2000 heliocéntrico.
+
+GM_SUN_AU3_D2 = 0.01720209895 ** 2   # Constante gravitacional gaussiana al cuadrado
+AU_KM = 149597870.7
+LUNAR_DISTANCE_KM = 384400.0
+J2000_JD = 2451545.0
+DAYS_PER_CENTURY = 36525.0
+
+# Elementos keplerianos aproximados (Standish, JPL; válidos 1800-2050) y sus
+# tasas por siglo juliano: a [UA], e, I [°], L [°], ϖ [°], Ω [°]
+PLANET_ELEMENTS = {
+    'Mercury': ((0.38709927, 0.20563593, 7.00497902, 252.25032350, 77.45779628, 48.33076593),
+                (0.00000037, 0.00001906, -0.00594749, 149472.67411175, 0.16047689, -0.12534081)),
+    'Venus': ((0.72333566, 0.00677672, 3.39467605, 181.97909950, 131.60246718, 76.67984255),
+              (0.00000390, -0.00004107, -0.00078890, 58517.81538729, 0.00268329, -0.27769418)),
+    'Earth': ((1.00000261, 0.01671123, -0.00001531, 100.46457166, 102.93768193, 0.0),
+              (0.00000562, -0.00004392, -0.01294668, 35999.37244981, 0.32327364, 0.0)),
+    'Mars': ((1.52371034, 0.09339410, 1.84969142, -4.55343205, -23.94362959, 49.55953891),
+             (0.00001847, 0.00007882, -0.00813131, 19140.30268499, 0.44441088, -0.29257343)),
+    'Jupiter': ((5.20288700, 0.04838624, 1.30439695, 34.39644051, 14.72847983, 100.47390909),
+                (-0.00011607, -0.00013253, -0.00183714, 3034.74612775, 0.21252668, 0.20469106)),
+    'Saturn': ((9.53667594, 0.05386179, 2.48599187, 49.95424423, 92.59887831, 113.66242448),
+               (-0.00125060, -0.00050991, 0.00193609, 1222.49362201, -0.41897216, -0.28867794)),
+}
+
+
+def state_from_elements(a, e, inclination, ascending_node, arg_perihelion, mean_anomaly, mu=GM_SUN_AU3_D2,
+                        with_velocity=True):
+    """
+    Posición (UA) y velocidad (UA/día) eclípticas, arrays (..., 3).
+
+    Con with_velocity=False la velocidad es None (ahorra la mitad del trabajo
+    en barridos donde solo importa la distancia).
+    """
+    E = solve_kepler(mean_anomaly, e)
+    cos_E, sin_E = np.cos(E), np.sin(E)
+    sqrt_1me2 = np.sqrt(1 - e ** 2)
+
+    x_orb = a * (cos_E - e)
+    y_orb = a * sqrt_1me2 * sin_E
+    position = np.stack(rotate_to_ecliptic(x_orb, y_orb, inclination, ascending_node, arg_perihelion), axis=-1)
+    if not with_velocity:
+        return position, None
+
+    n = np.sqrt(mu / a ** 3)
+    denom = 1 - e * cos_E
+    vx_orb = -a * n * sin_E / denom
+    vy_orb = a * n * sqrt_1me2 * cos_E / denom
+    velocity = np.stack(rotate_to_ecliptic(vx_orb, vy_orb, inclination, ascending_node, arg_perihelion), axis=-1)
+    return position, velocity
+
+
+class KeplerOrbit:
+    """Órbita kepleriana heliocéntrica con época (propagador de dos cuerpos)"""
+
+    def __init__(self, a, e, inclination, ascending_node, arg_perihelion, mean_anomaly, epoch_jd=J2000_JD,
+                 mu=GM_SUN_AU3_D2):
+        self.a = float(a)
+        self.e = float(e)
+        if self.a <= 0 or not 0 <= self.e < 1:
+            raise ValueError('Solo se admiten órbitas elípticas (a > 0, 0 <= e < 1)')
+        self.inclination = float(inclination)
+        self.ascending_node = float(ascending_node)
+        self.arg_perihelion = float(arg_perihelion)
+        self.mean_anomaly = float(mean_anomaly)
+        self.epoch_jd = float(epoch_jd)
+        self.mu = mu
+
+    @classmethod
+    def from_elements(cls, elements, epoch_jd=None):
+        """
+        Construye la órbita a partir de elementos con el formato de la SBDB
+        (semi_major_axis_au, eccentricity, *_deg, epoch_jd).
+        """
+        epoch = epoch_jd if epoch_jd is not None else elements.get('epoch_jd') or J2000_JD
+        return cls(
+            float(elements['semi_major_axis_au']),
+            float(elements['eccentricity']),
+            np.radians(float(elements.get('inclination_deg') or 0)),
+            np.radians(float(elements.get('longitude_ascending_node_deg') or 0)),
+            np.radians(float(elements.get('argument_perihelion_deg') or 0)),
+            np.radians(float(elements.get('mean_anomaly_deg') or 0)),
+            float(epoch)
+        )
+
+    @property
+    def mean_motion(self):
+        """Movimiento medio (rad/día)"""
+        return np.sqrt(self.mu / self.a ** 3)
+
+    @property
+    def period_days(self):
+        return 2 * np.pi / self.mean_motion
+
+    def state(self, jd, with_velocity=True):
+        """Posición (UA) y velocidad (UA/día) en las fechas jd (array), arrays (N, 3)"""
+        jd = np.atleast_1d(np.asarray(jd, dtype=float))
+        M = self.mean_anomaly + self.mean_motion * (jd - self.epoch_jd)
+        return state_from_elements(
+            self.a, self.e, self.inclination, self.ascending_node, self.arg_perihelion, M, self.mu,
+            with_velocity=with_velocity
+        )
+
+    def positions(self, jd):
+        return self.state(jd, with_velocity=False)[0]
+
+    def positions_at_eccentric_anomaly(self, E):
+        """Puntos de la elipse (N, 3) para anomalías excéntricas dadas (sin tiempo)"""
+        E = np.asarray(E, dtype=float)
+        x_orb = self.a * (np.cos(E) - self.e)
+        y_orb = self.a * np.sqrt(1 - self.e ** 2) * np.sin(E)
+        return np.stack(rotate_to_ecliptic(
+            x_orb, y_orb, self.inclination, self.ascending_node, self.arg_perihelion
+        ), axis=-1)
+
+
+def planet_elements(name, jd):
+    """Elementos (a, e, I, Ω, ω, M) del planeta en las fechas jd, en radianes"""
+    base, rate = PLANET_ELEMENTS[name]
+    T = (np.asarray(jd, dtype=float) - J2000_JD) / DAYS_PER_CENTURY
+    a, e, I, L, varpi, node = (b + r * T for b, r in zip(base, rate))
+    return (a, e, np.radians(I), np.radians(node), np.radians(varpi - node), np.radians(L - varpi))
+
+
+def planet_state(name, jd, with_velocity=True):
+    """Posición (UA) y velocidad (UA/día) del planeta en las fechas jd, arrays (N, 3)"""
+    jd = np.atleast_1d(np.asarray(jd, dtype=float))
+    a, e, I, node, w, M = planet_elements(name, jd)
+    return state_from_elements(a, e, I, node, w, M, with_velocity=with_velocity)
+
+
+def planet_orbit(name, jd=J2000_JD):
+    """Órbita osculante aproximada del planeta en la época jd"""
+    a, e, I, node, w, M = planet_elements(name, jd)
+    return KeplerOrbit(a, e, I, node, w, M, epoch_jd=jd)
+
+
+def moid(orbit, reference):
+    """Distancia mínima entre dos órbitas (MOID, UA); ver moid_batch()"""
+    return float(moid_batch(
+        [orbit.a], [orbit.e], [orbit.inclination], [orbit.ascending_node], [orbit.arg_perihelion], reference
+    )[0])
+
+
+def close_approaches(orbit, jd_start, jd_end, threshold_au=0.05, body='Earth', coarse_step_days=1.0,
+                     tolerance_days=1e-4):
+    """
+    Aproximaciones de la órbita al cuerpo `body` entre jd_start y jd_end.
+
+    1. Muestreo grueso de la distancia con paso coarse_step_days.
+    2. Mínimos locales por debajo del umbral (con margen por el muestreo).
+    3. Refinamiento adaptativo: cada mínimo se re-muestrea en su intervalo
+       con 17 puntos y el intervalo se reduce hasta tolerance_days. Todos
+       los candidatos se refinan a la vez (arrays (C, 17)).
+
+    Devuelve una lista de dicts ordenada por fecha con jd, distance_au y
+    relative_velocity_km_s.
+    """
+    jd = np.arange(jd_start, jd_end + coarse_step_days, coarse_step_days, dtype=float)
+    position = orbit.positions(jd)
+    body_position = planet_state(body, jd)[0]
+    distance = np.linalg.norm(position - body_position, axis=1)
+
+    # Margen: entre muestras la distancia puede bajar hasta |v_rel|·paso/2
+    margin = 0.02 * coarse_step_days
+    interior = (distance[1:-1] <= distance[:-2]) & (distance[1:-1] <= distance[2:])
+    candidates = np.nonzero(interior & (distance[1:-1] < threshold_au + margin))[0] + 1
+    if candidates.size == 0:
+        return []
+
+    low = jd[candidates - 1]
+    high = jd[candidates + 1]
+    offsets = np.linspace(0.0, 1.0, 17)
+    while True:
+        times = low[:, None] + (high - low)[:, None] * offsets[None, :]
+        flat = times.ravel()
+        d = np.linalg.norm(orbit.positions(flat) - planet_state(body, flat)[0], axis=1).reshape(times.shape)
+        best = np.argmin(d, axis=1)
+        step = (high - low) / 16
+        best_time = times[np.arange(len(best)), best]
+        if np.all(step < tolerance_days):
+            break
+        low = best_time - step
+        high = best_time + step
+
+    position, velocity = orbit.state(best_time)
+    body_position, body_velocity = planet_state(body, best_time)
+    distance = np.linalg.norm(position - body_position, axis=1)
+    relative_velocity = np.linalg.norm(velocity - body_velocity, axis=1) * AU_KM / 86400
+
+    # Mínimos repetidos (mesetas en el muestreo grueso) colapsan al mismo instante
+    approaches = []
+    for t, dist, v_rel in sorted(zip(best_time.tolist(), distance.tolist(), relative_velocity.tolist())):
+        if dist >= threshold_au:
+            continue
+        if approaches and abs(t - approaches[-1]['jd']) < 1.0:
+            if dist < approaches[-1]['distance_au']:
+                approaches[-1].update(jd=t, distance_au=dist, relative_velocity_km_s=v_rel)
+            continue
+        approaches.append({'jd': t, 'distance_au': dist, 'relative_velocity_km_s': v_rel})
+    return approaches
+
+
+def _ellipse_points(a, e, inclination, ascending_node, arg_perihelion, E):
+    """Puntos (n, K, 3) de n elipses para anomalías excéntricas E (n, K)"""
+    x_orb = a * (np.cos(E) - e)
+    y_orb = a * np.sqrt(1 - e ** 2) * np.sin(E)
+    return np.stack(rotate_to_ecliptic(x_orb, y_orb, inclination, ascending_node, arg_perihelion), axis=-1)
+
+
+def moid_batch(a, e, inclination, ascending_node, arg_perihelion, reference, samples=180, refinements=24,
+               candidates=2, batch_size=64):
+    """
+    MOID (UA) de n órbitas frente a una órbita de referencia (p. ej. la Tierra).
+
+    Versión vectorizada de moid() para catálogos: los elementos son arrays
+    (n,) y el cálculo se hace por lotes de batch_size órbitas para acotar la
+    memoria de la matriz (lote, K, K). Se refinan los `candidates` mínimos
+    locales más profundos de la malla gruesa de cada órbita.
+    """
+    a, e, inclination, ascending_node, arg_perihelion = (
+        np.asarray(values, dtype=float)[:, None]
+        for values in (a, e, inclination, ascending_node, arg_perihelion)
+    )
+    grid = np.linspace(0, 2 * np.pi, samples, endpoint=False)
+    ref_points = reference.positions_at_eccentric_anomaly(grid)
+    ref_norm2 = np.sum(ref_points ** 2, axis=1)
+    result = np.empty(len(a))
+
+    for start in range(0, len(a), batch_size):
+        s = slice(start, start + batch_size)
+        n = len(a[s])
+        points = _ellipse_points(a[s], e[s], inclination[s], ascending_node[s], arg_perihelion[s],
+                                 np.broadcast_to(grid, (n, samples)))
+        # |p - q|² = |p|² + |q|² - 2 p·q evita el array (lote, K, K, 3)
+        dist2 = points @ (-2 * ref_points.T)
+        dist2 += np.sum(points ** 2, axis=2)[:, :, None]
+        dist2 += ref_norm2[None, None, :]
+        # Candidatos: los mínimos locales (en la anomalía del objeto) más
+        # profundos; una órbita puede tener dos mínimos casi empatados
+        row_min = np.min(dist2, axis=2)
+        is_local_min = (row_min <= np.roll(row_min, 1, axis=1)) & (row_min <= np.roll(row_min, -1, axis=1))
+        ranked = np.argsort(np.where(is_local_min, row_min, np.inf), axis=1)[:, :candidates]
+        rows = np.repeat(np.arange(n), candidates)
+        index_a = ranked.ravel()
+        index_b = np.argmin(dist2[rows, index_a], axis=1)
+        center_a = grid[index_a]
+        center_b = grid[index_b]
+
+        elements = [values[s][rows] for values in (a, e, inclination, ascending_node, arg_perihelion)]
+        half_width = 2 * np.pi / samples
+        offsets = np.linspace(-1.0, 1.0, 11)
+        flat_rows = np.arange(len(rows))
+        for _ in range(refinements):
+            local_a = center_a[:, None] + half_width * offsets[None, :]
+            local_b = center_b[:, None] + half_width * offsets[None, :]
+            pa = _ellipse_points(*elements, local_a)
+            pb = reference.positions_at_eccentric_anomaly(local_b)
+            local = np.sum((pa[:, :, None, :] - pb[:, None, :, :]) ** 2, axis=-1).reshape(len(rows), -1)
+            best = np.argmin(local, axis=1)
+            center_a = local_a[flat_rows, best // len(offsets)]
+            center_b = local_b[flat_rows, best % len(offsets)]
+            # Reducción lenta: el mínimo está en un valle diagonal en (E_a, E_b)
+            half_width /= 2
+        refined = np.sqrt(local[flat_rows, best]).reshape(n, candidates)
+        result[s] = np.min(refined, axis=1)
+
+    return result
+
+
+def closest_approach_batch(a, e, inclination, ascending_node, arg_perihelion, mean_anomaly, epoch_jd,
+                           jd_start, jd_end, body='Earth', coarse_step_days=1.0, tolerance_days=1e-3,
+                           block_elements=APPROACH_BLOCK_ELEMENTS):
+    """
+    Aproximación más cercana de cada una de n órbitas al cuerpo en la ventana.
+
+    Muestreo grueso (n, T) y refinamiento vectorizado del mínimo global de
+    cada órbita. El muestreo se recorre en bloques de instantes con un mínimo
+    acumulado, de modo que la memoria queda acotada por block_elements y no
+    por n·T. Devuelve (distancia UA, jd, velocidad relativa km/s), arrays (n,).
+    """
+    elements = [np.asarray(values, dtype=float)[:, None]
+                for values in (a, e, inclination, ascending_node, arg_perihelion, mean_anomaly, epoch_jd)]
+    a, e, inclination, ascending_node, arg_perihelion, M0, epoch = elements
+    n_motion = np.sqrt(GM_SUN_AU3_D2 / a ** 3)
+
+    def states(jd, with_velocity=False):
+        position, velocity = state_from_elements(
+            a, e, inclination, ascending_node, arg_perihelion, M0 + n_motion * (jd - epoch),
+            with_velocity=with_velocity
+        )
+        body_position, body_velocity = planet_state(body, jd.ravel(), with_velocity=with_velocity)
+        shape = jd.shape + (3,)
+        body_position = np.broadcast_to(body_position.reshape(shape), position.shape)
+        if with_velocity:
+            body_velocity = np.broadcast_to(body_velocity.reshape(shape), velocity.shape)
+        return position, velocity, body_position, body_velocity
+
+    jd = np.arange(jd_start, jd_end + coarse_step_days, coarse_step_days, dtype=float)[None, :]
+    block = max(1, block_elements // max(len(a), 1))
+    best = np.zeros(len(a), dtype=int)
+    best_distance = np.full(len(a), np.inf)
+    for offset in range(0, jd.shape[1], block):
+        position, _, body_position, _ = states(jd[:, offset:offset + block])
+        distance = np.linalg.norm(position - body_position, axis=-1)
+        block_best = np.argmin(distance, axis=1)
+        block_distance = distance[np.arange(len(block_best)), block_best]
+        # Estrictamente menor: ante empates gana el primer instante, como argmin
+        closer = block_distance < best_distance
+        best[closer] = offset + block_best[closer]
+        best_distance[closer] = block_distance[closer]
+    rows = np.arange(len(best))
+
+    low = jd[0, np.maximum(best - 1, 0)]
+    high = jd[0, np.minimum(best + 1, jd.shape[1] - 1)]
+    offsets = np.linspace(0.0, 1.0, 17)
+    while True:
+        times = low[:, None] + (high - low)[:, None] * offsets[None, :]
+        position, _, body_position, _ = states(times)
+        d = np.linalg.norm(position - body_position, axis=-1)
+        best_time = times[rows, np.argmin(d, axis=1)]
+        step = (high - low) / 16
+        if np.all(step < tolerance_days):
+            break
+        low = np.maximum(best_time - step, jd_start)
+        high = np.minimum(best_time + step, jd_end)
+
+    position, velocity, body_position, body_velocity = states(best_time[:, None], with_velocity=True)
+    distance = np.linalg.norm(position - body_position, axis=-1)[:, 0]
+    relative_velocity = np.linalg.norm(velocity - body_velocity, axis=-1)[:, 0] * AU_KM / 86400
+    return distance, best_time, relative_velocity
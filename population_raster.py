@@ -0,0 +1,250 @@
+"""
+Ráster local de población en teselas de 1°×1° (compatible con WorldPop).
+
+Sustituye las tres consultas a la API de WorldPop (un círculo de 64 puntos
+por zona, restando después los círculos interiores) por una sola pasada
+sobre teselas mapeadas en memoria: cada celda se asigna a su anillo
+concéntrico por distancia de círculo máximo y la población se suma por
+anillo con np.bincount. No hay resta de círculos ni error de diferencia.
+
+Formato de las teselas (mismo nombre que dem_store: N40W004, S34E018):
+    <nombre>.npy   Array 2D float, fila 0 = borde norte. Cada valor es el
+                   centro de una celda ("pixel-is-area"), como en WorldPop.
+                   Los valores negativos o NaN (nodata) cuentan como 0.
+
+Unidades (fichero opcional units.txt en el directorio):
+    count    Personas por celda (WorldPop "ppp"; por defecto)
+    density  Personas por km²; se multiplica por el área real de cada
+             celda, que disminuye con cos(lat)
+
+Para anillos pequeños respecto a la celda, cada celda se subdivide en
+s×s subceldas con la población repartida por igual, de modo que las
+celdas cortadas por el borde de un anillo contribuyen en proporción a su
+área interior.
+
+Directorio configurable con POPULATION_TILES_DIR (por defecto
+data/population junto a este fichero).
+"""
+
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from lazy_imports import lazy_import
+from dem_store import tile_name
+
+np = lazy_import('numpy')
+
+
+DEFAULT_TILES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'population')
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+MAX_OPEN_TILES = 2048        # Un evento de 10.000 Mt cubre unas 800 teselas de 1°
+MAX_SUBDIVISION = 8
+SUBCELL_BUDGET = 4_000_000   # Subceldas máximas por consulta al subdividir
+
+
+class PopulationRasterStore:
+    """Teselas de población mapeadas en memoria con exposición por anillos"""
+
+    def __init__(self, directory=None, max_open_tiles=MAX_OPEN_TILES):
+        self.directory = directory or os.environ.get('POPULATION_TILES_DIR', DEFAULT_TILES_DIR)
+        self.max_open_tiles = max_open_tiles
+        self._tiles = OrderedDict()
+        self._lock = threading.Lock()
+        self.units = 'count'
+        units_path = os.path.join(self.directory, 'units.txt')
+        if os.path.exists(units_path):
+            with open(units_path, encoding='utf-8') as handle:
+                self.units = handle.read().strip() or 'count'
+        if self.units not in ('count', 'density'):
+            raise ValueError(f"units.txt debe contener 'count' o 'density', no '{self.units}'")
+
+    @property
+    def available(self):
+        """True si el directorio existe y contiene alguna tesela"""
+        if not os.path.isdir(self.directory):
+            return False
+        return any(name.endswith('.npy') for name in os.listdir(self.directory))
+
+    def _get_tile(self, lat_index, lon_index):
+        key = (lat_index, lon_index)
+        with self._lock:
+            if key in self._tiles:
+                self._tiles.move_to_end(key)
+                return self._tiles[key]
+        path = os.path.join(self.directory, tile_name(lat_index, lon_index) + '.npy')
+        tile = np.load(path, mmap_mode='r') if os.path.exists(path) else None
+        with self._lock:
+            self._tiles[key] = tile
+            while len(self._tiles) > self.max_open_tiles:
+                self._tiles.popitem(last=False)
+        return tile
+
+    def ring_exposure(self, lat, lon, radii_km):
+        """
+        Población en cada anillo concéntrico alrededor de (lat, lon).
+
+        radii_km son los radios exteriores (se ordenan); el anillo i va de
+        radii[i-1] a radii[i] y el primero es el círculo central. Devuelve
+        un dict con rings (radio interior/exterior y población del anillo),
+        cumulative (población dentro de cada radio), cells, missing_tiles y
+        elapsed_ms.
+        """
+        started = time.perf_counter()
+        radii = np.sort(np.asarray(radii_km, dtype=float))
+        if radii.size == 0 or radii[0] <= 0:
+            raise ValueError('Se necesita al menos un radio positivo')
+
+        # Umbrales en el espacio del término haversine a = sin²(d / 2R), monótono en d
+        thresholds = haversine_term(radii)
+        min_band = float(np.min(np.diff(np.concatenate(([0.0], radii)))))
+        totals = np.zeros(radii.size + 1)
+        stats = {'cells': 0, 'missing_tiles': 0}
+
+        for values, a in self.iter_cells(lat, lon, radii[-1], min_band, stats):
+            bands = np.searchsorted(thresholds, a.ravel(), side='left')
+            totals += np.bincount(bands, weights=values.ravel(), minlength=thresholds.size + 1)
+
+        rings = totals[:radii.size]
+        inner = np.concatenate(([0.0], radii[:-1]))
+        return {
+            'rings': [
+                {'inner_km': float(r0), 'outer_km': float(r1), 'population': float(p)}
+                for r0, r1, p in zip(inner, radii, rings)
+            ],
+            'cumulative': np.cumsum(rings).tolist(),
+            'cells': stats['cells'],
+            'missing_tiles': stats['missing_tiles'],
+            'units': self.units,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 2)
+        }
+
+    def iter_cells(self, lat, lon, max_radius_km, min_feature_km, stats=None):
+        """
+        Recorre las teselas que cubren el círculo de max_radius_km y produce,
+        por tesela, (población por (sub)celda, término haversine a) como
+        arrays 2D. La distancia de cada celda es 2R·asin(√a).
+
+        min_feature_km es la escala más pequeña que se quiere resolver (el
+        anillo más estrecho); decide la subdivisión de las celdas. stats
+        acumula cells y missing_tiles.
+        """
+        stats = stats if stats is not None else {'cells': 0, 'missing_tiles': 0}
+        lat0 = math.radians(lat)
+        cos_lat0 = math.cos(lat0)
+        max_term = float(haversine_term(max_radius_km))
+
+        lat_half = max_radius_km / KM_PER_DEGREE
+        lat_min, lat_max = max(-90.0, lat - lat_half), min(90.0, lat + lat_half)
+        if lat_min <= -89.999 or lat_max >= 89.999 or cos_lat0 < 1e-6:
+            lon_half = 180.0
+        else:
+            # Mayor extensión en longitud del círculo: en la latitud más cercana al polo
+            pole_lat = max(abs(lat_min), abs(lat_max))
+            lon_half = min(180.0, lat_half / max(math.cos(math.radians(pole_lat)), 1e-6))
+
+        lon_start = math.floor(lon - lon_half)
+        lon_stop = min(math.floor(lon + lon_half), lon_start + 359)
+        for lat_index in range(math.floor(lat_min), min(math.floor(lat_max), 89) + 1):
+            # Franja de latitudes de la tesela que cae dentro del círculo
+            band_south = max(float(lat_index), lat_min)
+            band_north = min(float(lat_index + 1), lat_max)
+            for raw_lon_index in range(lon_start, lon_stop + 1):
+                lon_span = _circle_lon_span(lat0, cos_lat0, lon, raw_lon_index, band_south, band_north, max_term)
+                if lon_span is None:
+                    continue
+                lon_index = (raw_lon_index + 180) % 360 - 180
+                tile = self._get_tile(lat_index, lon_index)
+                if tile is None:
+                    stats['missing_tiles'] += 1
+                    continue
+                block = self._tile_cells(tile, lat_index, lon_index, raw_lon_index, lat0, cos_lat0, lon,
+                                         band_south, band_north, lon_span, min_feature_km)
+                if block is not None:
+                    stats['cells'] += block[2]
+                    yield block[0], block[1]
+
+    def _tile_cells(self, tile, lat_index, lon_index, raw_lon_index, lat0, cos_lat0, lon,
+                    band_south, band_north, lon_span, min_feature_km):
+        rows, cols = tile.shape
+        # Recorte a las filas de la franja y a las columnas que el círculo
+        # alcanza en ella (raw_lon_index es la longitud sin envolver)
+        row_start = max(0, int(math.floor((lat_index + 1 - band_north) * rows)))
+        row_stop = min(rows, int(math.ceil((lat_index + 1 - band_south) * rows)))
+        col_start = max(0, int(math.floor((lon_span[0] - raw_lon_index) * cols)))
+        col_stop = min(cols, int(math.ceil((lon_span[1] - raw_lon_index) * cols)))
+        if row_start >= row_stop or col_start >= col_stop:
+            return None
+
+        block = np.asarray(tile[row_start:row_stop, col_start:col_stop], dtype=float)
+        block = np.where(np.isfinite(block) & (block > 0), block, 0.0)
+
+        # Subdivisión si las celdas son grandes respecto al anillo más estrecho
+        cell_km = KM_PER_DEGREE / rows
+        s = min(MAX_SUBDIVISION, max(1, math.ceil(8 * cell_km / min_feature_km)))
+        while s > 1 and block.size * s * s > SUBCELL_BUDGET:
+            s -= 1
+        sub_rows, sub_cols = rows * s, cols * s
+
+        # Centros de (sub)celda; la fila 0 es el borde norte
+        row_offsets = np.arange(row_start * s, row_stop * s) + 0.5
+        cell_lats = np.radians(lat_index + 1 - row_offsets / sub_rows)
+        cell_lons = np.radians(lon_index + (np.arange(col_start * s, col_stop * s) + 0.5) / sub_cols)
+
+        values = block
+        if self.units == 'density':
+            # Área exacta de cada fila de celdas: R²·Δλ·(sin φ_norte − sin φ_sur)
+            edges = np.radians(lat_index + 1 - np.arange(row_start, row_stop + 1) / rows)
+            areas = EARTH_RADIUS_KM ** 2 * math.radians(1 / cols) * (np.sin(edges[:-1]) - np.sin(edges[1:]))
+            values = values * areas[:, None]
+        if s > 1:
+            values = np.repeat(np.repeat(values, s, axis=0), s, axis=1) / (s * s)
+
+        a = (np.sin((cell_lats - lat0) / 2) ** 2)[:, None] \
+            + (cos_lat0 * np.cos(cell_lats))[:, None] * (np.sin((cell_lons - math.radians(lon)) / 2) ** 2)[None, :]
+        return values, a, block.size
+
+
+def _circle_lon_span(lat0, cos_lat0, lon, raw_lon_index, band_south, band_north, max_term):
+    """
+    Longitudes (grados, sin envolver) que el círculo de término max_term
+    alcanza en la franja [band_south, band_north] de la tesela que empieza
+    en raw_lon_index, o None si ningún punto de la tesela está dentro.
+
+    Cota conservadora: cada sumando de a = sin²(Δφ/2) + cos φ0·cos φ·sin²(Δλ/2)
+    se minimiza por separado en la franja, así que nunca se descarta una
+    celda del círculo.
+    """
+    south, north = math.radians(band_south), math.radians(band_north)
+    nearest_lat = min(max(lat0, south), north)
+    lat_term = math.sin((nearest_lat - lat0) / 2) ** 2
+    if lat_term > max_term * (1 + 1e-9):
+        return None
+    # cos φ es cóncava en [-90°, 90°]: su mínimo en la franja está en un borde
+    cos_term = cos_lat0 * min(math.cos(south), math.cos(north))
+    if cos_term <= 0:
+        return float(raw_lon_index), float(raw_lon_index + 1)
+    ratio = (max_term - lat_term) / cos_term
+    if ratio >= 1:
+        return float(raw_lon_index), float(raw_lon_index + 1)
+    lon_half = math.degrees(2 * math.asin(math.sqrt(max(ratio, 0.0)))) * (1 + 1e-9) + 1e-9
+    if lon_half >= 179:
+        # La tesela puede estar al otro lado del antimeridiano relativo
+        return float(raw_lon_index), float(raw_lon_index + 1)
+    west, east = max(float(raw_lon_index), lon - lon_half), min(float(raw_lon_index + 1), lon + lon_half)
+    if west >= east:
+        return None
+    return west, east
+
+
+def haversine_term(distance_km):
+    """Término a = sin²(d / 2R) de la fórmula haversine para una distancia"""
+    return np.sin(np.minimum(np.asarray(distance_km, dtype=float) / EARTH_RADIUS_KM, math.pi) / 2) ** 2
+
+
+def distance_from_term(a):
+    """Distancia (km) a partir del término haversine a"""
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
@@ -0,0 +1,181 @@
+"""
+Trabajos en segundo plano para generar los reportes científicos en PDF.
+
+El endpoint síncrono construye toda la historia de ReportLab dentro de la
+petición y bloquea un worker durante segundos. Con este módulo:
+
+- submit(payload) devuelve un identificador de trabajo al instante y un
+  pool de hilos acotado renderiza el PDF.
+- Los PDF terminados se cachean (LRU) por el hash SHA-256 del payload
+  normalizado: volver a pedir el mismo escenario no cuesta nada.
+- Dos envíos idénticos mientras el primero sigue en curso comparten trabajo.
+
+Configuración por variables de entorno:
+    REPORT_JOBS_WORKERS       Hilos de renderizado (2)
+    REPORT_CACHE_MAX_ENTRIES  PDF cacheados en memoria (32)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+JOB_RETENTION_S = 3600   # Tiempo que se conserva el estado de un trabajo terminado
+MAX_JOBS = 1000          # Límite de trabajos registrados (los más antiguos se olvidan)
+
+
+def content_hash(payload):
+    """Hash estable del contenido del reporte (independiente del orden de claves)"""
+    normalized = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+class ReportJobManager:
+    """Cola de renderizado de PDF con caché por contenido"""
+
+    def __init__(self, render, max_workers=2, max_cached=32):
+        self.render = render
+        self.max_cached = max_cached
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='report')
+        self._pdfs = OrderedDict()      # content_hash -> bytes
+        self._jobs = OrderedDict()      # job_id -> estado
+        self._inflight = {}             # content_hash -> job_id
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _cached_pdf(self, key):
+        with self._lock:
+            pdf = self._pdfs.get(key)
+            if pdf is not None:
+                self._pdfs.move_to_end(key)
+                self.hits += 1
+            return pdf
+
+    def _store_pdf(self, key, pdf):
+        with self._lock:
+            self._pdfs[key] = pdf
+            self._pdfs.move_to_end(key)
+            while len(self._pdfs) > self.max_cached:
+                self._pdfs.popitem(last=False)
+
+    def _prune_jobs(self):
+        """Olvida trabajos terminados antiguos (llamar con el lock tomado)"""
+        now = time.time()
+        for job_id in list(self._jobs):
+            job = self._jobs[job_id]
+            finished = job['status'] in ('done', 'error')
+            expired = finished and now - job['finished_at'] > JOB_RETENTION_S
+            if expired or (finished and len(self._jobs) > MAX_JOBS):
+                del self._jobs[job_id]
+
+    def _new_job(self, key, status):
+        now = time.time()
+        job = {
+            'job_id': uuid.uuid4().hex,
+            'content_hash': key,
+            'status': status,
+            'created_at': now,
+            'finished_at': now if status == 'done' else None,
+            'error': None
+        }
+        self._prune_jobs()
+        self._jobs[job['job_id']] = job
+        return job
+
+    def _run(self, job_id, key, payload):
+        with self._lock:
+            self._jobs[job_id]['status'] = 'running'
+        try:
+            pdf = self.render(payload)
+        except Exception as e:
+            print(f"ERROR: Falló el trabajo de reporte {job_id}: {e}")
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is not None:
+                    job.update(status='error', error=str(e), finished_at=time.time())
+                self._inflight.pop(key, None)
+            return
+
+        self._store_pdf(key, pdf)
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.update(status='done', finished_at=time.time())
+            self._inflight.pop(key, None)
+
+    def submit(self, payload):
+        """
+        Encola el renderizado de un reporte y devuelve (estado del trabajo, cacheado).
+
+        Si el PDF ya está en caché el trabajo nace terminado; si hay un
+        trabajo idéntico en curso se devuelve ese mismo.
+        """
+        key = content_hash(payload)
+        if self._cached_pdf(key) is not None:
+            with self._lock:
+                return dict(self._new_job(key, 'done')), True
+
+        with self._lock:
+            job_id = self._inflight.get(key)
+            if job_id is not None and job_id in self._jobs:
+                return dict(self._jobs[job_id]), False
+            self.misses += 1
+            job = self._new_job(key, 'queued')
+            self._inflight[key] = job['job_id']
+
+        self._executor.submit(self._run, job['job_id'], key, payload)
+        return dict(job), False
+
+    def get(self, job_id):
+        """Estado de un trabajo, o None si no existe o ya se olvidó"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def result(self, job_id):
+        """Bytes del PDF de un trabajo terminado, o None si no está disponible"""
+        job = self.get(job_id)
+        if job is None or job['status'] != 'done':
+            return None
+        return self._cached_pdf(job['content_hash'])
+
+    def render_sync(self, payload):
+        """Renderiza en el hilo actual reutilizando la caché por contenido"""
+        key = content_hash(payload)
+        pdf = self._cached_pdf(key)
+        if pdf is not None:
+            return pdf
+        with self._lock:
+            self.misses += 1
+        pdf = self.render(payload)
+        self._store_pdf(key, pdf)
+        return pdf
+
+    def stats(self):
+        with self._lock:
+            statuses = {}
+            for job in self._jobs.values():
+                statuses[job['status']] = statuses.get(job['status'], 0) + 1
+            return {
+                'jobs': statuses,
+                'cached_pdfs': len(self._pdfs),
+                'cached_bytes': sum(len(pdf) for pdf in self._pdfs.values()),
+                'max_cached': self.max_cached,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+def create_manager_from_env(render):
+    """Crea el gestor según REPORT_JOBS_WORKERS / REPORT_CACHE_MAX_ENTRIES"""
+    return ReportJobManager(
+        render,
+        max_workers=int(os.environ.get('REPORT_JOBS_WORKERS', 2)),
+        max_cached=int(os.environ.get('REPORT_CACHE_MAX_ENTRIES', 32))
+    )
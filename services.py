@@ -0,0 +1,183 @@
+"""
+Configuración y servicios compartidos por los blueprints.
+
+Claves y URLs de las APIs externas, constantes físicas, límites de las
+rutas, pools de hilos y almacenes locales (caché geoespacial, catálogo de
+NEOs, nomenclátor, ráster de población y DEM). Se crean una vez por
+proceso al importar el módulo; app.create_app() solo registra las rutas.
+"""
+
+import os
+import concurrent.futures
+
+from geo_cache import create_cache_from_env
+from dem_store import DemTileStore
+from gazetteer import GazetteerStore
+from population_raster import PopulationRasterStore
+import neo_screening
+from neo_catalog import NeoCatalog
+
+
+# ============================================
+# API KEYS Y CONFIGURACIÓN
+# ============================================
+
+NASA_API_KEY = "btXo212rjwe6lTcZjPSonG2XUGa2C6OxIefooRua"
+NASA_NEO_API = "https://api.nasa.gov/neo/rest/v1/neo/browse"
+NASA_NEO_FEED = "https://api.nasa.gov/neo/rest/v1/feed"
+NASA_SBDB_API = "https://ssd-api.jpl.nasa.gov/sbdb.api"  # Small Body Database API
+NASA_PLANETARY_API = "https://api.nasa.gov/planetary/apod"  # Para datos adicionales
+
+# USGS API Configuration
+USGS_EARTHQUAKE_API = "https://earthquake.usgs.gov/fdsnws/event/1/query"
+USGS_ELEVATION_API = "https://nationalmap.gov/epqs/pqs.php"  # Para datos de elevación
+
+# NOAA API Configuration (colabora con NASA para datos oceanográficos)
+NOAA_TSUNAMI_API = "https://www.tsunami.gov/events.json"  # Datos de tsunami en tiempo real
+NOAA_SEA_LEVEL_API = "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter"  # Datos de nivel del mar
+NOAA_COASTAL_API = "https://coast.noaa.gov/digitalcoast/api"  # Datos costeros
+
+# NASA Earthdata Configuration
+NASA_EARTHDATA_API = "https://cmr.earthdata.nasa.gov/search/granules.json"  # Datos oceanográficos de la NASA
+
+# USGS APIs - No requieren API key (públicas)
+USGS_EARTHQUAKE_API = "https://earthquake.usgs.gov/fdsnws/event/1/query"
+USGS_COASTAL_API = "https://coast.noaa.gov/api/v1/"
+
+# Physical Constants
+G = 6.67430e-11
+EARTH_MASS = 5.972e24
+EARTH_RADIUS = 6371000
+EARTH_MU = 3.986004418e14
+GROUND_DENSITY = 2500
+GRAVITY = 9.81
+
+# Composiciones de asteroides
+ASTEROID_COMPOSITIONS = {
+    'rocky': {
+        'name': 'Rocoso (S-type)',
+        'density': 3000,  # kg/m³
+        'icon': '🪨',
+        'description': 'Silicatos y compuestos rocosos',
+        'fragmentation_resistance': 0.8,  # 0-1 (resistencia a fragmentación)
+        'thermal_emission': 1.0,  # Factor de radiación térmica
+        'atmospheric_penetration': 0.9,  # Probabilidad de llegar intacto
+        'metal_content': 0.1
+    },
+    'metallic': {
+        'name': 'Metálico (M-type)',
+        'density': 7800,  # Hierro-níquel
+        'icon': '⚙️',
+        'description': 'Hierro-níquel metálico',
+        'fragmentation_resistance': 1.0,
+        'thermal_emission': 1.2,  # Emite más calor por conductividad
+        'atmospheric_penetration': 1.0,  # Muy resistente
+        'metal_content': 0.9
+    },
+    'carbonaceous': {
+        'name': 'Carbonáceo (C-type)',
+        'density': 1500,  # Más ligero
+        'icon': '🌑',
+        'description': 'Compuestos orgánicos y carbono',
+        'fragmentation_resistance': 0.4,  # Más frágil
+        'thermal_emission': 0.8,
+        'atmospheric_penetration': 0.6,  # Puede fragmentarse en atmósfera
+        'metal_content': 0.05
+    },
+    'icy': {
+        'name': 'Helado (Cometa)',
+        'density': 600,  # Muy ligero
+        'icon': '❄️',
+        'description': 'Hielo de agua y compuestos volátiles',
+        'fragmentation_resistance': 0.2,  # Muy frágil
+        'thermal_emission': 1.5,  # Sublimación masiva
+        'atmospheric_penetration': 0.3,  # Probablemente se desintegre
+        'metal_content': 0.01
+    }
+}
+
+# Densidad por defecto
+ASTEROID_DENSITY = 3000
+
+# Modo Monte Carlo de incertidumbre
+MONTE_CARLO_DEFAULT_SAMPLES = 100000
+MONTE_CARLO_MAX_SAMPLES = 1000000
+MONTE_CARLO_PERCENTILES = [5, 25, 50, 75, 95]
+
+# Hilos de petición por proceso (gunicorn.conf.py y asgi.py)
+WEB_THREADS = int(os.environ.get('WEB_THREADS', 8))
+
+# Presupuesto total (s) para las consultas paralelas de contexto USGS
+USGS_CONTEXT_DEADLINE_S = 10
+# Cada simulación ocupa 2 hilos. Por defecto caben las de todos los hilos de
+# petición (y al menos 8 simulaciones con el servidor de desarrollo), para que
+# ninguna espere en cola gastando su plazo
+USGS_MAX_WORKERS = int(os.environ.get('USGS_MAX_WORKERS', 2 * max(WEB_THREADS, 8)))
+_USGS_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=USGS_MAX_WORKERS, thread_name_prefix='usgs')
+
+# Muestreo de elevación en paralelo (/api/usgs/elevation y análisis costero)
+ELEVATION_MAX_WORKERS = 8
+ELEVATION_MAX_POINTS = 200
+ELEVATION_DEADLINE_S = 10
+COAST_ELEVATION_DEADLINE_S = 5
+ELEVATION_SAMPLING_MODES = ('random', 'grid', 'ring')
+_ELEVATION_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=ELEVATION_MAX_WORKERS, thread_name_prefix='elevation'
+)
+
+# Especies GBIF: reinos en paralelo y páginas de ocurrencias en paralelo
+# hasta GBIF_OCCURRENCE_BUDGET (GBIF admite hasta 300 por página)
+GBIF_OCCURRENCE_BUDGET = int(os.environ.get('GBIF_OCCURRENCE_BUDGET', 1500))
+GBIF_PAGE_SIZE = 300
+GBIF_FACET_LIMIT = 200
+GBIF_MAX_SPECIES_LOOKUPS = 20  # Fichas /species/{key} por búsqueda para especies fuera de las páginas
+EIA_MAX_SPECIES = 150
+_GBIF_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix='gbif')
+_GBIF_PAGE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix='gbif-page')
+
+# Análisis completo (/api/analysis/full): pool de etapas y plazo total
+ANALYSIS_MAX_WORKERS = 8
+ANALYSIS_DEADLINE_S = 90
+_ANALYSIS_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=ANALYSIS_MAX_WORKERS, thread_name_prefix='analysis'
+)
+
+# Búsqueda de aproximaciones a la Tierra (/api/nasa/close-approaches)
+CLOSE_APPROACH_MAX_YEARS = 200
+
+# Puntos por trayectoria (/api/orbital-trajectory y /api/nasa/orbital-visualization)
+ORBITAL_TRAJECTORY_MAX_POINTS = 10000
+
+# Cribado del catálogo de NEOs en un pool de procesos (/api/neo/screening)
+NEO_CATALOG_PATH = os.environ.get(
+    'NEO_CATALOG_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'neo_catalog.csv')
+)
+SCREENING_MAX_YEARS = 100
+SCREENING_MAX_OBJECTS = 50000  # Objetos enviados en el cuerpo (el catálogo NEO completo ronda los 35.000)
+SCREENING_JOBS = neo_screening.ScreeningJobManager()
+
+# Catálogo local de NEOs en SQLite (ver neo_catalog.py): /api/neo/recent y la
+# SBDB se sirven desde aquí; sin red se arranca desde la instantánea incluida
+NEO_CATALOG = NeoCatalog()
+NEO_CATALOG.load_snapshot_if_empty()
+NEO_SYNC_INTERVAL_S = int(os.environ.get('NEO_SYNC_INTERVAL_S', 6 * 3600))
+NEO_SYNC_MAX_BROWSE_PAGES = 50
+_NEO_SYNC_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='neo-sync')
+
+# Nomenclátor local con índice espacial para /api/cities (ver gazetteer.py);
+# se carga en la primera consulta. Sin nomenclátor se usa Overpass
+GAZETTEER = GazetteerStore()
+
+# Ráster de población local para /api/population/worldpop (ver population_raster.py)
+POPULATION_RASTER = PopulationRasterStore()
+
+# Teselas DEM locales (ver dem_store.py); si no hay teselas se usan las APIs HTTP
+DEM_STORE = DemTileStore()
+
+# Caché compartida de consultas externas (ver geo_cache.py)
+GEO_CACHE = create_cache_from_env()
+
+# Límites del endpoint de simulación por lotes
+BATCH_MAX_SCENARIOS = 10000
+BATCH_MAX_LOCATIONS = 50  # Cada ubicación única implica una consulta USGS
+BATCH_CONTEXT_DEADLINE_S = 30  # Plazo total de las consultas USGS de un lote (< WEB_TIMEOUT)
@@ -0,0 +1,135 @@
+"""
+Clasificador de vulnerabilidad de especies compartido por los análisis de
+flora/fauna y el informe EIA.
+
+Antes cada ruta recorría sus propias listas de palabras clave con
+any(palabra in nombre ...) por especie, con listas duplicadas y distintas
+entre rutas. Ahora hay una sola tabla de palabras clave por categoría,
+compilada en una única expresión regular en forma de trie, y los
+rasgos de cada especie se memorizan por speciesKey (o por nombre y clase
+si no hay clave), así que reclasificar la misma especie es una consulta
+a un diccionario.
+"""
+
+import functools
+import re
+import threading
+from collections import namedtuple
+
+
+# Palabras clave por categoría (en el nombre científico o común, minúsculas)
+KEYWORDS = {
+    'tree': ('quercus', 'pinus', 'fagus', 'abies', 'cedrus', 'sequoia', 'roble', 'pino', 'haya', 'cedro'),
+    'shrub': ('shrub', 'arbusto', 'cistus', 'retama'),
+    'herbaceous': ('grass', 'herb', 'moss', 'lichen', 'hierba', 'musgo', 'líquen'),
+    'amphibian': ('frog', 'toad', 'salamander', 'rana', 'sapo', 'salamandra')
+}
+MOBILE_CLASSES = ('aves', 'mammalia')
+MAX_MEMOIZED_KEYS = 200000
+
+SpeciesTraits = namedtuple('SpeciesTraits', ['tree', 'shrub', 'herbaceous', 'amphibian', 'mobile', 'taxon_class'])
+
+
+def _trie_pattern(words):
+    """Expresión regular en forma de trie: una sola alternativa por prefijo común"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        optional = '' in node
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if optional else body
+
+    return build(trie)
+
+
+_KEYWORD_CATEGORY = {word: category for category, words in KEYWORDS.items() for word in words}
+# Se busca la coincidencia más larga en cada posición (trie voraz)
+_NAME_PATTERN = re.compile(_trie_pattern(_KEYWORD_CATEGORY))
+_MOBILE_PATTERN = re.compile(_trie_pattern(MOBILE_CLASSES))
+
+_by_species_key = {}
+_by_species_key_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=65536)
+def _traits(name, taxon_class):
+    categories = {_KEYWORD_CATEGORY[word] for word in _NAME_PATTERN.findall(name)}
+    return SpeciesTraits(
+        tree='tree' in categories,
+        shrub='shrub' in categories,
+        herbaceous='herbaceous' in categories,
+        amphibian='amphibian' in categories,
+        mobile=_MOBILE_PATTERN.search(taxon_class) is not None,
+        taxon_class=taxon_class
+    )
+
+
+def traits(species):
+    """Rasgos de una especie (dict de GBIF), memorizados por speciesKey"""
+    species_key = species.get('species_key')
+    if species_key is not None:
+        cached = _by_species_key.get(species_key)
+        if cached is not None:
+            return cached
+    result = _traits((species.get('name') or '').lower(), (species.get('class') or '').lower())
+    if species_key is not None:
+        with _by_species_key_lock:
+            if len(_by_species_key) >= MAX_MEMOIZED_KEYS:
+                _by_species_key.clear()
+            _by_species_key[species_key] = result
+    return result
+
+
+def vulnerability(species, kind):
+    """Nivel de vulnerabilidad y motivo (informe EIA)"""
+    species_traits = traits(species)
+    if kind == 'fauna':
+        tax = species_traits.taxon_class
+        if tax == 'amphibia':
+            return 'crítica', 'Anfibio — alta sensibilidad a cambios térmicos e hídricos'
+        if tax in ('insecta', 'arachnida'):
+            return 'alta',    'Invertebrado — escasa capacidad de evasión'
+        if tax == 'reptilia':
+            return 'alta',    'Reptil — termorregulación alterada post-impacto'
+        if tax == 'mammalia':
+            return 'media',   'Mamífero — cierta capacidad de huida'
+        if tax == 'aves':
+            return 'baja',    'Ave — alta movilidad, posibilidad de evasión'
+        return 'media', 'Especie sin clasificar'
+    if species_traits.tree:
+        return 'crítica', 'Árbol maduro — recuperación > 100 años'
+    if species_traits.shrub:
+        return 'alta',    'Arbusto — recuperación 20-50 años'
+    return 'media', 'Planta herbácea — recuperación 5-15 años'
+
+
+def flora_groups(flora_species):
+    """(árboles vulnerables, plantas resilientes) en el orden recibido"""
+    vulnerable, resilient = [], []
+    for species in flora_species:
+        species_traits = traits(species)
+        if species_traits.tree:
+            vulnerable.append(species)
+        elif species_traits.herbaceous:
+            resilient.append(species)
+    return vulnerable, resilient
+
+
+def fauna_groups(fauna_species):
+    """(animales vulnerables, animales móviles) en el orden recibido"""
+    vulnerable, mobile = [], []
+    for species in fauna_species:
+        species_traits = traits(species)
+        if species_traits.amphibian:
+            vulnerable.append(species)
+        elif species_traits.mobile:
+            mobile.append(species)
+    return vulnerable, mobile
@@ -0,0 +1,122 @@
+"""
+Ejecución de etapas de análisis como grafo de dependencias.
+
+Cada etapa declara de qué etapas depende; en cuanto todas sus dependencias
+terminan se lanza en el pool, de modo que las etapas independientes corren
+en paralelo. Los resultados se entregan en orden de finalización para poder
+transmitirlos al cliente a medida que llegan (SSE / NDJSON).
+"""
+
+import concurrent.futures
+import time
+
+
+class StageSkipped(Exception):
+    """La etapa decide no ejecutarse (p. ej. tsunami lejos de la costa)"""
+
+
+class Stage:
+    """Etapa del grafo: nombre, dependencias y función run(results) -> resultado"""
+
+    def __init__(self, name, run, depends_on=()):
+        self.name = name
+        self.run = run
+        self.depends_on = tuple(depends_on)
+
+
+def _timed(stage, results):
+    start = time.perf_counter()
+    try:
+        return stage.run(results), (time.perf_counter() - start) * 1000
+    except BaseException as e:
+        e.elapsed_ms = (time.perf_counter() - start) * 1000
+        raise
+
+
+def run_stages(stages, executor, deadline_s=None):
+    """
+    Ejecuta las etapas respetando dependencias y produce un evento por etapa.
+
+    Cada evento es un dict con stage, status ('ok', 'error', 'skipped' o
+    'timeout'), elapsed_ms y result/error. Si una etapa falla o se omite,
+    sus dependientes se marcan como 'skipped' sin ejecutarse.
+    """
+    by_name = {stage.name: stage for stage in stages}
+    for stage in stages:
+        missing = [dep for dep in stage.depends_on if dep not in by_name]
+        if missing:
+            raise ValueError(f"La etapa '{stage.name}' depende de etapas inexistentes: {missing}")
+
+    results = {}
+    finished = set()
+    failed = set()
+    pending = {stage.name for stage in stages}
+    running = {}
+    deadline = time.monotonic() + deadline_s if deadline_s is not None else None
+
+    def launch_ready():
+        events = []
+        for name in sorted(pending):
+            stage = by_name[name]
+            if any(dep in failed for dep in stage.depends_on):
+                pending.discard(name)
+                failed.add(name)
+                events.append({'stage': name, 'status': 'skipped', 'elapsed_ms': 0,
+                               'error': 'Dependencia no disponible'})
+            elif all(dep in finished for dep in stage.depends_on):
+                pending.discard(name)
+                # Cada etapa recibe solo los resultados de sus dependencias
+                inputs = {dep: results[dep] for dep in stage.depends_on}
+                running[executor.submit(_timed, stage, inputs)] = name
+        return events
+
+    # Resolver en bucle: omitir una etapa puede desbloquear otras omisiones
+    while True:
+        events = launch_ready()
+        yield from events
+        if not events:
+            break
+
+    while running:
+        timeout = None
+        if deadline is not None:
+            timeout = max(0.0, deadline - time.monotonic())
+        done, _ = concurrent.futures.wait(
+            running, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        if not done:
+            for future, name in running.items():
+                future.cancel()
+                failed.add(name)
+                yield {'stage': name, 'status': 'timeout', 'elapsed_ms': None,
+                       'error': f'Plazo de {deadline_s}s superado'}
+            running.clear()
+            break
+
+        for future in done:
+            name = running.pop(future)
+            try:
+                result, elapsed_ms = future.result()
+            except StageSkipped as e:
+                failed.add(name)
+                yield {'stage': name, 'status': 'skipped', 'elapsed_ms': round(e.elapsed_ms, 1),
+                       'error': str(e)}
+            except Exception as e:
+                failed.add(name)
+                yield {'stage': name, 'status': 'error',
+                       'elapsed_ms': round(getattr(e, 'elapsed_ms', 0), 1), 'error': str(e)}
+            else:
+                results[name] = result
+                finished.add(name)
+                yield {'stage': name, 'status': 'ok', 'elapsed_ms': round(elapsed_ms, 1),
+                       'result': result}
+
+        while True:
+            events = launch_ready()
+            yield from events
+            if not events:
+                break
+
+    # Etapas que nunca llegaron a lanzarse (tras un timeout)
+    for name in sorted(pending):
+        yield {'stage': name, 'status': 'skipped', 'elapsed_ms': 0, 'error': 'Dependencia no disponible'}
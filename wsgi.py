@@ -0,0 +1,13 @@
+"""
+Punto de entrada WSGI para producción.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+El número de procesos, hilos y el tipo de worker se configuran con
+variables de entorno (ver gunicorn.conf.py y DESPLIEGUE.md).
+"""
+
+from app import app
+
+
+application = app